@@ -5,6 +5,8 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import os
+import queue
+import threading
 
 
 import Hafta1Ogrendiklerimiz as hafta1
@@ -26,9 +28,42 @@ class ImageProcessingApp:
         self.processed_image = None
         self.current_file_path = None
         
+        # Arka planda süren görüntü yüklemesini tanımlayan numara
+        self.load_token = 0
+        
+        # Klasör tarayıcısı: küçük resim önbelleği ilk kullanımda oluşturulur
+        self.thumbnail_cache = None
+        self.browser_token = 0
+        
+        # Arka planda kaydetme: son kullanılan yol/profil ve iş parçacıklarından gelen sonuçlar
+        self.last_save_path = None
+        self.last_save_profile = ("png_hizli", False)
+        self.save_results = queue.Queue()
+        
+        # Kalıcı histogram paneli ilk kullanımda oluşturulur
+        self.histogram_panel = None
+        self.histogram_source = ("original", "rgb")
+        self.histogram_after_id = None
+        
+        # Kanal ayırma mozaiği için yeniden kullanılan tampon
+        self.channel_mosaic = None
+        
+        # Büyük küçültmeler için mip piramitleri: ölçekleme kaynağı ve ana tuvaller
+        self.scaling_mip = None
+        self.display_mips = {}
+        
+        # Seçiliyse filtreler yalnızca bu (x, y, genişlik, yükseklik) bölgesine uygulanır
+        self.processing_region = None
+        # Bölge işlemlerinin (kaynak, bölge, sonuç) tamponu: aynı kaynak ve bölgede
+        # yeniden kullanılır, böylece her denemede yalnızca bölge yazılır
+        self.region_result = None
+        
         self.create_menu()
         self.create_main_frame()
         self.create_status_bar()
+        
+        # Arka plan iş parçacıklarından gelen sonuçları ana döngüde işle
+        self.root.after(100, self.poll_save_results)
     
     def create_menu(self):
         """Ana menü çubuğunu oluşturur"""
@@ -36,6 +71,7 @@ class ImageProcessingApp:
         
         file_menu = tk.Menu(self.menu_bar, tearoff=0)
         file_menu.add_command(label="Aç", command=self.open_image)
+        file_menu.add_command(label="Klasör Aç", command=self.open_folder)
         file_menu.add_command(label="Kaydet", command=self.save_image)
         file_menu.add_command(label="Farklı Kaydet", command=self.save_image_as)
         file_menu.add_separator()
@@ -62,12 +98,15 @@ class ImageProcessingApp:
         threshold_menu = tk.Menu(enhancement_menu, tearoff=0)
         threshold_menu.add_command(label="Basit Eşikleme", command=self.apply_threshold)
         threshold_menu.add_command(label="Adaptif Eşikleme", command=self.apply_adaptive_threshold)
+        threshold_menu.add_command(label="Otsu Eşikleme", command=self.apply_otsu_threshold)
         enhancement_menu.add_cascade(label="Eşikleme", menu=threshold_menu)
         
 
         histogram_menu = tk.Menu(enhancement_menu, tearoff=0)
         histogram_menu.add_command(label="Histogram Göster", command=self.show_histogram)
         histogram_menu.add_command(label="Histogram Eşitleme", command=self.apply_histogram_equalization)
+        histogram_menu.add_command(label="Histogram Eşleştirme", command=self.apply_histogram_matching)
+        histogram_menu.add_command(label="CLAHE", command=self.apply_clahe)
         enhancement_menu.add_cascade(label="Histogram", menu=histogram_menu)
         
         self.menu_bar.add_cascade(label="Görüntü İyileştirme", menu=enhancement_menu)
@@ -85,6 +124,9 @@ class ImageProcessingApp:
         geometric_menu.add_command(label="Ölçekleme", command=self.apply_scaling)
         geometric_menu.add_command(label="Döndürme", command=self.apply_rotation)
         geometric_menu.add_command(label="Kırpma", command=self.apply_cropping)
+        geometric_menu.add_separator()
+        geometric_menu.add_command(label="İşlem Bölgesi Seç", command=self.select_processing_region)
+        geometric_menu.add_command(label="İşlem Bölgesini Kaldır", command=self.clear_processing_region)
         
         self.menu_bar.add_cascade(label="Geometrik Dönüşümler", menu=geometric_menu)
         
@@ -200,47 +242,325 @@ class ImageProcessingApp:
         file_path = filedialog.askopenfilename(
             title="Görüntü Dosyası Seç",
             filetypes=[
-                ("Görüntü Dosyaları", "*.jpg;*.jpeg;*.png;*.bmp;*.tif;*.tiff"),
+                ("Görüntü Dosyaları", "*.jpg;*.jpeg;*.png;*.bmp;*.tif;*.tiff;*.npy"),
                 ("JPEG Dosyaları", "*.jpg;*.jpeg"),
                 ("PNG Dosyaları", "*.png"),
                 ("BMP Dosyaları", "*.bmp"),
                 ("TIFF Dosyaları", "*.tif;*.tiff"),
+                ("NumPy Dizileri", "*.npy"),
                 ("Tüm Dosyalar", "*.*")
             ]
         )
         
         if file_path:
-            # Görüntüyü yükle ve göster
-            self.current_file_path = file_path
-            self.original_image = hafta1.goruntu_oku(file_path)
-            self.processed_image = self.original_image.copy()
-            self.display_images()
-            self.update_status(f"Görüntü yüklendi: {os.path.basename(file_path)}")
+            self.load_image(file_path)
+
+    def load_image(self, file_path):
+        """
+        Görüntüyü yükler. JPEG dosyalarında önce küçültülmüş önizleme hemen gösterilir,
+        tam çözünürlüklü görüntü arka planda çözülür ve hazır olduğunda işlemlere açılır.
+        """
+        self.current_file_path = file_path
+        file_name = os.path.basename(file_path)
+        
+        # Her yükleme yeni bir numara alır; eski yüklemelerin sonuçları yok sayılır
+        self.load_token += 1
+        
+        # Daha önce çözülmüş dosyalar önbellekten anında gelir, önizlemeye gerek yoktur
+        # 3 kanallı kaydedilmiş gri görüntüler tek düzlem olarak yüklenir; işlemler
+        # tek düzlemde çalışır, gösterim sırasında gri olarak çizilir
+        if hafta1.onbellekte_var(file_path, tek_duzlem=True):
+            self.set_loaded_image(hafta1.goruntu_oku(file_path, tek_duzlem=True), file_name)
+            return
+        
+        preview, scale = hafta1.onizleme_oku(
+            file_path,
+            max(self.original_canvas.winfo_width(), 1),
+            max(self.original_canvas.winfo_height(), 1)
+        )
+        if preview is None:
+            # Önizleme desteklenmiyorsa doğrudan tam çözünürlükte yükle
+            self.set_loaded_image(hafta1.goruntu_oku(file_path, tek_duzlem=True), file_name)
+            return
+        
+        # Tam görüntü hazır olana kadar işlemler çalıştırılmaz
+        self.original_image = None
+        self.processed_image = None
+        self.display_on_canvas(self.original_canvas, preview)
+        self.display_on_canvas(self.processed_canvas, preview)
+        self.update_status(f"Önizleme (1/{scale}) gösteriliyor, tam çözünürlük yükleniyor: {file_name}")
+        
+        future = hafta1.goruntu_oku_arka_plan(file_path, tek_duzlem=True)
+        self.poll_image_load(future, self.load_token, file_name)
+
+    def poll_image_load(self, future, token, file_name, interval=50):
+        """Arka planda okunan görüntünün hazır olup olmadığını arayüzü bloklamadan denetler"""
+        if token != self.load_token:
+            # Bu arada başka bir dosya açıldı
+            return
+        
+        if not future.done():
+            self.root.after(interval, lambda: self.poll_image_load(future, token, file_name, interval))
+            return
+        
+        self.set_loaded_image(future.result(), file_name)
+
+    def set_loaded_image(self, image, file_name):
+        """Yüklenen görüntüyü orijinal ve işlenmiş görüntü olarak ayarlar"""
+        if image is None:
+            messagebox.showerror("Hata", f"Görüntü yüklenemedi: {file_name}")
+            return
+        
+        # Önbellekten veya bellek eşlemeden gelen görüntü salt okunurdur. İşlemler yeni
+        # dizi ürettiği için işlenmiş görüntü başlangıçta aynı diziyi paylaşır; böylece
+        # eşlenmiş büyük dosyalar açılırken tamamı belleğe kopyalanmaz.
+        self.original_image = image
+        self.processed_image = self.original_image
+        self.processing_region = None
+        self.display_images()
+        
+        stats = hafta1.cozum_onbellegi.istatistikler()
+        plane_note = " [tek düzlem]" if len(image.shape) == 2 else ""
+        self.update_status(
+            f"Görüntü yüklendi: {file_name}{plane_note} "
+            f"(Önbellek: {stats['kayit']} görüntü, {stats['kullanilan_bayt'] / (1024 * 1024):.0f} MB, "
+            f"isabet %{stats['isabet_orani'] * 100:.0f})"
+        )
     
+    def open_folder(self):
+        """Klasör seçtirir ve içindeki görüntüleri küçük resimlerle listeleyen paneli gösterir"""
+        folder = filedialog.askdirectory(title="Görüntü Klasörü Seç")
+        if not folder:
+            return
+        
+        files = hafta1.klasordeki_goruntuler(folder)
+        if not files:
+            messagebox.showinfo("Bilgi", "Klasörde desteklenen görüntü bulunamadı.")
+            return
+        
+        if self.thumbnail_cache is None:
+            self.thumbnail_cache = hafta1.KucukResimOnbellegi()
+        
+        self.show_folder_browser(folder, files)
+
+    def show_folder_browser(self, folder, files, columns=2, cell_width=140, cell_height=160):
+        """Küçük resim ızgarasını parametre panelinde oluşturur; küçük resimler hazırlandıkça yerleşir"""
+        self.clear_params_panel()
+        ttk.Label(self.params_content, text=f"Klasör: {os.path.basename(folder)} ({len(files)} görüntü)",
+                  wraplength=280).pack(pady=5)
+        
+        browser_frame = ttk.Frame(self.params_content)
+        browser_frame.pack(fill=tk.BOTH, expand=True)
+        
+        canvas = tk.Canvas(browser_frame, width=columns * cell_width, bg="white", highlightthickness=0)
+        scrollbar = ttk.Scrollbar(browser_frame, orient=tk.VERTICAL, command=canvas.yview)
+        canvas.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        rows = (len(files) + columns - 1) // columns
+        canvas.configure(scrollregion=(0, 0, columns * cell_width, rows * cell_height))
+        canvas.bind("<MouseWheel>", lambda e: canvas.yview_scroll(int(-e.delta / 120), "units"))
+        
+        # Her dosya için önce yer tutucu öğeler çizilir; resim ve başlık hazır olunca güncellenir
+        items = {}
+        for index, path in enumerate(files):
+            x = (index % columns) * cell_width + cell_width // 2
+            y = (index // columns) * cell_height
+            image_item = canvas.create_image(x, y + 70, anchor=tk.CENTER)
+            text_item = canvas.create_text(x, y + 145, text=os.path.basename(path)[:20],
+                                           width=cell_width - 10, font=("TkDefaultFont", 8))
+            for item in (image_item, text_item):
+                canvas.tag_bind(item, "<Button-1>", lambda e, p=path: self.load_image(p))
+            items[path] = (image_item, text_item)
+        
+        # PhotoImage referansları çöp toplayıcıdan korunmak için saklanır
+        canvas.thumbnails = {}
+        
+        self.browser_token += 1
+        futures = hafta1.kucuk_resimleri_hazirla(files, self.thumbnail_cache)
+        self.poll_thumbnails(canvas, items, futures, self.browser_token)
+        self.update_status(f"Klasör açıldı: {folder}")
+
+    def poll_thumbnails(self, canvas, items, futures, token, interval=50):
+        """Tamamlanan küçük resimleri tuvale yerleştirir, kalanlar için tekrar planlar"""
+        if token != self.browser_token or not canvas.winfo_exists():
+            # Başka bir klasör açıldı veya panel kapatıldı
+            return
+        
+        from PIL import Image, ImageTk
+        pending = []
+        for path, future in futures:
+            if not future.done():
+                pending.append((path, future))
+                continue
+            
+            header, thumbnail = future.result()
+            image_item, text_item = items[path]
+            if thumbnail is not None:
+                tk_img = ImageTk.PhotoImage(Image.fromarray(cv2.cvtColor(thumbnail, cv2.COLOR_BGR2RGB)))
+                canvas.thumbnails[path] = tk_img
+                canvas.itemconfigure(image_item, image=tk_img)
+            if header is not None:
+                canvas.itemconfigure(
+                    text_item,
+                    text=f"{os.path.basename(path)[:20]}\n{header['genislik']}x{header['yukseklik']}, "
+                         f"{header['kanal']} kanal, {header['bicim']}"
+                )
+        
+        if pending:
+            self.root.after(interval, lambda: self.poll_thumbnails(canvas, items, pending, token, interval))
+        else:
+            # Hesaplanan içerik özetleri sonraki ziyaretler için diske yazılır
+            self.thumbnail_cache.indeksi_kaydet()
+
     def save_image(self):
-        """İşlenmiş görüntüyü kaydeder"""
+        """İşlenmiş görüntüyü son kullanılan yol ve profille arka planda kaydeder"""
         if self.processed_image is None:
             messagebox.showwarning("Uyarı", "Kaydedilecek işlenmiş görüntü yok!")
             return
         
-        # Mevcut dosya yolu varsa doğrudan kaydet, yoksa farklı kaydet
-        if self.current_file_path:
-            success = hafta1.goruntu_kaydet(self.processed_image)
-            if success:
-                self.update_status(f"Görüntü kaydedildi: {os.path.basename(self.current_file_path)}")
+        # Daha önce kaydedildiyse aynı yola yaz, yoksa farklı kaydet panelini göster
+        if self.last_save_path:
+            profile, progressive = self.last_save_profile
+            self.queue_save(self.last_save_path, profile, progressive)
         else:
             self.save_image_as()
     
     def save_image_as(self):
-        """İşlenmiş görüntüyü farklı kaydet"""
+        """Kaydetme profili seçimi ve profil ölçümü panelini gösterir"""
         if self.processed_image is None:
             messagebox.showwarning("Uyarı", "Kaydedilecek işlenmiş görüntü yok!")
             return
         
-        success = hafta1.goruntu_kaydet(self.processed_image)
-        if success:
-            self.update_status("Görüntü başarıyla kaydedildi.")
+        self.clear_params_panel()
+        ttk.Label(self.params_content, text="Farklı Kaydet").pack(pady=5)
+        
+        # Profil seçimi
+        ttk.Label(self.params_content, text="Kaydetme Profili:").pack(pady=(10, 5))
+        profiles = list(hafta1.KAYIT_PROFILLERI)
+        descriptions = [hafta1.KAYIT_PROFILLERI[p][2] for p in profiles]
+        profile_combo = ttk.Combobox(self.params_content, values=descriptions, state="readonly", width=32)
+        profile_combo.current(profiles.index(self.last_save_profile[0]))
+        profile_combo.pack(pady=5)
+        
+        progressive_var = tk.BooleanVar(value=self.last_save_profile[1])
+        ttk.Checkbutton(
+            self.params_content,
+            text="Aşamalı JPEG (progressive)",
+            variable=progressive_var
+        ).pack(pady=5)
+        
+        # Profil ölçüm tablosu
+        tree = ttk.Treeview(self.params_content, columns=("time", "size"), height=len(profiles))
+        tree.heading("#0", text="Profil")
+        tree.heading("time", text="Süre")
+        tree.heading("size", text="Boyut")
+        tree.column("#0", width=170)
+        tree.column("time", width=60, anchor=tk.E)
+        tree.column("size", width=70, anchor=tk.E)
+        for profile, description in zip(profiles, descriptions):
+            tree.insert("", tk.END, iid=profile, text=description, values=("-", "-"))
+        tree.pack(pady=5, fill=tk.X)
+        
+        ttk.Button(
+            self.params_content,
+            text="Profilleri Ölç",
+            command=lambda: self.measure_save_profiles(tree, progressive_var.get())
+        ).pack(pady=5)
+        
+        ttk.Button(
+            self.params_content,
+            text="Kaydet",
+            command=lambda: self.execute_save_as(profiles[profile_combo.current()], progressive_var.get())
+        ).pack(pady=10)
+
+    def measure_save_profiles(self, tree, progressive):
+        """Profillerin kodlama süresi ve boyutunu arka planda ölçer; sonuçlar tabloya yazılır"""
+        image = self.processed_image
+        # Arka plan iş parçacığı okurken bölge tamponu yerinde değişmesin
+        self.region_result = None
+        self.update_status("Kaydetme profilleri ölçülüyor...")
+        
+        def worker():
+            results = hafta1.profilleri_olc(image, progressive)
+            self.save_results.put(("measure", tree, results))
+        
+        threading.Thread(target=worker, daemon=True).start()
+
+    def execute_save_as(self, profile, progressive):
+        """Dosya yolunu sorar ve seçilen profille kaydetme işini kuyruğa ekler"""
+        extension = hafta1.KAYIT_PROFILLERI[profile][0]
+        file_path = filedialog.asksaveasfilename(
+            title="Görüntüyü Kaydet",
+            initialfile=os.path.splitext(os.path.basename(self.current_file_path or "goruntu"))[0] + extension,
+            filetypes=[
+                ("PNG Dosyaları", "*.png") if extension == ".png" else ("JPEG Dosyaları", "*.jpg;*.jpeg"),
+                ("Tüm Dosyalar", "*.*")
+            ],
+            defaultextension=extension
+        )
+        if not file_path:
+            return
+        
+        self.last_save_profile = (profile, progressive)
+        self.queue_save(file_path, profile, progressive)
+
+    def queue_save(self, file_path, profile, progressive):
+        """Görüntüyü arka plan kayıt kuyruğuna ekler; arayüz beklemeden devam eder"""
+        # İşlemler yeni dizi ürettiği için processed_image yerinde değişmez; kopya gerekmez.
+        # Yerinde yazılan bölge tamponu bırakılır; sonraki bölge işlemi yeni tampon açar
+        self.region_result = None
+        file_path = hafta1.goruntu_kaydet_arka_plan(
+            self.processed_image, file_path, profile, progressive,
+            geri_cagri=lambda result: self.save_results.put(("save", result))
+        )
+        if file_path:
+            self.last_save_path = file_path
+            self.update_status(f"Kaydediliyor: {os.path.basename(file_path)} ({hafta1.KAYIT_PROFILLERI[profile][2]})")
+
+    def poll_save_results(self, interval=100):
+        """Kaydetme ve ölçüm iş parçacıklarından gelen sonuçları arayüze yansıtır"""
+        try:
+            while True:
+                event = self.save_results.get_nowait()
+                if event[0] == "save":
+                    result = event[1]
+                    name = os.path.basename(result["dosya_yolu"])
+                    if result["basarili"]:
+                        self.update_status(
+                            f"Görüntü kaydedildi: {name} "
+                            f"({result['boyut'] / 1024:.0f} KB, kodlama {result['sure']:.2f} sn)"
+                        )
+                    else:
+                        messagebox.showerror("Hata", f"Görüntü kaydedilemedi: {name}\n{result['hata']}")
+                elif event[0] == "measure":
+                    _, tree, results = event
+                    if tree.winfo_exists():
+                        for row in results:
+                            prefix = "~" if row["tahmini"] else ""
+                            tree.item(row["profil"], values=(
+                                f"{prefix}{row['sure']:.2f} sn",
+                                f"{prefix}{row['boyut'] / 1024:.0f} KB"
+                            ))
+                    self.update_status("Kaydetme profilleri ölçüldü.")
+        except queue.Empty:
+            pass
+        
+        self.root.after(interval, self.poll_save_results)
     
+    def image_handle(self):
+        """
+        Orijinal görüntünün tutamacını döndürür. Görüntü değişmediği sürece aynı
+        tutamaç kullanılır; böylece gri, YCrCb gibi türetilmiş gösterimler art arda
+        uygulanan filtreler arasında yeniden hesaplanmaz.
+        """
+        handle = getattr(self, "_image_handle", None)
+        if handle is None or handle.goruntu is not self.original_image:
+            handle = hafta1.GoruntuTutamaci(self.original_image)
+            self._image_handle = handle
+        return handle
+
     def display_images(self):
         """Orijinal ve işlenmiş görüntüleri ekranda gösterir"""
         if self.original_image is not None:
@@ -250,6 +570,9 @@ class ImageProcessingApp:
         if self.processed_image is not None:
             # İşlenmiş görüntüyü göster
             self.display_on_canvas(self.processed_canvas, self.processed_image)
+        
+        # Açık histogram paneli varsa güncellemeyi planla
+        self.schedule_histogram_update()
     
     def display_on_canvas(self, canvas, image):
         """Verilen canvas'a görüntüyü gösterir"""
@@ -278,7 +601,15 @@ class ImageProcessingApp:
         new_h = int(h * scale)
         
         # Görüntüyü yeniden boyutlandır
-        if scale < 1.0:
+        if scale < 0.5 and canvas in (self.original_canvas, self.processed_canvas):
+            # Büyük görüntülerde ana tuvallerin yarıya küçültülmüş seviyeleri saklanır;
+            # aynı görüntü yeniden çizildiğinde küçültme hazır seviyeden başlar
+            mip = self.display_mips.get(str(canvas))
+            if mip is None or mip.goruntu is not image:
+                mip = hafta3.MipPiramidi(image)
+                self.display_mips[str(canvas)] = mip
+            display_img = mip.boyuta_getir((new_w, new_h), cv2.INTER_AREA)
+        elif scale < 1.0:
             display_img = cv2.resize(image, (new_w, new_h), interpolation=cv2.INTER_AREA)
         else:
             display_img = image.copy()
@@ -369,7 +700,8 @@ class ImageProcessingApp:
             return
         
         # Kanala göre işlem yap
-        self.processed_image = hafta1.kanali_goster(self.original_image.copy(), channel)
+        # Giriş salt okunur kullanılır, kopya gerekmez
+        self.processed_image = hafta1.kanali_goster(self.original_image, channel)
         self.display_images()
         
         # Kanal ismi için düzgün metin oluştur
@@ -401,23 +733,25 @@ class ImageProcessingApp:
         if self.original_image is None:
             return
         
-        # Kanallarına ayır
-        b, g, r = hafta1.kanallara_ayir(self.original_image.copy())
+        # Dört görünüm (R | G / B | Gri) tek bir mozaik tamponuna yazılır;
+        # tampon aynı boyuttaki sonraki çağrılarda yeniden kullanılır
+        mosaic = hafta1.kanal_mozaigi(self.original_image, self.channel_mosaic)
         
-        if b is None or g is None or r is None:
+        if mosaic is None:
             messagebox.showerror("Hata", "Kanallarına ayırma işlemi başarısız oldu!")
             return
-        
-        # Her kanalı ayrı pencerede göster
-        # RGB görüntü için kanalları birleştir (Mavi kanal)
-        blue_image = hafta1.kanali_goster(self.original_image.copy(), "blue")
-        # Yeşil kanal
-        green_image = hafta1.kanali_goster(self.original_image.copy(), "green")
-        # Kırmızı kanal
-        red_image = hafta1.kanali_goster(self.original_image.copy(), "red")
-        
-        # İşlenmiş görüntüye mavi kanalı ata (önizleme olarak)
-        self.processed_image = blue_image
+        self.channel_mosaic = mosaic
+        
+        # Mozaiğin çeyrekleri kopyalanmadan görünüm olarak kullanılır
+        h, w = self.original_image.shape[:2]
+        red_image = mosaic[:h, :w]
+        green_image = mosaic[:h, w:]
+        blue_image = mosaic[h:, :w]
+        gray_image = mosaic[h:, w:]
+        
+        # İşlenmiş görüntüye mavi kanalı ata (önizleme olarak).
+        # Mozaik tamponu yeniden kullanıldığı için burada kopya alınır.
+        self.processed_image = blue_image.copy()
         self.display_images()
         
         # Yeni pencereler açarak diğer kanalları göster
@@ -463,7 +797,7 @@ class ImageProcessingApp:
         # Gri kanalı göster
         gray_canvas = tk.Canvas(gray_frame, bg="lightgray", width=250, height=250)
         gray_canvas.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-        self.display_on_canvas(gray_canvas, hafta1.griye_cevir(self.original_image.copy()))
+        self.display_on_canvas(gray_canvas, gray_image)
         
         # Grid hücrelerini eşit boyutlandır
         channels_frame.grid_columnconfigure(0, weight=1)
@@ -586,6 +920,23 @@ class ImageProcessingApp:
         beta_slider.pack(side=tk.LEFT, padx=5)
         ttk.Label(beta_frame, textvariable=beta_var).pack(side=tk.LEFT)
         
+        # Kontrast germe için uçlardan kırpılacak piksel yüzdesi
+        clip_frame = ttk.Frame(self.params_content)
+        clip_frame.pack(pady=10, fill=tk.X)
+        ttk.Label(clip_frame, text="Germe Kırpma (%):").pack(side=tk.LEFT)
+        clip_var = tk.DoubleVar(value=0.0)
+        clip_slider = ttk.Scale(
+            clip_frame,
+            from_=0.0,
+            to=10.0,
+            variable=clip_var,
+            orient=tk.HORIZONTAL,
+            length=150,
+            command=lambda val: clip_var.set(round(float(val), 1))
+        )
+        clip_slider.pack(side=tk.LEFT, padx=5)
+        ttk.Label(clip_frame, textvariable=clip_var).pack(side=tk.LEFT)
+        
         # Histogram gösterme seçeneği
         show_histogram_var = tk.BooleanVar(value=False)
         ttk.Checkbutton(
@@ -602,11 +953,12 @@ class ImageProcessingApp:
                 mode_var.get(),
                 alpha_var.get(),
                 beta_var.get(),
-                show_histogram_var.get()
+                show_histogram_var.get(),
+                clip_var.get()
             )
         ).pack(pady=10)
 
-    def execute_contrast_adjustment(self, mode, alpha, beta, show_histogram):
+    def execute_contrast_adjustment(self, mode, alpha, beta, show_histogram, clip_percent=0.0):
         """Kontrast ayarlama işlemini uygular"""
         if self.original_image is None:
             return
@@ -615,8 +967,13 @@ class ImageProcessingApp:
             self.processed_image = hafta2.kontrast_ayarla(self.original_image.copy(), alpha, beta)
             operation_name = f"Kontrast ayarlandı (Alpha: {alpha:.2f}, Beta: {beta})"
         else:  # kontrast_germe
-            self.processed_image = hafta2.kontrast_germe(self.original_image.copy(), show_histogram)
-            operation_name = "Kontrast germe uygulandı"
+            self.processed_image = hafta2.kontrast_germe(
+                self.original_image.copy(),
+                show_histogram,
+                alt_yuzde=clip_percent,
+                ust_yuzde=100 - clip_percent
+            )
+            operation_name = f"Kontrast germe uygulandı (Kırpma: %{clip_percent:.1f})"
         
         self.display_images()
         self.update_status(operation_name)
@@ -714,19 +1071,33 @@ class ImageProcessingApp:
         
         # Adaptif yöntem seçimi
         ttk.Label(self.params_content, text="Adaptif Yöntem:").pack(pady=(10, 5))
-        method_var = tk.IntVar(value=cv2.ADAPTIVE_THRESH_GAUSSIAN_C)
+        method_var = tk.StringVar(value="gaussian")
         ttk.Radiobutton(
             self.params_content,
             text="Gaussian",
             variable=method_var,
-            value=cv2.ADAPTIVE_THRESH_GAUSSIAN_C
+            value="gaussian"
         ).pack(anchor=tk.W, pady=2)
         
         ttk.Radiobutton(
             self.params_content,
             text="Mean",
             variable=method_var,
-            value=cv2.ADAPTIVE_THRESH_MEAN_C
+            value="mean"
+        ).pack(anchor=tk.W, pady=2)
+        
+        ttk.Radiobutton(
+            self.params_content,
+            text="Sauvola (Doküman)",
+            variable=method_var,
+            value="sauvola"
+        ).pack(anchor=tk.W, pady=2)
+        
+        ttk.Radiobutton(
+            self.params_content,
+            text="Niblack",
+            variable=method_var,
+            value="niblack"
         ).pack(anchor=tk.W, pady=2)
         
         # Eşik tipi seçimi
@@ -793,19 +1164,80 @@ class ImageProcessingApp:
         if self.original_image is None:
             return
         
+        # Radyo düğmesindeki yöntem adını hafta2'nin beklediği değere çevir
+        method = {
+            "gaussian": cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
+            "mean": cv2.ADAPTIVE_THRESH_MEAN_C
+        }.get(method, method)
+        
         # Adaptif eşikleme uygula
-        self.processed_image = hafta2.adaptif_esikleme(
-            self.original_image.copy(), 
-            max_deger=max_value,
-            adaptif_yontem=method,
-            esik_tipi=thresh_type,
-            blok_boyutu=block_size,
-            c=c
+        self.processed_image = self.run_operation(
+            lambda img: hafta2.adaptif_esikleme(
+                hafta1.gri_al(img),
+                max_deger=max_value,
+                adaptif_yontem=method,
+                esik_tipi=thresh_type,
+                blok_boyutu=block_size,
+                c=c
+            ),
+            block_size // 2
         )
         
         self.display_images()
         self.update_status(f"Adaptif eşikleme uygulandı (Blok: {block_size}, C: {c}).")
 
+    def apply_otsu_threshold(self):
+        """Otsu eşikleme panelini gösterir"""
+        if self.original_image is None:
+            messagebox.showwarning("Uyarı", "Önce bir görüntü yükleyin!")
+            return
+        
+        # İşlem parametreleri panelini oluştur
+        self.clear_params_panel()
+        ttk.Label(self.params_content, text="Otsu Eşikleme").pack(pady=5)
+        
+        # Sınıf sayısı (2 = klasik Otsu, daha fazlası çok seviyeli Otsu)
+        ttk.Label(self.params_content, text="Sınıf Sayısı:").pack(pady=(10, 0))
+        class_count_var = tk.IntVar(value=2)
+        class_count_slider = ttk.Scale(
+            self.params_content,
+            from_=2,
+            to=5,
+            variable=class_count_var,
+            orient=tk.HORIZONTAL,
+            length=200,
+            command=lambda val: class_count_var.set(int(float(val)))
+        )
+        class_count_slider.pack(pady=(0, 10))
+        ttk.Label(self.params_content, textvariable=class_count_var).pack()
+        
+        # Uygula butonu
+        ttk.Button(
+            self.params_content,
+            text="Uygula",
+            command=lambda: self.execute_otsu_threshold(class_count_var.get())
+        ).pack(pady=10)
+
+    def execute_otsu_threshold(self, class_count):
+        """Otsu eşikleme işlemini uygular"""
+        if self.original_image is None:
+            return
+        
+        if class_count <= 2:
+            threshold, result = hafta2.otsu_esikleme(self.original_image)
+            thresholds_text = str(threshold)
+        else:
+            thresholds, result = hafta2.coklu_otsu_esikleme(self.original_image, class_count)
+            thresholds_text = ", ".join(str(t) for t in thresholds) if thresholds else "-"
+        
+        if result is None:
+            messagebox.showerror("Hata", "Otsu eşikleme işlemi başarısız oldu!")
+            return
+        
+        self.processed_image = result
+        self.display_images()
+        self.update_status(f"Otsu eşikleme uygulandı (Eşikler: {thresholds_text}).")
+
     def show_histogram(self):
         """Histogram gösterir"""
         if self.original_image is None:
@@ -858,66 +1290,116 @@ class ImageProcessingApp:
         ).pack(pady=10)
 
     def execute_show_histogram(self, image_choice, image_type):
-        """Histogram gösterme işlemini uygular"""
+        """Seçilen görüntünün histogramını kalıcı histogram panelinde gösterir"""
         if self.original_image is None:
             return
         
-        # Seçilen görüntüyü al
-        if image_choice == "original":
-            image = self.original_image.copy()
-            image_name = "Orijinal"
-        else:
-            if self.processed_image is None:
-                messagebox.showwarning("Uyarı", "İşlenmiş görüntü bulunmuyor!")
-                return
-            image = self.processed_image.copy()
-            image_name = "İşlenmiş"
-        
-        # Gri tonlama seçimi yapıldıysa ve görüntü renkli ise, gri tonlamaya çevir
-        if image_type == "gray" and len(image.shape) == 3:
-            image = hafta1.griye_cevir(image)
-        
-        # Histogram penceresini oluştur
-        histogram_window = tk.Toplevel(self.root)
-        histogram_window.title(f"{image_name} Görüntü Histogramı")
-        histogram_window.geometry("800x600")
+        if image_choice == "processed" and self.processed_image is None:
+            messagebox.showwarning("Uyarı", "İşlenmiş görüntü bulunmuyor!")
+            return
         
-        # Matplotlib figür oluştur
-        fig = plt.Figure(figsize=(7, 5), dpi=100)
+        self.histogram_source = (image_choice, image_type)
         
-        # Histogramı hesapla ve çiz
-        if len(image.shape) == 3 and image_type == "rgb":  # Renkli görüntü ve RGB histogram seçildi
-            color = ('b', 'g', 'r')
-            labels = ('Mavi', 'Yeşil', 'Kırmızı')
-            
-            ax = fig.add_subplot(111)
-            for i, (col, label) in enumerate(zip(color, labels)):
-                hist = cv2.calcHist([image], [i], None, [256], [0, 256])
-                ax.plot(hist, color=col, label=label)
-            
-            ax.set_title(f"{image_name} Görüntü RGB Histogramı")
-            ax.legend()
-        else:  # Gri tonlamalı görüntü
-            # Gri tonlamalı histogram
-            if len(image.shape) == 3:
-                # Eğer hala RGB ise ve gri tonlama istendiyse
-                image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-            
-            ax = fig.add_subplot(111)
-            hist = cv2.calcHist([image], [0], None, [256], [0, 256])
-            ax.plot(hist, color='black')
-            ax.set_title(f"{image_name} Görüntü Gri Tonlama Histogramı")
+        # Panel yoksa bir kez oluştur, gizlenmişse yeniden göster
+        if self.histogram_panel is None:
+            self.create_histogram_panel()
+        elif not self.histogram_panel["frame"].winfo_ismapped():
+            self.histogram_panel["frame"].pack(side=tk.BOTTOM, fill=tk.X, padx=5, pady=5)
         
+        self.update_histogram_panel()
+        image_name = "Orijinal" if image_choice == "original" else "İşlenmiş"
+        self.update_status(f"{image_name} görüntünün histogramı gösteriliyor.")
+
+    def create_histogram_panel(self):
+        """Görüntülerin altına yerleşen, çizgileri yerinde güncellenen histogram panelini oluşturur"""
+        frame = ttk.LabelFrame(self.image_frame, text="Histogram")
+        frame.pack(side=tk.BOTTOM, fill=tk.X, padx=5, pady=5)
+        
+        ttk.Button(frame, text="Kapat", command=self.hide_histogram_panel).pack(side=tk.RIGHT, anchor=tk.N, padx=5, pady=5)
+        
+        # Figür ve çizgiler yalnızca bir kez oluşturulur; sonraki güncellemeler set_ydata ile yapılır
+        fig = plt.Figure(figsize=(7, 2.2), dpi=100)
+        ax = fig.add_subplot(111)
+        x = np.arange(256)
+        zeros = np.zeros(256)
+        lines = {
+            "b": ax.plot(x, zeros, color='b', label='Mavi')[0],
+            "g": ax.plot(x, zeros, color='g', label='Yeşil')[0],
+            "r": ax.plot(x, zeros, color='r', label='Kırmızı')[0],
+            "gray": ax.plot(x, zeros, color='black', label='Gri')[0],
+        }
         ax.set_xlabel("Piksel Değeri")
         ax.set_ylabel("Frekans")
         ax.set_xlim([0, 256])
+        fig.tight_layout()
         
-        # Figürü canvas'a yerleştir
-        canvas = FigureCanvasTkAgg(fig, master=histogram_window)
-        canvas.draw()
-        canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=1)
+        canvas = FigureCanvasTkAgg(fig, master=frame)
+        canvas.get_tk_widget().pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
-        self.update_status(f"{image_name} görüntünün histogramı gösteriliyor.")
+        self.histogram_panel = {"frame": frame, "figure": fig, "axes": ax, "lines": lines, "canvas": canvas}
+
+    def hide_histogram_panel(self):
+        """Histogram panelini gizler; figür yeniden kullanılmak üzere saklanır"""
+        if self.histogram_panel is None:
+            return
+        
+        if self.histogram_after_id is not None:
+            self.root.after_cancel(self.histogram_after_id)
+            self.histogram_after_id = None
+        self.histogram_panel["frame"].pack_forget()
+
+    def schedule_histogram_update(self, delay=100):
+        """
+        Histogram panelinin güncellenmesini planlar. Bekleyen bir güncelleme varsa
+        yenisi eklenmez; art arda gelen değişiklikler tek bir çizimde birleşir.
+        """
+        if self.histogram_panel is None or not self.histogram_panel["frame"].winfo_ismapped():
+            return
+        
+        if self.histogram_after_id is None:
+            self.histogram_after_id = self.root.after(delay, self.update_histogram_panel)
+
+    def update_histogram_panel(self):
+        """Panelde seçili görüntünün histogramını mevcut çizgiler üzerinden günceller"""
+        self.histogram_after_id = None
+        if self.histogram_panel is None:
+            return
+        
+        image_choice, image_type = self.histogram_source
+        if image_choice == "processed" and self.processed_image is not None:
+            image = self.processed_image
+            image_name = "İşlenmiş"
+        else:
+            image = self.original_image
+            image_name = "Orijinal"
+        
+        if image is None:
+            return
+        
+        # Görüntü yalnızca okunur; kopyalanmadığı için histogram önbelleği kullanılabilir
+        if image_type == "gray" and len(image.shape) == 3:
+            image = hafta1.griye_cevir(image)
+        
+        lines = self.histogram_panel["lines"]
+        ax = self.histogram_panel["axes"]
+        hist_bilgisi = hafta2.histogram_bilgisi(image)
+        
+        if len(image.shape) == 3:
+            for i, key in enumerate(("b", "g", "r")):
+                lines[key].set_ydata(hist_bilgisi.calc_hist(i).ravel())
+                lines[key].set_visible(True)
+            lines["gray"].set_visible(False)
+            ax.set_title(f"{image_name} Görüntü RGB Histogramı", fontsize=9)
+        else:
+            lines["gray"].set_ydata(hist_bilgisi.calc_hist(0).ravel())
+            lines["gray"].set_visible(True)
+            for key in ("b", "g", "r"):
+                lines[key].set_visible(False)
+            ax.set_title(f"{image_name} Görüntü Gri Tonlama Histogramı", fontsize=9)
+        
+        # Yalnızca y ekseni sınırı yenilenir; figür yeniden kurulmaz
+        ax.set_ylim(0, max(float(hist_bilgisi.hist.max()), 1.0) * 1.05)
+        self.histogram_panel["canvas"].draw_idle()
 
     def apply_histogram_equalization(self):
         """Histogram eşitleme panelini gösterir"""
@@ -955,6 +1437,151 @@ class ImageProcessingApp:
         self.display_images()
         self.update_status("Histogram eşitleme uygulandı.")
 
+    def apply_histogram_matching(self):
+        """Histogram eşleştirme panelini gösterir"""
+        if self.original_image is None:
+            messagebox.showwarning("Uyarı", "Önce bir görüntü yükleyin!")
+            return
+        
+        # İşlem parametreleri panelini oluştur
+        self.clear_params_panel()
+        ttk.Label(self.params_content, text="Histogram Eşleştirme").pack(pady=5)
+        
+        # Seçilen referansın adı
+        reference_var = tk.StringVar(value="Referans seçilmedi")
+        ttk.Label(self.params_content, textvariable=reference_var, wraplength=200).pack(pady=5)
+        
+        ttk.Button(
+            self.params_content,
+            text="Referans Görüntü Seç",
+            command=lambda: self.select_histogram_reference(reference_var)
+        ).pack(pady=5)
+        
+        # Uygula butonu
+        ttk.Button(
+            self.params_content,
+            text="Uygula",
+            command=self.execute_histogram_matching
+        ).pack(pady=10)
+
+    def select_histogram_reference(self, reference_var):
+        """Histogram eşleştirme için referans görüntüyü seçer ve hedef CDF'yi hazırlar"""
+        file_path = filedialog.askopenfilename(
+            title="Referans Görüntü Seç",
+            filetypes=[
+                ("Görüntü Dosyaları", "*.jpg;*.jpeg;*.png;*.bmp;*.tif;*.tiff"),
+                ("Tüm Dosyalar", "*.*")
+            ]
+        )
+        
+        if not file_path:
+            return
+        
+        # Ana görüntü gibi gri ve sahte renkli dosyalar tek düzlem olarak yüklenir
+        reference = hafta1.goruntu_oku(file_path, tek_duzlem=True)
+        if reference is None:
+            messagebox.showerror("Hata", "Referans görüntü yüklenemedi!")
+            return
+        
+        # Hedef dağılım bir kez hazırlanır, sonraki eşleştirmelerde yeniden kullanılır
+        self.histogram_reference_cdf = hafta2.hedef_cdf_hazirla(reference)
+        reference_var.set(f"Referans: {os.path.basename(file_path)}")
+
+    def execute_histogram_matching(self):
+        """Histogram eşleştirme işlemini uygular"""
+        if self.original_image is None:
+            return
+        
+        if getattr(self, "histogram_reference_cdf", None) is None:
+            messagebox.showwarning("Uyarı", "Önce bir referans görüntü seçin!")
+            return
+        
+        result = hafta2.histogram_eslestirme(self.original_image, hedef_cdf=self.histogram_reference_cdf)
+        if result is None:
+            messagebox.showerror("Hata", "Histogram eşleştirme işlemi başarısız oldu!")
+            return
+        
+        self.processed_image = result
+        self.display_images()
+        self.update_status("Histogram eşleştirme uygulandı.")
+
+    def apply_clahe(self):
+        """CLAHE (kontrast sınırlı uyarlamalı histogram eşitleme) panelini gösterir"""
+        if self.original_image is None:
+            messagebox.showwarning("Uyarı", "Önce bir görüntü yükleyin!")
+            return
+        
+        # İşlem parametreleri panelini oluştur
+        self.clear_params_panel()
+        ttk.Label(self.params_content, text="CLAHE").pack(pady=5)
+        
+        # Izgara boyutu (karo sayısı)
+        grid_frame = ttk.Frame(self.params_content)
+        grid_frame.pack(pady=10, fill=tk.X)
+        ttk.Label(grid_frame, text="Izgara:").pack(side=tk.LEFT)
+        grid_var = tk.IntVar(value=8)
+        ttk.Spinbox(
+            grid_frame,
+            from_=2,
+            to=32,
+            textvariable=grid_var,
+            width=5
+        ).pack(side=tk.LEFT, padx=5)
+        
+        # Kırpma limiti; sürükleme sırasında önizleme kısa bir gecikmeyle güncellenir
+        clip_frame = ttk.Frame(self.params_content)
+        clip_frame.pack(pady=10, fill=tk.X)
+        ttk.Label(clip_frame, text="Kırpma Limiti:").pack(side=tk.LEFT)
+        clip_var = tk.DoubleVar(value=2.0)
+        
+        def on_clip_change(val):
+            clip_var.set(round(float(val), 1))
+            self.schedule_clahe(clip_var, grid_var)
+        
+        clip_slider = ttk.Scale(
+            clip_frame,
+            from_=0.5,
+            to=10.0,
+            variable=clip_var,
+            orient=tk.HORIZONTAL,
+            length=150,
+            command=on_clip_change
+        )
+        clip_slider.pack(side=tk.LEFT, padx=5)
+        ttk.Label(clip_frame, textvariable=clip_var).pack(side=tk.LEFT)
+        
+        # Uygula butonu
+        ttk.Button(
+            self.params_content,
+            text="Uygula",
+            command=lambda: self.execute_clahe(clip_var.get(), grid_var.get())
+        ).pack(pady=10)
+
+    def schedule_clahe(self, clip_var, grid_var, delay=150):
+        """Kaydırıcı hareket ettikçe CLAHE önizlemesini erteler; yalnızca son değer işlenir"""
+        pending = getattr(self, "clahe_after_id", None)
+        if pending is not None:
+            self.root.after_cancel(pending)
+        self.clahe_after_id = self.root.after(
+            delay, lambda: self.execute_clahe(clip_var.get(), grid_var.get())
+        )
+
+    def execute_clahe(self, clip_limit, grid_size):
+        """CLAHE işlemini uygular"""
+        self.clahe_after_id = None
+        if self.original_image is None:
+            return
+        
+        # Aynı görüntü ve ızgarada karo histogramları yeniden kullanılır
+        result = hafta2.clahe_uygula(self.original_image, clip_limit, (grid_size, grid_size))
+        if result is None:
+            messagebox.showerror("Hata", "CLAHE işlemi başarısız oldu!")
+            return
+        
+        self.processed_image = result
+        self.display_images()
+        self.update_status(f"CLAHE uygulandı. Kırpma limiti: {clip_limit}, Izgara: {grid_size}x{grid_size}")
+
     # Hafta 3 - Geometrik Dönüşümler
     def apply_translation(self):
         """Taşıma işlemi panelini gösterir"""
@@ -1228,14 +1855,22 @@ class ImageProcessingApp:
             variable=manual_var
         ).pack(pady=5)
         
+        # Büyük oranlı küçültmeler için piramit seçeneği
+        pyramid_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(
+            self.params_content,
+            text="Piramit ile Küçült (0.5'ten küçük ölçekler)",
+            variable=pyramid_var
+        ).pack(pady=5)
+        
         # Uygula butonu
         ttk.Button(
             self.params_content,
             text="Uygula",
-            command=lambda: self.execute_scaling(scale_var.get(), interp_var.get(), manual_var.get())
+            command=lambda: self.execute_scaling(scale_var.get(), interp_var.get(), manual_var.get(), pyramid_var.get())
         ).pack(pady=10)
 
-    def execute_scaling(self, scale_factor, interpolation_method, use_manual):
+    def execute_scaling(self, scale_factor, interpolation_method, use_manual, use_pyramid=False):
         """Ölçekleme işlemini uygular"""
         if self.original_image is None:
             return
@@ -1251,6 +1886,14 @@ class ImageProcessingApp:
             except Exception as e:
                 messagebox.showerror("Hata", f"Manuel ölçekleme başarısız: {str(e)}")
                 return
+        elif use_pyramid and scale_factor < 1.0:
+            # Aynı kaynağın önceki küçültmelerinde hesaplanan seviyeler yeniden kullanılır
+            if self.scaling_mip is None or self.scaling_mip.goruntu is not self.original_image:
+                self.scaling_mip = hafta3.MipPiramidi(self.original_image)
+            self.processed_image = hafta3.olcekleme(
+                self.original_image, scale_factor, interpolation_method, piramit=True, mip=self.scaling_mip
+            )
+            operation_name = f"Piramit ile ölçekleme: {scale_factor:.2f}"
         else:
             # Normal ölçekleme
             self.processed_image = hafta3.olcekleme(self.original_image.copy(), scale_factor, interpolation_method)
@@ -1478,6 +2121,51 @@ class ImageProcessingApp:
             except Exception as e:
                 messagebox.showerror("Hata", f"Kırpma işlemi başarısız: {str(e)}")
 
+    def select_processing_region(self):
+        """Fare ile işlem bölgesini seçer; sonraki filtreler yalnızca bu bölgeye uygulanır"""
+        if self.original_image is None:
+            messagebox.showwarning("Uyarı", "Önce bir görüntü yükleyin!")
+            return
+        
+        self.update_status("Fare ile işlem bölgesini seçin. Bekleniyor...")
+        region = hafta3.mouse_ile_bolge_sec(self.original_image)
+        
+        if region is None:
+            self.update_status("İşlem bölgesi seçimi iptal edildi.")
+            return
+        
+        self.processing_region = region
+        x, y, width, height = region
+        self.update_status(f"İşlem bölgesi seçildi: X:{x}, Y:{y}, G:{width}, Y:{height}. Filtreler yalnızca bu bölgeye uygulanacak.")
+
+    def clear_processing_region(self):
+        """İşlem bölgesini kaldırır; filtreler yeniden tüm görüntüye uygulanır"""
+        self.processing_region = None
+        self.update_status("İşlem bölgesi kaldırıldı. Filtreler tüm görüntüye uygulanacak.")
+
+    def run_operation(self, operation, halo=0):
+        """
+        İşlemi tüm görüntüye veya seçili işlem bölgesine uygular. Bölge seçiliyse
+        yalnızca bölge ile çevresindeki halo (çekirdek yarıçapı) işlenir ve sonuç
+        tam görüntünün kopyasına yapıştırılır. Normalize eden kenar filtreleri bölge
+        ve halo içindeki değer aralığını kullanır.
+        """
+        if self.processing_region is None:
+            return operation(self.image_handle())
+        
+        # Aynı görüntü ve bölgede önceki sonuç tamponu hedef olarak verilir; bölge dışı
+        # zaten orijinalin kopyası olduğu için tam görüntü yeniden kopyalanmaz
+        target = None
+        if self.region_result is not None:
+            source, region, result = self.region_result
+            if source is self.original_image and region == self.processing_region:
+                target = result
+        
+        result = hafta3.bolgede_uygula(self.original_image, self.processing_region, operation, hale=halo, hedef=target)
+        if result is not None:
+            self.region_result = (self.original_image, self.processing_region, result)
+        return result
+
     # Hafta 4 - Perspektif Dönüşümler
     def apply_perspective_correction(self):
         """Perspektif düzeltme işlemi panelini gösterir"""
@@ -1769,10 +2457,10 @@ class ImageProcessingApp:
         
         # Manuel mod veya OpenCV kullanımı seçimine göre işlev çağır
         if manual_mode:
-            self.processed_image = hafta5.ortalama_filtre_manuel(self.original_image.copy(), kernel_size)
+            self.processed_image = self.run_operation(lambda img: hafta5.ortalama_filtre_manuel(img, kernel_size), kernel_size // 2)
             filter_name = "Manuel ortalama filtre"
         else:
-            self.processed_image = hafta5.ortalama_filtre(self.original_image.copy(), kernel_size)
+            self.processed_image = self.run_operation(lambda img: hafta5.ortalama_filtre(img, kernel_size), kernel_size // 2)
             filter_name = "Ortalama filtre"
         
         self.display_images()
@@ -1828,10 +2516,10 @@ class ImageProcessingApp:
         
         # Manuel mod veya OpenCV kullanımı seçimine göre işlev çağır
         if manual_mode:
-            self.processed_image = hafta5.medyan_filtre_manuel(self.original_image.copy(), kernel_size)
+            self.processed_image = self.run_operation(lambda img: hafta5.medyan_filtre_manuel(img, kernel_size), kernel_size // 2)
             filter_name = "Manuel medyan filtre"
         else:
-            self.processed_image = hafta5.medyan_filtre(self.original_image.copy(), kernel_size)
+            self.processed_image = self.run_operation(lambda img: hafta5.medyan_filtre(img, kernel_size), kernel_size // 2)
             filter_name = "Medyan filtre"
         
         self.display_images()
@@ -1901,10 +2589,10 @@ class ImageProcessingApp:
         
         # Manuel mod veya OpenCV kullanımı seçimine göre işlev çağır
         if manual_mode:
-            self.processed_image = hafta5.gauss_filtre_manuel(self.original_image.copy(), kernel_size, sigma)
+            self.processed_image = self.run_operation(lambda img: hafta5.gauss_filtre_manuel(img, kernel_size, sigma), kernel_size // 2)
             filter_name = "Manuel Gauss filtresi"
         else:
-            self.processed_image = hafta5.gauss_filtre(self.original_image.copy(), kernel_size, sigma)
+            self.processed_image = self.run_operation(lambda img: hafta5.gauss_filtre(img, kernel_size, sigma), kernel_size // 2)
             filter_name = "Gauss filtresi"
         
         self.display_images()
@@ -1940,7 +2628,7 @@ class ImageProcessingApp:
         self.update_status("Konservatif filtre uygulanıyor...")
         
         # Filtreyi uygula
-        self.processed_image = hafta5.konservatif_filtre(self.original_image.copy())
+        self.processed_image = self.run_operation(hafta5.konservatif_filtre, 1)
         
         self.display_images()
         self.update_status("Konservatif filtre uygulandı.")
@@ -1989,7 +2677,7 @@ class ImageProcessingApp:
         self.update_status("Crimmins speckle filtresi uygulanıyor...")
         
         # Filtreyi uygula
-        self.processed_image = hafta5.crimmins_speckle_filtre(self.original_image.copy(), iterations)
+        self.processed_image = self.run_operation(lambda img: hafta5.crimmins_speckle_filtre(img, iterations), iterations)
         
         self.display_images()
         self.update_status(f"Crimmins speckle filtresi uygulandı (İterasyon: {iterations}).")
@@ -2024,7 +2712,7 @@ class ImageProcessingApp:
         self.update_status("Fourier dönüşümü hesaplanıyor...")
         
         # Fourier dönüşümünü göster
-        hafta5.goruntu_fft_goster(self.original_image.copy())
+        hafta5.goruntu_fft_goster(self.image_handle())
         
         self.update_status("Fourier dönüşümü gösterildi.")
 
@@ -2072,7 +2760,7 @@ class ImageProcessingApp:
         self.update_status("Alçak geçiren filtre uygulanıyor...")
         
         # Filtreyi uygula
-        self.processed_image = hafta5.alcak_geciren_filtre(self.original_image.copy(), cutoff_frequency)
+        self.processed_image = hafta5.alcak_geciren_filtre(self.image_handle(), cutoff_frequency)
         
         self.display_images()
         self.update_status(f"Alçak geçiren filtre uygulandı (Kesme frekansı: {cutoff_frequency}).")
@@ -2121,7 +2809,7 @@ class ImageProcessingApp:
         self.update_status("Yüksek geçiren filtre uygulanıyor...")
         
         # Filtreyi uygula
-        self.processed_image = hafta5.yuksek_geciren_filtre(self.original_image.copy(), cutoff_frequency)
+        self.processed_image = hafta5.yuksek_geciren_filtre(self.image_handle(), cutoff_frequency)
         
         self.display_images()
         self.update_status(f"Yüksek geçiren filtre uygulandı (Kesme frekansı: {cutoff_frequency}).")
@@ -2190,7 +2878,7 @@ class ImageProcessingApp:
         
         # Filtreyi uygula
         self.processed_image = hafta5.band_geciren_filtre(
-            self.original_image.copy(), 
+            self.image_handle(), 
             ic_yaricap=inner_radius, 
             dis_yaricap=outer_radius
         )
@@ -2262,7 +2950,7 @@ class ImageProcessingApp:
         
         # Filtreyi uygula
         self.processed_image = hafta5.band_durduran_filtre(
-            self.original_image.copy(), 
+            self.image_handle(), 
             ic_yaricap=inner_radius, 
             dis_yaricap=outer_radius
         )
@@ -2405,7 +3093,7 @@ class ImageProcessingApp:
         if filter_type == "low_pass":
             self.update_status(f"Butterworth alçak geçiren filtre uygulanıyor (Kesme: {cutoff_frequency}, Derece: {order})...")
             self.processed_image = hafta5.butterworth_alcak_geciren_filtre(
-                self.original_image.copy(), 
+                self.image_handle(), 
                 kesme_frekansi=cutoff_frequency, 
                 derece=order
             )
@@ -2414,7 +3102,7 @@ class ImageProcessingApp:
         elif filter_type == "high_pass":
             self.update_status(f"Butterworth yüksek geçiren filtre uygulanıyor (Kesme: {cutoff_frequency}, Derece: {order})...")
             self.processed_image = hafta5.butterworth_yuksek_geciren_filtre(
-                self.original_image.copy(), 
+                self.image_handle(), 
                 kesme_frekansi=cutoff_frequency, 
                 derece=order
             )
@@ -2431,7 +3119,7 @@ class ImageProcessingApp:
                 
             self.update_status(f"Butterworth band geçiren filtre uygulanıyor...")
             self.processed_image = hafta5.butterworth_band_geciren_filtre(
-                self.original_image.copy(), 
+                self.image_handle(), 
                 ic_yaricap=inner_radius, 
                 dis_yaricap=outer_radius, 
                 derece=order
@@ -2449,7 +3137,7 @@ class ImageProcessingApp:
                 
             self.update_status(f"Butterworth band durduran filtre uygulanıyor...")
             self.processed_image = hafta5.butterworth_band_durduran_filtre(
-                self.original_image.copy(), 
+                self.image_handle(), 
                 ic_yaricap=inner_radius, 
                 dis_yaricap=outer_radius, 
                 derece=order
@@ -2516,7 +3204,7 @@ class ImageProcessingApp:
         if filter_type == "low_pass":
             self.update_status(f"Gaussian alçak geçiren filtre uygulanıyor (Kesme: {cutoff_frequency})...")
             self.processed_image = hafta5.gaussian_alcak_geciren_filtre(
-                self.original_image.copy(), 
+                self.image_handle(), 
                 kesme_frekansi=cutoff_frequency
             )
             filter_name = "Gaussian alçak geçiren filtre"
@@ -2524,7 +3212,7 @@ class ImageProcessingApp:
         elif filter_type == "high_pass":
             self.update_status(f"Gaussian yüksek geçiren filtre uygulanıyor (Kesme: {cutoff_frequency})...")
             self.processed_image = hafta5.gaussian_yuksek_geciren_filtre(
-                self.original_image.copy(), 
+                self.image_handle(), 
                 kesme_frekansi=cutoff_frequency
             )
             filter_name = "Gaussian yüksek geçiren filtre"
@@ -2624,7 +3312,7 @@ class ImageProcessingApp:
         
         # Filtreyi uygula
         self.processed_image = hafta5.homomorfik_filtre(
-            self.original_image.copy(), 
+            self.image_handle(), 
             d0=cutoff_frequency, 
             h_l=low_gain, 
             h_h=high_gain, 
@@ -2703,19 +3391,16 @@ class ImageProcessingApp:
         # Yükleme durumunu güncelle
         self.update_status("Sobel kenar bulma uygulanıyor...")
         
+        # Seçilen moda göre çıktıyı belirle (x, y veya toplam)
+        output_index, mode_name = {
+            "x": (0, "X yönü"),
+            "y": (1, "Y yönü")
+        }.get(output_mode, (2, "toplam (magnitude)"))
+        
         # Sobel kenar bulma işlemini uygula
-        sobel_x, sobel_y, sobel_magnitude = hafta6.sobel_kenar_bulma(self.original_image.copy(), kernel_size)
-        
-        # Seçilen moda göre çıktıyı belirle
-        if output_mode == "x":
-            self.processed_image = sobel_x
-            mode_name = "X yönü"
-        elif output_mode == "y":
-            self.processed_image = sobel_y
-            mode_name = "Y yönü"
-        else:  # magnitude
-            self.processed_image = sobel_magnitude
-            mode_name = "toplam (magnitude)"
+        self.processed_image = self.run_operation(
+            lambda img: hafta6.sobel_kenar_bulma(img, kernel_size)[output_index], kernel_size // 2
+        )
         
         self.display_images()
         self.update_status(f"Sobel kenar bulma uygulandı (Çekirdek: {kernel_size}x{kernel_size}, Mod: {mode_name}).")
@@ -2773,19 +3458,16 @@ class ImageProcessingApp:
         # Yükleme durumunu güncelle
         self.update_status("Prewitt kenar bulma uygulanıyor...")
         
+        # Seçilen moda göre çıktıyı belirle (x, y veya toplam)
+        output_index, mode_name = {
+            "x": (0, "X yönü"),
+            "y": (1, "Y yönü")
+        }.get(output_mode, (2, "toplam (magnitude)"))
+        
         # Prewitt kenar bulma işlemini uygula
-        prewitt_x, prewitt_y, prewitt_magnitude = hafta6.prewitt_kenar_bulma(self.original_image.copy())
-        
-        # Seçilen moda göre çıktıyı belirle
-        if output_mode == "x":
-            self.processed_image = prewitt_x
-            mode_name = "X yönü"
-        elif output_mode == "y":
-            self.processed_image = prewitt_y
-            mode_name = "Y yönü"
-        else:  # magnitude
-            self.processed_image = prewitt_magnitude
-            mode_name = "toplam (magnitude)"
+        self.processed_image = self.run_operation(
+            lambda img: hafta6.prewitt_kenar_bulma(img)[output_index], 1
+        )
         
         self.display_images()
         self.update_status(f"Prewitt kenar bulma uygulandı (Mod: {mode_name}).")
@@ -2843,19 +3525,16 @@ class ImageProcessingApp:
         # Yükleme durumunu güncelle
         self.update_status("Roberts Cross kenar bulma uygulanıyor...")
         
+        # Seçilen moda göre çıktıyı belirle (x, y veya toplam)
+        output_index, mode_name = {
+            "x": (0, "X yönü"),
+            "y": (1, "Y yönü")
+        }.get(output_mode, (2, "toplam (magnitude)"))
+        
         # Roberts Cross kenar bulma işlemini uygula
-        roberts_x, roberts_y, roberts_magnitude = hafta6.roberts_cross_kenar_bulma(self.original_image.copy())
-        
-        # Seçilen moda göre çıktıyı belirle
-        if output_mode == "x":
-            self.processed_image = roberts_x
-            mode_name = "X yönü"
-        elif output_mode == "y":
-            self.processed_image = roberts_y
-            mode_name = "Y yönü"
-        else:  # magnitude
-            self.processed_image = roberts_magnitude
-            mode_name = "toplam (magnitude)"
+        self.processed_image = self.run_operation(
+            lambda img: hafta6.roberts_cross_kenar_bulma(img)[output_index], 1
+        )
         
         self.display_images()
         self.update_status(f"Roberts Cross kenar bulma uygulandı (Mod: {mode_name}).")
@@ -2890,7 +3569,7 @@ class ImageProcessingApp:
         self.update_status("Compass kenar bulma uygulanıyor...")
         
         # Compass kenar bulma işlemini uygula
-        self.processed_image = hafta6.compass_kenar_bulma(self.original_image.copy())
+        self.processed_image = self.run_operation(hafta6.compass_kenar_bulma, 1)
         
         self.display_images()
         self.update_status("Compass kenar bulma uygulandı.")
@@ -2974,12 +3653,15 @@ class ImageProcessingApp:
         # Yükleme durumunu güncelle
         self.update_status("Canny kenar bulma uygulanıyor...")
         
-        # Canny kenar bulma işlemini uygula
-        self.processed_image = hafta6.canny_kenar_bulma(
-            self.original_image.copy(),
-            alt_esik=min_threshold,
-            ust_esik=max_threshold,
-            aperture_size=aperture_size
+        # Canny kenar bulma işlemini uygula (histerezis takibi bölge kenarında küçük farklar verebilir)
+        self.processed_image = self.run_operation(
+            lambda img: hafta6.canny_kenar_bulma(
+                img,
+                alt_esik=min_threshold,
+                ust_esik=max_threshold,
+                aperture_size=aperture_size
+            ),
+            aperture_size + 2
         )
         
         self.display_images()
@@ -3043,18 +3725,20 @@ class ImageProcessingApp:
         # Yükleme durumunu güncelle
         self.update_status("Laplace kenar bulma uygulanıyor...")
         
-        # Görüntüyü gri tonlamaya çevir
-        if len(self.original_image.shape) > 2:
-            gray = cv2.cvtColor(self.original_image.copy(), cv2.COLOR_BGR2GRAY)
-        else:
-            gray = self.original_image.copy()
-        
-        # Gürültü azaltmak için önce Gaussian filtre uygula
-        if sigma > 0:
-            gray = cv2.GaussianBlur(gray, (kernel_size, kernel_size), sigma)
+        def operation(img):
+            # Görüntüyü gri tonlamaya çevir
+            gray = hafta1.gri_al(img)
+            
+            # Gürültü azaltmak için önce Gaussian filtre uygula
+            if sigma > 0:
+                gray = cv2.GaussianBlur(gray, (kernel_size, kernel_size), sigma)
+            
+            # Laplace filtresini uygula
+            return hafta6.laplace_kenar_bulma(gray, ksize=kernel_size)
         
-        # Laplace filtresini uygula
-        self.processed_image = hafta6.laplace_kenar_bulma(gray, ksize=kernel_size)
+        # Bulanıklaştırma ve Laplace çekirdeklerinin yarıçapları toplanır
+        halo = kernel_size // 2 * (2 if sigma > 0 else 1)
+        self.processed_image = self.run_operation(operation, halo)
         self.display_images()
         self.update_status(f"Laplace kenar algılama filtresi uygulandı (kernel={kernel_size})")
 
@@ -3127,14 +3811,11 @@ class ImageProcessingApp:
         if self.original_image is None:
             return
         
-        # Görüntüyü gri tonlamaya çevir
-        if len(self.original_image.shape) > 2:
-            gray = cv2.cvtColor(self.original_image.copy(), cv2.COLOR_BGR2GRAY)
-        else:
-            gray = self.original_image.copy()
-        
-        # Gabor filtresini uygula
-        self.processed_image = hafta6.gabor_filtre(gray, kernel_size=kernel_size, sigma=sigma, theta=theta)
+        # Gri tonlamaya çevirip Gabor filtresini uygula
+        self.processed_image = self.run_operation(
+            lambda img: hafta6.gabor_filtre(hafta1.gri_al(img), kernel_size=kernel_size, sigma=sigma, theta=theta),
+            kernel_size // 2
+        )
         self.display_images()
         self.update_status(f"Gabor filtresi uygulandı (kernel={kernel_size}, sigma={sigma:.1f}, theta={theta:.2f})")
 
@@ -3211,9 +3892,9 @@ class ImageProcessingApp:
         self.update_status("Hough çizgi algılama uygulanıyor...")
         
         # Hough çizgi algılama işlemini uygula
-        lines = hafta7.hough_cizgi_algilama(self.original_image.copy(), kernel_size, theta, threshold)
+        lines = hafta7.hough_cizgi_algilama(self.image_handle(), kernel_size, theta, threshold)
         
-        self.processed_image = hafta7.cizgi_cizdir(self.original_image.copy(), lines)
+        self.processed_image = hafta7.cizgi_cizdir(self.image_handle(), lines)
         self.display_images()
         self.update_status("Hough çizgi algılama işlemi tamamlandı.")
 
@@ -3276,9 +3957,9 @@ class ImageProcessingApp:
         self.update_status("Hough çember algılama uygulanıyor...")
         
         # Hough çember algılama işlemini uygula
-        circles = hafta7.hough_cember_algilama(self.original_image.copy(), kernel_size, threshold)
+        circles = hafta7.hough_cember_algilama(self.image_handle(), kernel_size, threshold)
         
-        self.processed_image = hafta7.cember_cizdir(self.original_image.copy(), circles)
+        self.processed_image = hafta7.cember_cizdir(self.image_handle(), circles)
         self.display_images()
         self.update_status("Hough çember algılama işlemi tamamlandı.")
 
@@ -3328,7 +4009,7 @@ class ImageProcessingApp:
         
         # K-means segmentasyon işlemini uygula
         _, self.processed_image, _ = hafta6.kmeans_segmentation(
-            self.original_image.copy(),
+            self.image_handle(),
             k=k
         )
         
@@ -3381,7 +4062,7 @@ class ImageProcessingApp:
         self.update_status("Aşındırma uygulanıyor...")
         
         # Aşındırma işlemini uygula
-        self.processed_image = hafta7.erosion(self.original_image.copy(), kernel_size)
+        self.processed_image = self.run_operation(lambda img: hafta7.erode_islem(img, kernel_size=kernel_size), kernel_size // 2)
         
         self.display_images()
         self.update_status(f"Aşındırma uygulandı (Çekirdek: {kernel_size}x{kernel_size}).")
@@ -3431,7 +4112,7 @@ class ImageProcessingApp:
         self.update_status("Genişletme uygulanıyor...")
         
         # Genişletme işlemini uygula
-        self.processed_image = hafta7.dilation(self.original_image.copy(), kernel_size)
+        self.processed_image = self.run_operation(lambda img: hafta7.dilate_islem(img, kernel_size=kernel_size), kernel_size // 2)
         
         self.display_images()
         self.update_status(f"Genişletme uygulandı (Çekirdek: {kernel_size}x{kernel_size}).")
@@ -3481,7 +4162,7 @@ class ImageProcessingApp:
         self.update_status("Açma işlemi uygulanıyor...")
         
         # Açma işlemini uygula
-        self.processed_image = hafta7.opening_islem(self.original_image.copy(), kernel_size=kernel_size)
+        self.processed_image = self.run_operation(lambda img: hafta7.opening_islem(img, kernel_size=kernel_size), kernel_size // 2 * 2)
         self.display_images()
         self.update_status(f"Açma işlemi tamamlandı (kernel boyutu: {kernel_size}x{kernel_size}).")
 
@@ -3530,7 +4211,7 @@ class ImageProcessingApp:
         self.update_status("Kapama işlemi uygulanıyor...")
         
         # Kapama işlemini uygula
-        self.processed_image = hafta7.closing_islem(self.original_image.copy(), kernel_size=kernel_size)
+        self.processed_image = self.run_operation(lambda img: hafta7.closing_islem(img, kernel_size=kernel_size), kernel_size // 2 * 2)
         self.display_images()
         self.update_status(f"Kapama işlemi tamamlandı (kernel boyutu: {kernel_size}x{kernel_size}).")
 
@@ -26,6 +26,24 @@ class ImageProcessingApp:
         self.processed_image = None
         self.current_file_path = None
         
+        # Kalıcı histogram paneli ilk kullanımda oluşturulur
+        self.histogram_panel = None
+        self.histogram_source = ("original", "rgb")
+        self.histogram_after_id = None
+        
+        # Kanal ayırma mozaiği için yeniden kullanılan tampon
+        self.channel_mosaic = None
+        
+        # Büyük küçültmeler için mip piramitleri: ölçekleme kaynağı ve ana tuvaller
+        self.scaling_mip = None
+        self.display_mips = {}
+        
+        # Seçiliyse filtreler yalnızca bu (x, y, genişlik, yükseklik) bölgesine uygulanır
+        self.processing_region = None
+        # Son bölge işleminin sonucu; üzerinde çalışılan görüntü buysa sonraki bölge
+        # işlemi tam görüntüyü kopyalamadan yerinde yapılır
+        self.region_result = None
+        
         # Ana pencere düzeni
         self.create_menu()
         self.create_main_frame()
@@ -93,7 +111,11 @@ class ImageProcessingApp:
         geometric_menu.add_command(label="Eğme (Shearing)", command=self.apply_shearing)
         geometric_menu.add_command(label="Ölçekleme", command=self.apply_scaling)
         geometric_menu.add_command(label="Döndürme", command=self.apply_rotation)
+        geometric_menu.add_command(label="Birleşik Dönüşüm", command=self.apply_combined_transform)
         geometric_menu.add_command(label="Kırpma", command=self.apply_cropping)
+        geometric_menu.add_separator()
+        geometric_menu.add_command(label="İşlem Bölgesi Seç", command=self.select_processing_region)
+        geometric_menu.add_command(label="İşlem Bölgesini Kaldır", command=self.clear_processing_region)
         
         self.menu_bar.add_cascade(label="Geometrik Dönüşümler", menu=geometric_menu)
         
@@ -239,10 +261,16 @@ class ImageProcessingApp:
         if file_path:
             # Görüntüyü yükle ve göster
             self.current_file_path = file_path
-            self.original_image = hafta1.goruntu_oku(file_path)
+            # 3 kanallı kaydedilmiş gri görüntüler tek düzlem olarak yüklenir
+            self.original_image = hafta1.goruntu_oku(file_path, tek_duzlem=True)
+            if self.original_image is None:
+                messagebox.showerror("Hata", f"Görüntü yüklenemedi: {os.path.basename(file_path)}")
+                return
             self.processed_image = self.original_image.copy()
+            self.processing_region = None
             self.display_images()
-            self.update_status(f"Görüntü yüklendi: {os.path.basename(file_path)}")
+            plane_note = " [tek düzlem]" if len(self.original_image.shape) == 2 else ""
+            self.update_status(f"Görüntü yüklendi: {os.path.basename(file_path)}{plane_note}")
     
     def save_image(self):
         """İşlenmiş görüntüyü kaydeder"""
@@ -277,6 +305,9 @@ class ImageProcessingApp:
         if self.processed_image is not None:
             # İşlenmiş görüntüyü göster
             self.display_on_canvas(self.processed_canvas, self.processed_image)
+        
+        # Açık histogram paneli varsa güncellemeyi planla
+        self.schedule_histogram_update()
     
     def display_on_canvas(self, canvas, image):
         """Verilen canvas'a görüntüyü gösterir"""
@@ -305,7 +336,15 @@ class ImageProcessingApp:
         new_h = int(h * scale)
         
         # Görüntüyü yeniden boyutlandır
-        if scale < 1.0:
+        if scale < 0.5 and canvas in (self.original_canvas, self.processed_canvas):
+            # Büyük görüntülerde ana tuvallerin yarıya küçültülmüş seviyeleri saklanır;
+            # aynı görüntü yeniden çizildiğinde küçültme hazır seviyeden başlar
+            mip = self.display_mips.get(str(canvas))
+            if mip is None or mip.goruntu is not image:
+                mip = hafta3.MipPiramidi(image)
+                self.display_mips[str(canvas)] = mip
+            display_img = mip.boyuta_getir((new_w, new_h), cv2.INTER_AREA)
+        elif scale < 1.0:
             display_img = cv2.resize(image, (new_w, new_h), interpolation=cv2.INTER_AREA)
         else:
             display_img = image.copy()
@@ -396,7 +435,8 @@ class ImageProcessingApp:
             return
         
         # Kanala göre işlem yap
-        self.processed_image = hafta1.kanali_goster(self.working_image.copy(), channel)
+        # Giriş salt okunur kullanılır, kopya gerekmez
+        self.processed_image = hafta1.kanali_goster(self.working_image, channel)
         self.display_images()
         
         # Kanal ismi için düzgün metin oluştur
@@ -428,23 +468,25 @@ class ImageProcessingApp:
         if self.original_image is None:
             return
         
-        # Kanallarına ayır
-        b, g, r = hafta1.kanallara_ayir(self.working_image.copy())
+        # Dört görünüm (R | G / B | Gri) tek bir mozaik tamponuna yazılır;
+        # tampon aynı boyuttaki sonraki çağrılarda yeniden kullanılır
+        mosaic = hafta1.kanal_mozaigi(self.working_handle, self.channel_mosaic)
         
-        if b is None or g is None or r is None:
+        if mosaic is None:
             messagebox.showerror("Hata", "Kanallarına ayırma işlemi başarısız oldu!")
             return
+        self.channel_mosaic = mosaic
         
-        # Her kanalı ayrı pencerede göster
-        # RGB görüntü için kanalları birleştir (Mavi kanal)
-        blue_image = hafta1.kanali_goster(self.working_image.copy(), "blue")
-        # Yeşil kanal
-        green_image = hafta1.kanali_goster(self.working_image.copy(), "green")
-        # Kırmızı kanal
-        red_image = hafta1.kanali_goster(self.working_image.copy(), "red")
+        # Mozaiğin çeyrekleri kopyalanmadan görünüm olarak kullanılır
+        h, w = mosaic.shape[0] // 2, mosaic.shape[1] // 2
+        red_image = mosaic[:h, :w]
+        green_image = mosaic[:h, w:]
+        blue_image = mosaic[h:, :w]
+        gray_image = mosaic[h:, w:]
         
-        # İşlenmiş görüntüye mavi kanalı ata (önizleme olarak)
-        self.processed_image = blue_image
+        # İşlenmiş görüntüye mavi kanalı ata (önizleme olarak).
+        # Mozaik tamponu yeniden kullanıldığı için burada kopya alınır.
+        self.processed_image = blue_image.copy()
         self.display_images()
         
         # Yeni pencereler açarak diğer kanalları göster
@@ -490,7 +532,7 @@ class ImageProcessingApp:
         # Gri kanalı göster
         gray_canvas = tk.Canvas(gray_frame, bg="lightgray", width=250, height=250)
         gray_canvas.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-        self.display_on_canvas(gray_canvas, hafta1.griye_cevir(self.working_image.copy()))
+        self.display_on_canvas(gray_canvas, gray_image)
         
         # Grid hücrelerini eşit boyutlandır
         channels_frame.grid_columnconfigure(0, weight=1)
@@ -821,13 +863,16 @@ class ImageProcessingApp:
             return
         
         # Adaptif eşikleme uygula
-        self.processed_image = hafta2.adaptif_esikleme(
-            self.working_image.copy(), 
-            max_deger=max_value,
-            adaptif_yontem=method,
-            esik_tipi=thresh_type,
-            blok_boyutu=block_size,
-            c=c
+        self.processed_image = self.run_operation(
+            lambda img: hafta2.adaptif_esikleme(
+                hafta1.gri_al(img),
+                max_deger=max_value,
+                adaptif_yontem=method,
+                esik_tipi=thresh_type,
+                blok_boyutu=block_size,
+                c=c
+            ),
+            block_size // 2
         )
         
         self.display_images()
@@ -885,66 +930,117 @@ class ImageProcessingApp:
         ).pack(pady=10)
 
     def execute_show_histogram(self, image_choice, image_type):
-        """Histogram gösterme işlemini uygular"""
+        """Seçilen görüntünün histogramını kalıcı histogram panelinde gösterir"""
         if self.original_image is None:
             return
         
-        # Seçilen görüntüyü al
-        if image_choice == "original":
-            image = self.working_image.copy()
-            image_name = "Orijinal"
-        else:
-            if self.processed_image is None:
-                messagebox.showwarning("Uyarı", "İşlenmiş görüntü bulunmuyor!")
-                return
-            image = self.processed_image.copy()
-            image_name = "İşlenmiş"
-        
-        # Gri tonlama seçimi yapıldıysa ve görüntü renkli ise, gri tonlamaya çevir
-        if image_type == "gray" and len(image.shape) == 3:
-            image = hafta1.griye_cevir(image)
-        
-        # Histogram penceresini oluştur
-        histogram_window = tk.Toplevel(self.root)
-        histogram_window.title(f"{image_name} Görüntü Histogramı")
-        histogram_window.geometry("800x600")
+        if image_choice == "processed" and self.processed_image is None:
+            messagebox.showwarning("Uyarı", "İşlenmiş görüntü bulunmuyor!")
+            return
         
-        # Matplotlib figür oluştur
-        fig = plt.Figure(figsize=(7, 5), dpi=100)
+        self.histogram_source = (image_choice, image_type)
         
-        # Histogramı hesapla ve çiz
-        if len(image.shape) == 3 and image_type == "rgb":  # Renkli görüntü ve RGB histogram seçildi
-            color = ('b', 'g', 'r')
-            labels = ('Mavi', 'Yeşil', 'Kırmızı')
-            
-            ax = fig.add_subplot(111)
-            for i, (col, label) in enumerate(zip(color, labels)):
-                hist = cv2.calcHist([image], [i], None, [256], [0, 256])
-                ax.plot(hist, color=col, label=label)
-            
-            ax.set_title(f"{image_name} Görüntü RGB Histogramı")
-            ax.legend()
-        else:  # Gri tonlamalı görüntü
-            # Gri tonlamalı histogram
-            if len(image.shape) == 3:
-                # Eğer hala RGB ise ve gri tonlama istendiyse
-                image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-            
-            ax = fig.add_subplot(111)
-            hist = cv2.calcHist([image], [0], None, [256], [0, 256])
-            ax.plot(hist, color='black')
-            ax.set_title(f"{image_name} Görüntü Gri Tonlama Histogramı")
+        # Panel yoksa bir kez oluştur, gizlenmişse yeniden göster
+        if self.histogram_panel is None:
+            self.create_histogram_panel()
+        elif not self.histogram_panel["frame"].winfo_ismapped():
+            self.histogram_panel["frame"].pack(side=tk.BOTTOM, fill=tk.X, padx=5, pady=5)
         
+        self.update_histogram_panel()
+        image_name = "Orijinal" if image_choice == "original" else "İşlenmiş"
+        self.update_status(f"{image_name} görüntünün histogramı gösteriliyor.")
+
+    def create_histogram_panel(self):
+        """Görüntülerin altına yerleşen, çizgileri yerinde güncellenen histogram panelini oluşturur"""
+        frame = ttk.LabelFrame(self.image_frame, text="Histogram")
+        frame.pack(side=tk.BOTTOM, fill=tk.X, padx=5, pady=5)
+        
+        ttk.Button(frame, text="Kapat", command=self.hide_histogram_panel).pack(side=tk.RIGHT, anchor=tk.N, padx=5, pady=5)
+        
+        # Figür ve çizgiler yalnızca bir kez oluşturulur; sonraki güncellemeler set_ydata ile yapılır
+        fig = plt.Figure(figsize=(7, 2.2), dpi=100)
+        ax = fig.add_subplot(111)
+        x = np.arange(256)
+        zeros = np.zeros(256)
+        lines = {
+            "b": ax.plot(x, zeros, color='b', label='Mavi')[0],
+            "g": ax.plot(x, zeros, color='g', label='Yeşil')[0],
+            "r": ax.plot(x, zeros, color='r', label='Kırmızı')[0],
+            "gray": ax.plot(x, zeros, color='black', label='Gri')[0],
+        }
         ax.set_xlabel("Piksel Değeri")
         ax.set_ylabel("Frekans")
         ax.set_xlim([0, 256])
+        fig.tight_layout()
         
-        # Figürü canvas'a yerleştir
-        canvas = FigureCanvasTkAgg(fig, master=histogram_window)
-        canvas.draw()
-        canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=1)
+        canvas = FigureCanvasTkAgg(fig, master=frame)
+        canvas.get_tk_widget().pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
-        self.update_status(f"{image_name} görüntünün histogramı gösteriliyor.")
+        self.histogram_panel = {"frame": frame, "figure": fig, "axes": ax, "lines": lines, "canvas": canvas}
+
+    def hide_histogram_panel(self):
+        """Histogram panelini gizler; figür yeniden kullanılmak üzere saklanır"""
+        if self.histogram_panel is None:
+            return
+        
+        if self.histogram_after_id is not None:
+            self.root.after_cancel(self.histogram_after_id)
+            self.histogram_after_id = None
+        self.histogram_panel["frame"].pack_forget()
+
+    def schedule_histogram_update(self, delay=100):
+        """
+        Histogram panelinin güncellenmesini planlar. Bekleyen bir güncelleme varsa
+        yenisi eklenmez; art arda gelen değişiklikler tek bir çizimde birleşir.
+        """
+        if self.histogram_panel is None or not self.histogram_panel["frame"].winfo_ismapped():
+            return
+        
+        if self.histogram_after_id is None:
+            self.histogram_after_id = self.root.after(delay, self.update_histogram_panel)
+
+    def update_histogram_panel(self):
+        """Panelde seçili görüntünün histogramını mevcut çizgiler üzerinden günceller"""
+        self.histogram_after_id = None
+        if self.histogram_panel is None:
+            return
+        
+        # "Orijinal" seçimi üzerinde çalışılan görüntüyü gösterir
+        image_choice, image_type = self.histogram_source
+        if image_choice == "processed" and self.processed_image is not None:
+            image = self.processed_image
+            image_name = "İşlenmiş"
+        else:
+            image = self.working_image
+            image_name = "Orijinal"
+        
+        if image is None:
+            return
+        
+        # Görüntü yalnızca okunur; kopyalanmadığı için histogram önbelleği kullanılabilir
+        if image_type == "gray" and len(image.shape) == 3:
+            image = hafta1.griye_cevir(image)
+        
+        lines = self.histogram_panel["lines"]
+        ax = self.histogram_panel["axes"]
+        hist_bilgisi = hafta2.histogram_bilgisi(image)
+        
+        if len(image.shape) == 3:
+            for i, key in enumerate(("b", "g", "r")):
+                lines[key].set_ydata(hist_bilgisi.calc_hist(i).ravel())
+                lines[key].set_visible(True)
+            lines["gray"].set_visible(False)
+            ax.set_title(f"{image_name} Görüntü RGB Histogramı", fontsize=9)
+        else:
+            lines["gray"].set_ydata(hist_bilgisi.calc_hist(0).ravel())
+            lines["gray"].set_visible(True)
+            for key in ("b", "g", "r"):
+                lines[key].set_visible(False)
+            ax.set_title(f"{image_name} Görüntü Gri Tonlama Histogramı", fontsize=9)
+        
+        # Yalnızca y ekseni sınırı yenilenir; figür yeniden kurulmaz
+        ax.set_ylim(0, max(float(hist_bilgisi.hist.max()), 1.0) * 1.05)
+        self.histogram_panel["canvas"].draw_idle()
 
     def apply_histogram_equalization(self):
         """Histogram eşitleme panelini gösterir"""
@@ -1255,14 +1351,22 @@ class ImageProcessingApp:
             variable=manual_var
         ).pack(pady=5)
         
+        # Büyük oranlı küçültmeler için piramit seçeneği
+        pyramid_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(
+            self.params_content,
+            text="Piramit ile Küçült (0.5'ten küçük ölçekler)",
+            variable=pyramid_var
+        ).pack(pady=5)
+        
         # Uygula butonu
         ttk.Button(
             self.params_content,
             text="Uygula",
-            command=lambda: self.execute_scaling(scale_var.get(), interp_var.get(), manual_var.get())
+            command=lambda: self.execute_scaling(scale_var.get(), interp_var.get(), manual_var.get(), pyramid_var.get())
         ).pack(pady=10)
 
-    def execute_scaling(self, scale_factor, interpolation_method, use_manual):
+    def execute_scaling(self, scale_factor, interpolation_method, use_manual, use_pyramid=False):
         """Ölçekleme işlemini uygular"""
         if self.original_image is None:
             return
@@ -1278,6 +1382,14 @@ class ImageProcessingApp:
             except Exception as e:
                 messagebox.showerror("Hata", f"Manuel ölçekleme başarısız: {str(e)}")
                 return
+        elif use_pyramid and scale_factor < 1.0:
+            # Aynı kaynağın önceki küçültmelerinde hesaplanan seviyeler yeniden kullanılır
+            if self.scaling_mip is None or self.scaling_mip.goruntu is not self.working_image:
+                self.scaling_mip = hafta3.MipPiramidi(self.working_image)
+            self.processed_image = hafta3.olcekleme(
+                self.working_image, scale_factor, interpolation_method, piramit=True, mip=self.scaling_mip
+            )
+            operation_name = f"Piramit ile ölçekleme: {scale_factor:.2f}"
         else:
             # Normal ölçekleme
             self.processed_image = hafta3.olcekleme(self.working_image.copy(), scale_factor, interpolation_method)
@@ -1371,6 +1483,148 @@ class ImageProcessingApp:
         self.display_images()
         self.update_status(f"Görüntü {angle:.1f}° döndürüldü, ölçek: {scale_factor:.2f}")
 
+    def apply_combined_transform(self):
+        """Birden fazla geometrik adımı tek dönüşümde birleştiren paneli gösterir"""
+        if self.original_image is None:
+            messagebox.showwarning("Uyarı", "Önce bir görüntü yükleyin!")
+            return
+        
+        # Adımlar tek bir afin matriste birikir; görüntü yalnızca bir kez örneklenir
+        composer = hafta3.AfinDonusumBirlestirici()
+        
+        # İşlem parametreleri panelini oluştur
+        self.clear_params_panel()
+        ttk.Label(self.params_content, text="Birleşik Geometrik Dönüşüm").pack(pady=5)
+        
+        # Adım türü ve parametreleri
+        step_types = {
+            "Taşıma": ("dx, dy", lambda a, b: composer.tasi(a, b)),
+            "Döndürme": ("açı, ölçek", lambda a, b: composer.dondur(a, olcek=b if b else 1.0)),
+            "Ölçekleme": ("ölçek", lambda a, b: composer.olcekle(a)),
+            "X Eğme": ("eğme", lambda a, b: composer.eg_x(a)),
+            "Y Eğme": ("eğme", lambda a, b: composer.eg_y(a)),
+            "Yatay Aynalama": ("-", lambda a, b: composer.aynala_yatay()),
+            "Dikey Aynalama": ("-", lambda a, b: composer.aynala_dikey()),
+            "Her İki Eksende Aynalama": ("-", lambda a, b: composer.aynala_her_iki_eksen()),
+        }
+        
+        ttk.Label(self.params_content, text="Adım Türü:").pack(pady=(10, 0))
+        step_var = tk.StringVar(value="Taşıma")
+        step_combo = ttk.Combobox(
+            self.params_content,
+            textvariable=step_var,
+            values=list(step_types.keys()),
+            state="readonly",
+            width=25
+        )
+        step_combo.pack(pady=(0, 5))
+        
+        hint_var = tk.StringVar(value=f"Parametreler: {step_types['Taşıma'][0]}")
+        ttk.Label(self.params_content, textvariable=hint_var).pack()
+        step_combo.bind("<<ComboboxSelected>>",
+                        lambda e: hint_var.set(f"Parametreler: {step_types[step_var.get()][0]}"))
+        
+        values_frame = ttk.Frame(self.params_content)
+        values_frame.pack(pady=5)
+        first_var = tk.DoubleVar(value=0.0)
+        second_var = tk.DoubleVar(value=0.0)
+        ttk.Entry(values_frame, textvariable=first_var, width=8).pack(side=tk.LEFT, padx=2)
+        ttk.Entry(values_frame, textvariable=second_var, width=8).pack(side=tk.LEFT, padx=2)
+        
+        # Eklenen adımların listesi
+        steps_list = tk.Listbox(self.params_content, height=6, width=32)
+        
+        def refresh_steps():
+            steps_list.delete(0, tk.END)
+            for i, text in enumerate(composer.aciklamalar(), 1):
+                steps_list.insert(tk.END, f"{i}. {text}")
+        
+        def add_step():
+            try:
+                first, second = first_var.get(), second_var.get()
+            except tk.TclError:
+                messagebox.showerror("Hata", "Parametreler sayı olmalıdır!")
+                return
+            if step_var.get() == "Ölçekleme" and first <= 0:
+                messagebox.showerror("Hata", "Ölçek faktörü pozitif olmalıdır!")
+                return
+            step_types[step_var.get()][1](first, second)
+            refresh_steps()
+        
+        buttons_frame = ttk.Frame(self.params_content)
+        buttons_frame.pack(pady=5)
+        ttk.Button(buttons_frame, text="Adım Ekle", command=add_step).pack(side=tk.LEFT, padx=2)
+        ttk.Button(buttons_frame, text="Son Adımı Sil",
+                   command=lambda: (composer.geri_al(), refresh_steps())).pack(side=tk.LEFT, padx=2)
+        ttk.Button(buttons_frame, text="Temizle",
+                   command=lambda: (composer.temizle(), refresh_steps())).pack(side=tk.LEFT, padx=2)
+        steps_list.pack(pady=5)
+        
+        # Çıktı boyutu seçimi
+        ttk.Label(self.params_content, text="Çıktı Boyutu:").pack(pady=(10, 5))
+        frame_var = tk.StringVar(value="adimlar")
+        ttk.Radiobutton(
+            self.params_content,
+            text="Adımların tuval boyutu",
+            variable=frame_var,
+            value="adimlar"
+        ).pack(anchor=tk.W, pady=2)
+        ttk.Radiobutton(
+            self.params_content,
+            text="Tüm görüntüyü kapsa",
+            variable=frame_var,
+            value="kapsa"
+        ).pack(anchor=tk.W, pady=2)
+        
+        # İnterpolasyon yöntemi seçimi
+        ttk.Label(self.params_content, text="İnterpolasyon Yöntemi:").pack(pady=(10, 5))
+        interp_var = tk.IntVar(value=cv2.INTER_LINEAR)
+        ttk.Radiobutton(
+            self.params_content,
+            text="Bilinear (INTER_LINEAR)",
+            variable=interp_var,
+            value=cv2.INTER_LINEAR
+        ).pack(anchor=tk.W, pady=2)
+        
+        ttk.Radiobutton(
+            self.params_content,
+            text="En Yakın Komşu (INTER_NEAREST)",
+            variable=interp_var,
+            value=cv2.INTER_NEAREST
+        ).pack(anchor=tk.W, pady=2)
+        
+        ttk.Radiobutton(
+            self.params_content,
+            text="Kübik (INTER_CUBIC)",
+            variable=interp_var,
+            value=cv2.INTER_CUBIC
+        ).pack(anchor=tk.W, pady=2)
+        
+        # Uygula butonu
+        ttk.Button(
+            self.params_content,
+            text="Uygula",
+            command=lambda: self.execute_combined_transform(composer, interp_var.get(), frame_var.get())
+        ).pack(pady=10)
+
+    def execute_combined_transform(self, composer, interpolation_method, frame_mode):
+        """Biriken geometrik adımları tek bir warpAffine ile uygular"""
+        if self.original_image is None:
+            return
+        
+        if not composer.adimlar:
+            messagebox.showwarning("Uyarı", "Önce en az bir adım ekleyin!")
+            return
+        
+        result = composer.uygula(self.working_image, interpolation_method, frame_mode)
+        if result is None:
+            messagebox.showerror("Hata", "Birleşik dönüşüm uygulanamadı!")
+            return
+        
+        self.processed_image = result
+        self.display_images()
+        self.update_status(f"{len(composer.adimlar)} geometrik adım tek dönüşümde uygulandı.")
+
     def apply_cropping(self):
         """Kırpma işlemi başlatır"""
         if self.original_image is None:
@@ -1505,6 +1759,51 @@ class ImageProcessingApp:
             except Exception as e:
                 messagebox.showerror("Hata", f"Kırpma işlemi başarısız: {str(e)}")
 
+    def select_processing_region(self):
+        """Fare ile işlem bölgesini seçer; sonraki filtreler yalnızca bu bölgeye uygulanır"""
+        if self.original_image is None:
+            messagebox.showwarning("Uyarı", "Önce bir görüntü yükleyin!")
+            return
+        
+        self.update_status("Fare ile işlem bölgesini seçin. Bekleniyor...")
+        region = hafta3.mouse_ile_bolge_sec(self.working_image)
+        
+        if region is None:
+            self.update_status("İşlem bölgesi seçimi iptal edildi.")
+            return
+        
+        self.processing_region = region
+        x, y, width, height = region
+        self.update_status(f"İşlem bölgesi seçildi: X:{x}, Y:{y}, G:{width}, Y:{height}. Filtreler yalnızca bu bölgeye uygulanacak.")
+
+    def clear_processing_region(self):
+        """İşlem bölgesini kaldırır; filtreler yeniden tüm görüntüye uygulanır"""
+        self.processing_region = None
+        self.update_status("İşlem bölgesi kaldırıldı. Filtreler tüm görüntüye uygulanacak.")
+
+    def run_operation(self, operation, halo=0):
+        """
+        İşlemi tüm görüntüye veya seçili işlem bölgesine uygular. Bölge seçiliyse
+        yalnızca bölge ile çevresindeki halo (çekirdek yarıçapı) işlenir ve sonuç
+        tam görüntünün kopyasına yapıştırılır. Normalize eden kenar filtreleri bölge
+        ve halo içindeki değer aralığını kullanır.
+        """
+        if self.processing_region is None:
+            return operation(self.working_handle)
+        
+        # İşlemler üzerinde çalışılan görüntüye zincirlendiği için önceki bölge sonucu
+        # hâlâ çalışılan görüntüyse yalnızca yeni bölge yerinde yazılır
+        image = self.working_image
+        target = image if self.region_result is image else None
+        
+        result = hafta3.bolgede_uygula(image, self.processing_region, operation, hale=halo, hedef=target)
+        if result is not None:
+            self.region_result = result
+            if result is image:
+                # İçerik değişti; tutamaçtaki gri/YCrCb gibi türetilmiş gösterimler geçersiz
+                self._working_handle = None
+        return result
+
     # Hafta 4 - Perspektif Dönüşümler
     def apply_perspective_correction(self):
         """Perspektif düzeltme işlemi panelini gösterir"""
@@ -1796,10 +2095,10 @@ class ImageProcessingApp:
         
         # Manuel mod veya OpenCV kullanımı seçimine göre işlev çağır
         if manual_mode:
-            self.processed_image = hafta5.ortalama_filtre_manuel(self.working_image.copy(), kernel_size)
+            self.processed_image = self.run_operation(lambda img: hafta5.ortalama_filtre_manuel(img, kernel_size), kernel_size // 2)
             filter_name = "Manuel ortalama filtre"
         else:
-            self.processed_image = hafta5.ortalama_filtre(self.working_image.copy(), kernel_size)
+            self.processed_image = self.run_operation(lambda img: hafta5.ortalama_filtre(img, kernel_size), kernel_size // 2)
             filter_name = "Ortalama filtre"
         
         self.display_images()
@@ -1855,10 +2154,10 @@ class ImageProcessingApp:
         
         # Manuel mod veya OpenCV kullanımı seçimine göre işlev çağır
         if manual_mode:
-            self.processed_image = hafta5.medyan_filtre_manuel(self.working_image.copy(), kernel_size)
+            self.processed_image = self.run_operation(lambda img: hafta5.medyan_filtre_manuel(img, kernel_size), kernel_size // 2)
             filter_name = "Manuel medyan filtre"
         else:
-            self.processed_image = hafta5.medyan_filtre(self.working_image.copy(), kernel_size)
+            self.processed_image = self.run_operation(lambda img: hafta5.medyan_filtre(img, kernel_size), kernel_size // 2)
             filter_name = "Medyan filtre"
         
         self.display_images()
@@ -1928,10 +2227,10 @@ class ImageProcessingApp:
         
         # Manuel mod veya OpenCV kullanımı seçimine göre işlev çağır
         if manual_mode:
-            self.processed_image = hafta5.gauss_filtre_manuel(self.working_image.copy(), kernel_size, sigma)
+            self.processed_image = self.run_operation(lambda img: hafta5.gauss_filtre_manuel(img, kernel_size, sigma), kernel_size // 2)
             filter_name = "Manuel Gauss filtresi"
         else:
-            self.processed_image = hafta5.gauss_filtre(self.working_image.copy(), kernel_size, sigma)
+            self.processed_image = self.run_operation(lambda img: hafta5.gauss_filtre(img, kernel_size, sigma), kernel_size // 2)
             filter_name = "Gauss filtresi"
         
         self.display_images()
@@ -1967,7 +2266,7 @@ class ImageProcessingApp:
         self.update_status("Konservatif filtre uygulanıyor...")
         
         # Filtreyi uygula
-        self.processed_image = hafta5.konservatif_filtre(self.working_image.copy())
+        self.processed_image = self.run_operation(hafta5.konservatif_filtre, 1)
         
         self.display_images()
         self.update_status("Konservatif filtre uygulandı.")
@@ -2016,7 +2315,7 @@ class ImageProcessingApp:
         self.update_status("Crimmins speckle filtresi uygulanıyor...")
         
         # Filtreyi uygula
-        self.processed_image = hafta5.crimmins_speckle_filtre(self.working_image.copy(), iterations)
+        self.processed_image = self.run_operation(lambda img: hafta5.crimmins_speckle_filtre(img, iterations), iterations)
         
         self.display_images()
         self.update_status(f"Crimmins speckle filtresi uygulandı (İterasyon: {iterations}).")
@@ -2051,7 +2350,7 @@ class ImageProcessingApp:
         self.update_status("Fourier dönüşümü hesaplanıyor...")
         
         # Fourier dönüşümünü göster
-        hafta5.goruntu_fft_goster(self.working_image.copy())
+        hafta5.goruntu_fft_goster(self.working_handle)
         
         self.update_status("Fourier dönüşümü gösterildi.")
 
@@ -2099,7 +2398,7 @@ class ImageProcessingApp:
         self.update_status("Alçak geçiren filtre uygulanıyor...")
         
         # Filtreyi uygula
-        self.processed_image = hafta5.alcak_geciren_filtre(self.working_image.copy(), cutoff_frequency)
+        self.processed_image = hafta5.alcak_geciren_filtre(self.working_handle, cutoff_frequency)
         
         self.display_images()
         self.update_status(f"Alçak geçiren filtre uygulandı (Kesme frekansı: {cutoff_frequency}).")
@@ -2148,7 +2447,7 @@ class ImageProcessingApp:
         self.update_status("Yüksek geçiren filtre uygulanıyor...")
         
         # Filtreyi uygula
-        self.processed_image = hafta5.yuksek_geciren_filtre(self.working_image.copy(), cutoff_frequency)
+        self.processed_image = hafta5.yuksek_geciren_filtre(self.working_handle, cutoff_frequency)
         
         self.display_images()
         self.update_status(f"Yüksek geçiren filtre uygulandı (Kesme frekansı: {cutoff_frequency}).")
@@ -2217,7 +2516,7 @@ class ImageProcessingApp:
         
         # Filtreyi uygula
         self.processed_image = hafta5.band_geciren_filtre(
-            self.working_image.copy(), 
+            self.working_handle, 
             ic_yaricap=inner_radius, 
             dis_yaricap=outer_radius
         )
@@ -2289,7 +2588,7 @@ class ImageProcessingApp:
         
         # Filtreyi uygula
         self.processed_image = hafta5.band_durduran_filtre(
-            self.working_image.copy(), 
+            self.working_handle, 
             ic_yaricap=inner_radius, 
             dis_yaricap=outer_radius
         )
@@ -2432,7 +2731,7 @@ class ImageProcessingApp:
         if filter_type == "low_pass":
             self.update_status(f"Butterworth alçak geçiren filtre uygulanıyor (Kesme: {cutoff_frequency}, Derece: {order})...")
             self.processed_image = hafta5.butterworth_alcak_geciren_filtre(
-                self.working_image.copy(), 
+                self.working_handle, 
                 kesme_frekansi=cutoff_frequency, 
                 derece=order
             )
@@ -2441,7 +2740,7 @@ class ImageProcessingApp:
         elif filter_type == "high_pass":
             self.update_status(f"Butterworth yüksek geçiren filtre uygulanıyor (Kesme: {cutoff_frequency}, Derece: {order})...")
             self.processed_image = hafta5.butterworth_yuksek_geciren_filtre(
-                self.working_image.copy(), 
+                self.working_handle, 
                 kesme_frekansi=cutoff_frequency, 
                 derece=order
             )
@@ -2458,7 +2757,7 @@ class ImageProcessingApp:
                 
             self.update_status(f"Butterworth band geçiren filtre uygulanıyor...")
             self.processed_image = hafta5.butterworth_band_geciren_filtre(
-                self.working_image.copy(), 
+                self.working_handle, 
                 ic_yaricap=inner_radius, 
                 dis_yaricap=outer_radius, 
                 derece=order
@@ -2476,7 +2775,7 @@ class ImageProcessingApp:
                 
             self.update_status(f"Butterworth band durduran filtre uygulanıyor...")
             self.processed_image = hafta5.butterworth_band_durduran_filtre(
-                self.working_image.copy(), 
+                self.working_handle, 
                 ic_yaricap=inner_radius, 
                 dis_yaricap=outer_radius, 
                 derece=order
@@ -2543,7 +2842,7 @@ class ImageProcessingApp:
         if filter_type == "low_pass":
             self.update_status(f"Gaussian alçak geçiren filtre uygulanıyor (Kesme: {cutoff_frequency})...")
             self.processed_image = hafta5.gaussian_alcak_geciren_filtre(
-                self.working_image.copy(), 
+                self.working_handle, 
                 kesme_frekansi=cutoff_frequency
             )
             filter_name = "Gaussian alçak geçiren filtre"
@@ -2551,7 +2850,7 @@ class ImageProcessingApp:
         elif filter_type == "high_pass":
             self.update_status(f"Gaussian yüksek geçiren filtre uygulanıyor (Kesme: {cutoff_frequency})...")
             self.processed_image = hafta5.gaussian_yuksek_geciren_filtre(
-                self.working_image.copy(), 
+                self.working_handle, 
                 kesme_frekansi=cutoff_frequency
             )
             filter_name = "Gaussian yüksek geçiren filtre"
@@ -2651,7 +2950,7 @@ class ImageProcessingApp:
         
         # Filtreyi uygula
         self.processed_image = hafta5.homomorfik_filtre(
-            self.working_image.copy(), 
+            self.working_handle, 
             d0=cutoff_frequency, 
             h_l=low_gain, 
             h_h=high_gain, 
@@ -2730,19 +3029,16 @@ class ImageProcessingApp:
         # Yükleme durumunu güncelle
         self.update_status("Sobel kenar bulma uygulanıyor...")
         
+        # Seçilen moda göre çıktıyı belirle (x, y veya toplam)
+        output_index, mode_name = {
+            "x": (0, "X yönü"),
+            "y": (1, "Y yönü")
+        }.get(output_mode, (2, "toplam (magnitude)"))
+        
         # Sobel kenar bulma işlemini uygula
-        sobel_x, sobel_y, sobel_magnitude = hafta6.sobel_kenar_bulma(self.working_image.copy(), kernel_size)
-        
-        # Seçilen moda göre çıktıyı belirle
-        if output_mode == "x":
-            self.processed_image = sobel_x
-            mode_name = "X yönü"
-        elif output_mode == "y":
-            self.processed_image = sobel_y
-            mode_name = "Y yönü"
-        else:  # magnitude
-            self.processed_image = sobel_magnitude
-            mode_name = "toplam (magnitude)"
+        self.processed_image = self.run_operation(
+            lambda img: hafta6.sobel_kenar_bulma(img, kernel_size)[output_index], kernel_size // 2
+        )
         
         self.display_images()
         self.update_status(f"Sobel kenar bulma uygulandı (Çekirdek: {kernel_size}x{kernel_size}, Mod: {mode_name}).")
@@ -2800,19 +3096,16 @@ class ImageProcessingApp:
         # Yükleme durumunu güncelle
         self.update_status("Prewitt kenar bulma uygulanıyor...")
         
+        # Seçilen moda göre çıktıyı belirle (x, y veya toplam)
+        output_index, mode_name = {
+            "x": (0, "X yönü"),
+            "y": (1, "Y yönü")
+        }.get(output_mode, (2, "toplam (magnitude)"))
+        
         # Prewitt kenar bulma işlemini uygula
-        prewitt_x, prewitt_y, prewitt_magnitude = hafta6.prewitt_kenar_bulma(self.working_image.copy())
-        
-        # Seçilen moda göre çıktıyı belirle
-        if output_mode == "x":
-            self.processed_image = prewitt_x
-            mode_name = "X yönü"
-        elif output_mode == "y":
-            self.processed_image = prewitt_y
-            mode_name = "Y yönü"
-        else:  # magnitude
-            self.processed_image = prewitt_magnitude
-            mode_name = "toplam (magnitude)"
+        self.processed_image = self.run_operation(
+            lambda img: hafta6.prewitt_kenar_bulma(img)[output_index], 1
+        )
         
         self.display_images()
         self.update_status(f"Prewitt kenar bulma uygulandı (Mod: {mode_name}).")
@@ -2870,19 +3163,16 @@ class ImageProcessingApp:
         # Yükleme durumunu güncelle
         self.update_status("Roberts Cross kenar bulma uygulanıyor...")
         
+        # Seçilen moda göre çıktıyı belirle (x, y veya toplam)
+        output_index, mode_name = {
+            "x": (0, "X yönü"),
+            "y": (1, "Y yönü")
+        }.get(output_mode, (2, "toplam (magnitude)"))
+        
         # Roberts Cross kenar bulma işlemini uygula
-        roberts_x, roberts_y, roberts_magnitude = hafta6.roberts_cross_kenar_bulma(self.working_image.copy())
-        
-        # Seçilen moda göre çıktıyı belirle
-        if output_mode == "x":
-            self.processed_image = roberts_x
-            mode_name = "X yönü"
-        elif output_mode == "y":
-            self.processed_image = roberts_y
-            mode_name = "Y yönü"
-        else:  # magnitude
-            self.processed_image = roberts_magnitude
-            mode_name = "toplam (magnitude)"
+        self.processed_image = self.run_operation(
+            lambda img: hafta6.roberts_cross_kenar_bulma(img)[output_index], 1
+        )
         
         self.display_images()
         self.update_status(f"Roberts Cross kenar bulma uygulandı (Mod: {mode_name}).")
@@ -2917,7 +3207,7 @@ class ImageProcessingApp:
         self.update_status("Compass kenar bulma uygulanıyor...")
         
         # Compass kenar bulma işlemini uygula
-        self.processed_image = hafta6.compass_kenar_bulma(self.working_image.copy())
+        self.processed_image = self.run_operation(hafta6.compass_kenar_bulma, 1)
         
         self.display_images()
         self.update_status("Compass kenar bulma uygulandı.")
@@ -3001,12 +3291,15 @@ class ImageProcessingApp:
         # Yükleme durumunu güncelle
         self.update_status("Canny kenar bulma uygulanıyor...")
         
-        # Canny kenar bulma işlemini uygula
-        self.processed_image = hafta6.canny_kenar_bulma(
-            self.working_image.copy(),
-            alt_esik=min_threshold,
-            ust_esik=max_threshold,
-            aperture_size=aperture_size
+        # Canny kenar bulma işlemini uygula (histerezis takibi bölge kenarında küçük farklar verebilir)
+        self.processed_image = self.run_operation(
+            lambda img: hafta6.canny_kenar_bulma(
+                img,
+                alt_esik=min_threshold,
+                ust_esik=max_threshold,
+                aperture_size=aperture_size
+            ),
+            aperture_size + 2
         )
         
         self.display_images()
@@ -3070,18 +3363,20 @@ class ImageProcessingApp:
         # Yükleme durumunu güncelle
         self.update_status("Laplace kenar bulma uygulanıyor...")
         
-        # Görüntüyü gri tonlamaya çevir
-        if len(self.original_image.shape) > 2:
-            gray = cv2.cvtColor(self.working_image.copy(), cv2.COLOR_BGR2GRAY)
-        else:
-            gray = self.working_image.copy()
-        
-        # Gürültü azaltmak için önce Gaussian filtre uygula
-        if sigma > 0:
-            gray = cv2.GaussianBlur(gray, (kernel_size, kernel_size), sigma)
+        def operation(img):
+            # Görüntüyü gri tonlamaya çevir
+            gray = hafta1.gri_al(img)
+            
+            # Gürültü azaltmak için önce Gaussian filtre uygula
+            if sigma > 0:
+                gray = cv2.GaussianBlur(gray, (kernel_size, kernel_size), sigma)
+            
+            # Laplace filtresini uygula
+            return hafta6.laplace_kenar_bulma(gray, ksize=kernel_size)
         
-        # Laplace filtresini uygula
-        self.processed_image = hafta6.laplace_kenar_bulma(gray, ksize=kernel_size)
+        # Bulanıklaştırma ve Laplace çekirdeklerinin yarıçapları toplanır
+        halo = kernel_size // 2 * (2 if sigma > 0 else 1)
+        self.processed_image = self.run_operation(operation, halo)
         self.display_images()
         self.update_status(f"Laplace kenar algılama filtresi uygulandı (kernel={kernel_size})")
 
@@ -3154,14 +3449,11 @@ class ImageProcessingApp:
         if self.original_image is None:
             return
         
-        # Görüntüyü gri tonlamaya çevir
-        if len(self.original_image.shape) > 2:
-            gray = cv2.cvtColor(self.working_image.copy(), cv2.COLOR_BGR2GRAY)
-        else:
-            gray = self.working_image.copy()
-        
-        # Gabor filtresini uygula
-        self.processed_image = hafta6.gabor_filtre(gray, kernel_size=kernel_size, sigma=sigma, theta=theta)
+        # Gri tonlamaya çevirip Gabor filtresini uygula
+        self.processed_image = self.run_operation(
+            lambda img: hafta6.gabor_filtre(hafta1.gri_al(img), kernel_size=kernel_size, sigma=sigma, theta=theta),
+            kernel_size // 2
+        )
         self.display_images()
         self.update_status(f"Gabor filtresi uygulandı (kernel={kernel_size}, sigma={sigma:.1f}, theta={theta:.2f})")
 
@@ -3238,9 +3530,9 @@ class ImageProcessingApp:
         self.update_status("Hough çizgi algılama uygulanıyor...")
         
         # Hough çizgi algılama işlemini uygula
-        lines = hafta7.hough_cizgi_algilama(self.working_image.copy(), kernel_size, theta, threshold)
+        lines = hafta7.hough_cizgi_algilama(self.working_handle, kernel_size, theta, threshold)
         
-        self.processed_image = hafta7.cizgi_cizdir(self.working_image.copy(), lines)
+        self.processed_image = hafta7.cizgi_cizdir(self.working_handle, lines)
         self.display_images()
         self.update_status("Hough çizgi algılama işlemi tamamlandı.")
 
@@ -3303,9 +3595,9 @@ class ImageProcessingApp:
         self.update_status("Hough çember algılama uygulanıyor...")
         
         # Hough çember algılama işlemini uygula
-        circles = hafta7.hough_cember_algilama(self.working_image.copy(), kernel_size, threshold)
+        circles = hafta7.hough_cember_algilama(self.working_handle, kernel_size, threshold)
         
-        self.processed_image = hafta7.cember_cizdir(self.working_image.copy(), circles)
+        self.processed_image = hafta7.cember_cizdir(self.working_handle, circles)
         self.display_images()
         self.update_status("Hough çember algılama işlemi tamamlandı.")
 
@@ -3355,7 +3647,7 @@ class ImageProcessingApp:
         
         # K-means segmentasyon işlemini uygula
         _, self.processed_image, _ = hafta6.kmeans_segmentation(
-            self.working_image.copy(),
+            self.working_handle,
             k=k
         )
         
@@ -3404,22 +3696,11 @@ class ImageProcessingApp:
         if self.original_image is None:
             return
         
-        # İşlem yapılacak görüntüyü belirle
-        if self.processed_image is not None:
-            # İşlem yapılacak resim kopya olmalı
-            working_image = self.processed_image.copy()
-        else:
-            # İşlenmiş resim yoksa orijinal resmi kullan
-            working_image = self.working_image.copy()
-        
         # Yükleme durumunu güncelle
         self.update_status("Aşındırma işlemi uygulanıyor...")
         
         # Aşındırma işlemini uygula (Hafta7'deki fonksiyon adı erode_islem)
-        result_image = hafta7.erode_islem(working_image, kernel_size=kernel_size)
-        
-        # Sonucu işlenmiş görüntüye ata
-        self.processed_image = result_image
+        self.processed_image = self.run_operation(lambda img: hafta7.erode_islem(img, kernel_size=kernel_size), kernel_size // 2)
         
         self.display_images()
         self.update_status(f"Aşındırma işlemi tamamlandı (kernel boyutu: {kernel_size}x{kernel_size}).")
@@ -3465,22 +3746,11 @@ class ImageProcessingApp:
         if self.original_image is None:
             return
         
-        # İşlem yapılacak görüntüyü belirle
-        if self.processed_image is not None:
-            # İşlem yapılacak resim kopya olmalı
-            working_image = self.processed_image.copy()
-        else:
-            # İşlenmiş resim yoksa orijinal resmi kullan
-            working_image = self.working_image.copy()
-        
         # Yükleme durumunu güncelle
         self.update_status("Genişletme uygulanıyor...")
         
         # Genişletme işlemini uygula
-        result_image = hafta7.dilate_islem(working_image, kernel_size=kernel_size)
-        
-        # Sonucu işlenmiş görüntüye ata
-        self.processed_image = result_image
+        self.processed_image = self.run_operation(lambda img: hafta7.dilate_islem(img, kernel_size=kernel_size), kernel_size // 2)
         
         self.display_images()
         self.update_status(f"Genişletme uygulandı (Çekirdek: {kernel_size}x{kernel_size}).")
@@ -3530,7 +3800,7 @@ class ImageProcessingApp:
         self.update_status("Açma işlemi uygulanıyor...")
         
         # Açma işlemini uygula
-        self.processed_image = hafta7.opening_islem(self.working_image.copy(), kernel_size=kernel_size)
+        self.processed_image = self.run_operation(lambda img: hafta7.opening_islem(img, kernel_size=kernel_size), kernel_size // 2 * 2)
         self.display_images()
         self.update_status(f"Açma işlemi tamamlandı (kernel boyutu: {kernel_size}x{kernel_size}).")
 
@@ -3579,7 +3849,7 @@ class ImageProcessingApp:
         self.update_status("Kapama işlemi uygulanıyor...")
         
         # Kapama işlemini uygula
-        self.processed_image = hafta7.closing_islem(self.working_image.copy(), kernel_size=kernel_size)
+        self.processed_image = self.run_operation(lambda img: hafta7.closing_islem(img, kernel_size=kernel_size), kernel_size // 2 * 2)
         self.display_images()
         self.update_status(f"Kapama işlemi tamamlandı (kernel boyutu: {kernel_size}x{kernel_size}).")
 
@@ -3622,6 +3892,20 @@ class ImageProcessingApp:
         """Üzerinde çalışılacak görüntüyü döndürür"""
         return self.processed_image if self.processed_image is not None else self.original_image
 
+    @property
+    def working_handle(self):
+        """
+        Üzerinde çalışılacak görüntünün tutamacını döndürür. Görüntü değişmediği
+        sürece aynı tutamaç kullanılır; böylece gri, YCrCb gibi türetilmiş
+        gösterimler art arda uygulanan işlemler arasında yeniden hesaplanmaz.
+        """
+        image = self.working_image
+        handle = getattr(self, "_working_handle", None)
+        if handle is None or handle.goruntu is not image:
+            handle = hafta1.GoruntuTutamaci(image)
+            self._working_handle = handle
+        return handle
+
 # Uygulamayı başlat
 if __name__ == "__main__":
     root = tk.Tk()
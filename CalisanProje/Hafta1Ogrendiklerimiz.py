@@ -1,8 +1,176 @@
 import cv2
 import numpy as np
+import hashlib
+import json
 import os
+import queue
+import struct
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import filedialog
 
+# Küçültülmüş çözme (reduced decode) bayrakları: ölçek -> (renkli, gri)
+_KUCULTULMUS_OKUMA = {
+    2: (cv2.IMREAD_REDUCED_COLOR_2, cv2.IMREAD_REDUCED_GRAYSCALE_2),
+    4: (cv2.IMREAD_REDUCED_COLOR_4, cv2.IMREAD_REDUCED_GRAYSCALE_4),
+    8: (cv2.IMREAD_REDUCED_COLOR_8, cv2.IMREAD_REDUCED_GRAYSCALE_8),
+}
+
+# Yalnızca JPEG çözücüsü küçültülmüş çözmeyi doğrudan DCT aşamasında yapar;
+# diğer biçimlerde tam çözme sonrası yeniden boyutlandırma yapıldığı için kazanç yoktur
+_ONIZLEME_UZANTILARI = (".jpg", ".jpeg", ".jpe")
+
+_okuma_havuzu = None
+_kucuk_resim_havuzu = None
+
+# Klasör tarayıcısında listelenen görüntü uzantıları
+GORUNTU_UZANTILARI = (".jpg", ".jpeg", ".jpe", ".png", ".bmp", ".tif", ".tiff", ".npy")
+
+# Kaydetme profilleri: ad -> (uzantı, cv2.imencode parametreleri, açıklama)
+KAYIT_PROFILLERI = {
+    "png_hizli": (".png", [cv2.IMWRITE_PNG_COMPRESSION, 1], "PNG - Hızlı (sıkıştırma 1)"),
+    "png_dengeli": (".png", [cv2.IMWRITE_PNG_COMPRESSION, 4], "PNG - Dengeli (sıkıştırma 4)"),
+    "png_en_kucuk": (".png", [cv2.IMWRITE_PNG_COMPRESSION, 9], "PNG - En küçük dosya (sıkıştırma 9)"),
+    "jpeg_yuksek": (".jpg", [cv2.IMWRITE_JPEG_QUALITY, 95], "JPEG - Yüksek kalite (95)"),
+    "jpeg_orta": (".jpg", [cv2.IMWRITE_JPEG_QUALITY, 85], "JPEG - Orta kalite (85)"),
+    "jpeg_dusuk": (".jpg", [cv2.IMWRITE_JPEG_QUALITY, 70], "JPEG - Düşük kalite (70)"),
+}
+
+_kayit_kuyrugu = None
+
+# Küçük resimlerin (thumbnail) diskte saklandığı varsayılan dizin
+_KUCUK_RESIM_DIZINI = os.path.join(os.path.expanduser("~"), ".goruntu_isleme", "kucuk_resimler")
+
+# Bellek eşleme (memory map) ile kopyasız açılabilen dosya uzantıları
+_ESLENEBILIR_UZANTILAR = (".npy", ".tif", ".tiff")
+
+# TIFF etiket numaraları
+_TIFF_GENISLIK = 256
+_TIFF_YUKSEKLIK = 257
+_TIFF_BIT_SAYISI = 258
+_TIFF_SIKISTIRMA = 259
+_TIFF_FOTOMETRIK = 262
+_TIFF_SERIT_OFSETLERI = 273
+_TIFF_YONLENDIRME = 274
+_TIFF_ORNEK_SAYISI = 277
+_TIFF_SERIT_SATIRI = 278
+_TIFF_SERIT_BAYTLARI = 279
+_TIFF_DUZLEM = 284
+_TIFF_KARO_GENISLIGI = 322
+_TIFF_EK_ORNEKLER = 338
+_TIFF_ORNEK_BICIMI = 339
+
+# PhotometricInterpretation değerleri
+_TIFF_SIYAH_SIFIR = 1
+_TIFF_RGB = 2
+
+# TIFF veri türü -> (struct biçimi, bayt)
+_TIFF_TURLERI = {1: ("B", 1), 3: ("H", 2), 4: ("I", 4), 16: ("Q", 8)}
+
+# Çözülmüş görüntü önbelleği için varsayılan bellek sınırı (bayt)
+_COZUM_ONBELLEGI_BUTCESI = 512 * 1024 * 1024
+
+class CozumOnbellegi:
+    """
+    Çözülmüş (decode edilmiş) görüntüleri bayt bütçesiyle sınırlı LRU düzeninde saklayan sınıf.
+    
+    Anahtar dosyanın mutlak yolu, değişiklik zamanı (mtime), boyutu ve okuma
+    bayrağından oluşur; dosya değiştiğinde eski kayıt kendiliğinden geçersiz olur.
+    Saklanan diziler paylaşıldığı için salt okunur işaretlenir. Arka plandaki
+    okuma işlerinden de kullanıldığı için erişim kilitle korunur.
+    """
+    def __init__(self, bayt_butcesi=_COZUM_ONBELLEGI_BUTCESI):
+        self.bayt_butcesi = bayt_butcesi
+        self._kayitlar = OrderedDict()
+        self._kilit = threading.Lock()
+        self.kullanilan_bayt = 0
+        self.isabet = 0
+        self.iska = 0
+        self.tahliye = 0
+
+    @staticmethod
+    def anahtar(dosya_yolu, bayrak):
+        """Dosya için önbellek anahtarını döndürür, dosya yoksa None"""
+        try:
+            bilgi = os.stat(dosya_yolu)
+        except OSError:
+            return None
+        return (os.path.abspath(dosya_yolu), bilgi.st_mtime_ns, bilgi.st_size, bayrak)
+
+    def al(self, anahtar):
+        """Kayıt varsa en son kullanılan olarak işaretleyip döndürür, yoksa None"""
+        with self._kilit:
+            img = self._kayitlar.get(anahtar)
+            if img is None:
+                self.iska += 1
+                return None
+            self._kayitlar.move_to_end(anahtar)
+            self.isabet += 1
+            return img
+
+    def iceriyor(self, anahtar):
+        """Kaydın varlığını istatistikleri ve sırayı değiştirmeden denetler"""
+        with self._kilit:
+            return anahtar in self._kayitlar
+
+    def ekle(self, anahtar, img):
+        """Görüntüyü saklar ve bütçe aşılırsa en uzun süredir kullanılmayanları çıkarır"""
+        if img.nbytes > self.bayt_butcesi:
+            # Bütçeden büyük görüntü saklanmaz; diğer kayıtlar korunur
+            return
+        
+        img.flags.writeable = False
+        with self._kilit:
+            eski = self._kayitlar.pop(anahtar, None)
+            if eski is not None:
+                self.kullanilan_bayt -= eski.nbytes
+            self._kayitlar[anahtar] = img
+            self.kullanilan_bayt += img.nbytes
+            self._butceye_sigdir()
+
+    def _butceye_sigdir(self):
+        """Kilit tutulurken çağrılır; kullanılan bellek bütçeye inene kadar tahliye eder"""
+        while self.kullanilan_bayt > self.bayt_butcesi and self._kayitlar:
+            _, cikan = self._kayitlar.popitem(last=False)
+            self.kullanilan_bayt -= cikan.nbytes
+            self.tahliye += 1
+
+    def butce_ayarla(self, bayt_butcesi):
+        """Bellek sınırını değiştirir; gerekiyorsa hemen tahliye yapar"""
+        with self._kilit:
+            self.bayt_butcesi = bayt_butcesi
+            self._butceye_sigdir()
+
+    def temizle(self):
+        """Tüm kayıtları siler (istatistikler korunur)"""
+        with self._kilit:
+            self._kayitlar.clear()
+            self.kullanilan_bayt = 0
+
+    def istatistikler(self):
+        """
+        Önbellek durumunu döndürür
+        
+        Returns:
+            dict: kayit, kullanilan_bayt, bayt_butcesi, isabet, iska, tahliye ve isabet_orani
+        """
+        with self._kilit:
+            toplam = self.isabet + self.iska
+            return {
+                "kayit": len(self._kayitlar),
+                "kullanilan_bayt": self.kullanilan_bayt,
+                "bayt_butcesi": self.bayt_butcesi,
+                "isabet": self.isabet,
+                "iska": self.iska,
+                "tahliye": self.tahliye,
+                "isabet_orani": self.isabet / toplam if toplam else 0.0,
+            }
+
+# Modül genelinde paylaşılan çözüm önbelleği
+cozum_onbellegi = CozumOnbellegi()
+
 def resim_ac():
     """
     Kullanıcının bilgisayarından bir resim dosyası seçmesini sağlar ve dosya yolunu döndürür
@@ -38,29 +206,766 @@ def resim_ac():
         print(f"Hata: Dosya dialog penceresi açılırken bir hata oluştu: {str(e)}")
         return None
 
-def goruntu_oku(dosya_yolu):
+def _okuma_bayragi(olcek, gri):
+    """Ölçek ve renk seçimine karşılık gelen cv2.imread bayrağını döndürür"""
+    if olcek in _KUCULTULMUS_OKUMA:
+        return _KUCULTULMUS_OKUMA[olcek][1 if gri else 0]
+    return cv2.IMREAD_GRAYSCALE if gri else cv2.IMREAD_COLOR
+
+def _onbellek_bayragi(bayrak, tek_duzlem):
+    """Tek düzleme indirilmiş sonuçlar önbellekte ayrı anahtarla tutulur"""
+    return (bayrak, "tek_duzlem") if tek_duzlem else bayrak
+
+def goruntu_oku(dosya_yolu, olcek=1, gri=False, onbellek=True, tek_duzlem=False):
     """
     Belirtilen dosya yolundaki resmi yükler ve döndürür
     
+    Aynı dosya (yol, değişiklik zamanı ve boyut aynıysa) daha önce okunduysa
+    çözülmüş görüntü önbellekten döndürülür. .npy dosyaları ve cv2.imread ile
+    aynı sonucu verecek sıkıştırılmamış 8 bit RGB TIFF dosyaları bellek eşlemeyle
+    kopyasız açılır; diğer TIFF'ler (palet, RGBA, 16 bit vb.) cv2.imread ile
+    çözülür. Önbellekten veya eşlemeden gelen dizi salt okunurdur; değiştirilecekse
+    kopyası alınmalıdır.
+    
+    tek_duzlem True ise üç kanalı birbirinin aynı olan (3 kanallı kaydedilmiş gri)
+    görüntüler tek düzlemli (2 boyutlu) dizi olarak döndürülür; işlemler üç yerine
+    tek düzlem üzerinde çalışır ve önbellekte üçte bir yer kaplar. Bellek eşlemeyle
+    açılan dosyalar kopyalanmamak için olduğu gibi bırakılır.
+    
     Args:
         dosya_yolu (str): Yüklenecek görüntünün dosya yolu
+        olcek (int, optional): Küçültme oranı (1, 2, 4 veya 8). 1'den büyükse görüntü
+                               1/olcek çözünürlükte çözülür. Varsayılan 1.
+        gri (bool, optional): True ise gri tonlamalı okunur. Varsayılan False.
+        onbellek (bool, optional): False ise önbellek kullanılmaz. Varsayılan True.
+        tek_duzlem (bool, optional): True ise sözde renkli görüntüler tek düzleme
+                                     indirilir. Varsayılan False.
         
     Returns:
         numpy.ndarray: Yüklenen görüntü, hata durumunda None
     """
     try:
+        # NumPy ve sıkıştırılmamış TIFF dosyaları çözülmeden, bellek eşlemeyle açılır
+        uzanti = os.path.splitext(dosya_yolu)[1].lower()
+        if olcek == 1 and not gri and uzanti in _ESLENEBILIR_UZANTILAR:
+            # TIFF yalnızca cv2.imread ile birebir aynı sonucu verecekse eşlenir
+            img = goruntu_esle(dosya_yolu) if uzanti == ".npy" else _tiff_esle(dosya_yolu, imread_uyumlu=True, tek_duzlem=tek_duzlem)
+            if img is not None:
+                return img
+        
+        bayrak = _okuma_bayragi(olcek, gri)
+        anahtar = CozumOnbellegi.anahtar(dosya_yolu, _onbellek_bayragi(bayrak, tek_duzlem)) if onbellek else None
+        if anahtar is not None:
+            img = cozum_onbellegi.al(anahtar)
+            if img is not None:
+                return img
+        
         # Resmi oku
-        img = cv2.imread(dosya_yolu)
+        img = cv2.imread(dosya_yolu, bayrak)
         if img is None:
             print("Hata: Resim dosyası yüklenemedi! Dosya formatı desteklenmiyor olabilir.")
             return None
         
+        if tek_duzlem and not gri:
+            img = tek_duzleme_indir(img)
+        
+        if anahtar is not None:
+            cozum_onbellegi.ekle(anahtar, img)
         return img
     
     except Exception as e:
         print(f"Hata: Resim yüklenirken bir hata oluştu: {str(e)}")
         return None
 
+def _tiff_etiketleri(dosya):
+    """Klasik TIFF dosyasının ilk IFD'sindeki sayısal etiketleri okur; TIFF değilse None"""
+    baslik = dosya.read(8)
+    if baslik[:4] == b"II*\x00":
+        sira = "<"
+    elif baslik[:4] == b"MM\x00*":
+        sira = ">"
+    else:
+        return None, None
+    
+    ifd = struct.unpack(sira + "I", baslik[4:8])[0]
+    dosya.seek(ifd)
+    adet = struct.unpack(sira + "H", dosya.read(2))[0]
+    girdiler = dosya.read(12 * adet)
+    
+    etiketler = {}
+    for i in range(adet):
+        etiket, tur, sayi = struct.unpack(sira + "HHI", girdiler[12 * i:12 * i + 8])
+        if tur not in _TIFF_TURLERI:
+            continue
+        bicim, boyut = _TIFF_TURLERI[tur]
+        ham = girdiler[12 * i + 8:12 * i + 12]
+        if sayi * boyut > 4:
+            # Değer 4 bayta sığmıyorsa alan, değerlerin dosyadaki konumunu tutar
+            konum = dosya.tell()
+            dosya.seek(struct.unpack(sira + "I", ham)[0])
+            ham = dosya.read(sayi * boyut)
+            dosya.seek(konum)
+        etiketler[etiket] = struct.unpack(sira + bicim * sayi, ham[:sayi * boyut])
+    return etiketler, sira
+
+def _tiff_esle(dosya_yolu, imread_uyumlu=False, tek_duzlem=False):
+    """
+    Sıkıştırılmamış, şerit (strip) düzenli ve şeritleri ardışık TIFF dosyasını bellek
+    eşlemeyle açar. Eşlenemeyen (sıkıştırılmış, karo düzenli vb.) dosyalarda None döndürür.
+    
+    imread_uyumlu True ise yalnızca cv2.imread(IMREAD_COLOR) ile birebir aynı diziyi
+    verecek dosyalar eşlenir: 8 bit, yönlendirmesiz, 3 örnekli RGB (BGR görünüm olarak)
+    ve tek_duzlem True ise tek örnekli gri (imread + tek_duzleme_indir sonucu). Palet,
+    RGBA, 16 bit gibi diğer dosyalarda None döner ve çağıran cv2.imread'e düşer.
+    """
+    with open(dosya_yolu, "rb") as dosya:
+        etiketler, sira = _tiff_etiketleri(dosya)
+    if etiketler is None:
+        return None
+    
+    if etiketler.get(_TIFF_SIKISTIRMA, (1,))[0] != 1 or _TIFF_KARO_GENISLIGI in etiketler:
+        return None
+    if etiketler.get(_TIFF_DUZLEM, (1,))[0] != 1:
+        return None
+    
+    if imread_uyumlu:
+        fotometrik = etiketler.get(_TIFF_FOTOMETRIK, (-1,))[0]
+        ornek = etiketler.get(_TIFF_ORNEK_SAYISI, (1,))[0]
+        uyumlu = (fotometrik == _TIFF_RGB and ornek == 3) or \
+                 (tek_duzlem and fotometrik == _TIFF_SIYAH_SIFIR and ornek == 1)
+        if not uyumlu or _TIFF_EK_ORNEKLER in etiketler:
+            return None
+        if set(etiketler.get(_TIFF_BIT_SAYISI, (1,))) != {8} or etiketler.get(_TIFF_ORNEK_BICIMI, (1,))[0] != 1:
+            return None
+        if etiketler.get(_TIFF_YONLENDIRME, (1,))[0] != 1:
+            return None
+    
+    genislik = etiketler[_TIFF_GENISLIK][0]
+    yukseklik = etiketler[_TIFF_YUKSEKLIK][0]
+    kanal = etiketler.get(_TIFF_ORNEK_SAYISI, (1,))[0]
+    bitler = set(etiketler.get(_TIFF_BIT_SAYISI, (1,)))
+    bicim = etiketler.get(_TIFF_ORNEK_BICIMI, (1,))[0]
+    if len(bitler) != 1:
+        return None
+    bit = bitler.pop()
+    
+    turler = {(1, 8): "u1", (1, 16): "u2", (1, 32): "u4", (2, 8): "i1", (2, 16): "i2",
+              (2, 32): "i4", (3, 32): "f4", (3, 64): "f8"}
+    if (bicim, bit) not in turler:
+        return None
+    dtype = np.dtype(sira + turler[(bicim, bit)])
+    
+    # Veri tek parça halinde eşlenebilmesi için şeritler art arda olmalıdır
+    ofsetler = etiketler[_TIFF_SERIT_OFSETLERI]
+    baytlar = etiketler.get(_TIFF_SERIT_BAYTLARI)
+    beklenen = genislik * yukseklik * kanal * dtype.itemsize
+    if baytlar is not None:
+        if sum(baytlar) < beklenen:
+            return None
+        for i in range(len(ofsetler) - 1):
+            if ofsetler[i] + baytlar[i] != ofsetler[i + 1]:
+                return None
+    
+    sekil = (yukseklik, genislik, kanal) if kanal > 1 else (yukseklik, genislik)
+    img = np.asarray(np.memmap(dosya_yolu, dtype=dtype, mode="r", offset=ofsetler[0], shape=sekil))
+    
+    # TIFF RGB sırasındadır; kopya oluşturmadan ters adımlı görünümle BGR sırasına çevrilir.
+    # 4 kanallı (RGBA) veride yeniden sıralama kopya gerektireceği için sıra korunur.
+    if kanal == 3:
+        img = img[:, :, ::-1]
+    return img
+
+def goruntu_esle(dosya_yolu, sekil=None, dtype=np.uint8, ofset=0):
+    """
+    Görüntü dosyasını kopyalamadan, bellek eşleme (memory map) ile salt okunur olarak açar.
+    
+    Veri diske eşlenir; yalnızca erişilen sayfalar belleğe yüklenir. Bu sayede
+    çok büyük (GB boyutunda) görüntüler anında açılır. Desteklenen biçimler:
+        - .npy: NumPy dizi dosyası
+        - .tif/.tiff: Sıkıştırılmamış, ardışık şeritli TIFF (RGB verisi BGR görünüm olarak döner)
+        - Diğer uzantılar: Ham (raw) ikili veri; sekil verilmelidir
+    
+    Args:
+        dosya_yolu (str): Görüntünün dosya yolu
+        sekil (tuple, optional): Ham veri için (yükseklik, genişlik[, kanal]). Varsayılan None.
+        dtype (numpy.dtype, optional): Ham veri türü. Varsayılan np.uint8.
+        ofset (int, optional): Ham veride başlık atlanacak bayt sayısı. Varsayılan 0.
+        
+    Returns:
+        numpy.ndarray: Dosyaya eşlenmiş salt okunur görüntü, eşlenemiyorsa None
+    """
+    try:
+        uzanti = os.path.splitext(dosya_yolu)[1].lower()
+        
+        if uzanti == ".npy":
+            return np.asarray(np.load(dosya_yolu, mmap_mode="r"))
+        
+        if uzanti in (".tif", ".tiff"):
+            img = _tiff_esle(dosya_yolu)
+            if img is None:
+                print("Uyarı: TIFF dosyası sıkıştırılmış veya parçalı olduğu için eşlenemedi.")
+            return img
+        
+        if sekil is None:
+            print("Hata: Ham (raw) veri için görüntü şekli belirtilmelidir!")
+            return None
+        
+        return np.asarray(np.memmap(dosya_yolu, dtype=dtype, mode="r", offset=ofset, shape=tuple(sekil)))
+        
+    except Exception as e:
+        print(f"Hata: Görüntü bellek eşleme ile açılırken bir hata oluştu: {str(e)}")
+        return None
+
+def onbellekte_var(dosya_yolu, olcek=1, gri=False, tek_duzlem=False):
+    """Görüntünün çözülmüş hali önbellekte varsa True döndürür"""
+    anahtar = CozumOnbellegi.anahtar(dosya_yolu, _onbellek_bayragi(_okuma_bayragi(olcek, gri), tek_duzlem))
+    return anahtar is not None and cozum_onbellegi.iceriyor(anahtar)
+
+def onizleme_destekleniyor(dosya_yolu):
+    """Dosyanın küçültülmüş çözme ile hızlı önizlenebilir (JPEG) olup olmadığını döndürür"""
+    return os.path.splitext(dosya_yolu)[1].lower() in _ONIZLEME_UZANTILARI
+
+def onizleme_oku(dosya_yolu, hedef_genislik=800, hedef_yukseklik=600):
+    """
+    JPEG dosyasını hedef alanı dolduracak en küçük çözünürlükte hızlıca çözer.
+    
+    Önce 1/8 ölçekte çözülerek tam boyut öğrenilir; bu boyut hedefe yetmiyorsa
+    hedefi karşılayan en küçük ölçekte (1/4 veya 1/2) yeniden çözülür.
+    
+    Args:
+        dosya_yolu (str): Görüntünün dosya yolu
+        hedef_genislik (int, optional): Önizleme alanının genişliği. Varsayılan 800.
+        hedef_yukseklik (int, optional): Önizleme alanının yüksekliği. Varsayılan 600.
+        
+    Returns:
+        tuple: (önizleme görüntüsü, ölçek), desteklenmeyen biçimde veya hata durumunda (None, 1)
+    """
+    if not onizleme_destekleniyor(dosya_yolu):
+        return None, 1
+    
+    try:
+        onizleme = cv2.imread(dosya_yolu, cv2.IMREAD_REDUCED_COLOR_8)
+        if onizleme is None:
+            return None, 1
+        
+        h, w = onizleme.shape[:2]
+        for olcek in (8, 4, 2):
+            # Yaklaşık tam boyut / olcek hedef alanı karşılıyorsa bu ölçek yeterli
+            if (w * 8) // olcek >= hedef_genislik or (h * 8) // olcek >= hedef_yukseklik:
+                if olcek != 8:
+                    onizleme = cv2.imread(dosya_yolu, _KUCULTULMUS_OKUMA[olcek][0])
+                return onizleme, olcek
+        
+        # Görüntü hedef alandan küçükse önizleme yerine tam çözme yeterli
+        return None, 1
+        
+    except Exception as e:
+        print(f"Hata: Önizleme yüklenirken bir hata oluştu: {str(e)}")
+        return None, 1
+
+def goruntu_oku_arka_plan(dosya_yolu, tek_duzlem=False):
+    """
+    Görüntüyü arka planda tam çözünürlükte okur
+    
+    Args:
+        dosya_yolu (str): Yüklenecek görüntünün dosya yolu
+        tek_duzlem (bool, optional): goruntu_oku ile aynı anlamda. Varsayılan False.
+        
+    Returns:
+        concurrent.futures.Future: Sonucu goruntu_oku çıktısı olan iş
+    """
+    global _okuma_havuzu
+    if _okuma_havuzu is None:
+        _okuma_havuzu = ThreadPoolExecutor(max_workers=2)
+    return _okuma_havuzu.submit(goruntu_oku, dosya_yolu, tek_duzlem=tek_duzlem)
+
+def _jpeg_basligi(dosya):
+    """JPEG dosyasının SOF bölümünden (yükseklik, genişlik, kanal) okur"""
+    if dosya.read(2) != b"\xff\xd8":
+        return None
+    while True:
+        bayt = dosya.read(1)
+        if not bayt:
+            return None
+        if bayt != b"\xff":
+            continue
+        isaret = dosya.read(1)
+        while isaret == b"\xff":
+            isaret = dosya.read(1)
+        if not isaret:
+            return None
+        kod = isaret[0]
+        # Uzunluk alanı olmayan işaretler
+        if kod == 0x01 or 0xD0 <= kod <= 0xD9:
+            continue
+        uzunluk = struct.unpack(">H", dosya.read(2))[0]
+        # SOF0-SOF15 (DHT, JPG ve DAC hariç) görüntü boyutlarını içerir
+        if 0xC0 <= kod <= 0xCF and kod not in (0xC4, 0xC8, 0xCC):
+            _, yukseklik, genislik, kanal = struct.unpack(">BHHB", dosya.read(6))
+            return yukseklik, genislik, kanal
+        dosya.seek(uzunluk - 2, os.SEEK_CUR)
+
+def goruntu_basligi_oku(dosya_yolu):
+    """
+    Görüntünün boyutlarını ve kanal sayısını yalnızca dosya başlığından, görüntüyü
+    çözmeden okur. JPEG, PNG, BMP, TIFF ve NPY biçimleri desteklenir.
+    
+    Args:
+        dosya_yolu (str): Görüntünün dosya yolu
+        
+    Returns:
+        dict: {"genislik", "yukseklik", "kanal", "bicim"}, okunamazsa None
+    """
+    try:
+        with open(dosya_yolu, "rb") as dosya:
+            imza = dosya.read(8)
+            dosya.seek(0)
+            
+            if imza.startswith(b"\xff\xd8"):
+                sonuc = _jpeg_basligi(dosya)
+                if sonuc is None:
+                    return None
+                yukseklik, genislik, kanal = sonuc
+                bicim = "JPEG"
+            elif imza == b"\x89PNG\r\n\x1a\n":
+                dosya.seek(16)
+                genislik, yukseklik, _, renk_tipi = struct.unpack(">IIBB", dosya.read(10))
+                kanal = {0: 1, 2: 3, 3: 3, 4: 2, 6: 4}.get(renk_tipi, 3)
+                bicim = "PNG"
+            elif imza.startswith(b"BM"):
+                dosya.seek(18)
+                genislik, yukseklik, _, bit = struct.unpack("<iiHH", dosya.read(12))
+                yukseklik = abs(yukseklik)
+                kanal = max(bit // 8, 1) if bit > 8 else 3
+                bicim = "BMP"
+            elif imza[:4] in (b"II*\x00", b"MM\x00*"):
+                etiketler, _ = _tiff_etiketleri(dosya)
+                genislik = etiketler[_TIFF_GENISLIK][0]
+                yukseklik = etiketler[_TIFF_YUKSEKLIK][0]
+                kanal = etiketler.get(_TIFF_ORNEK_SAYISI, (1,))[0]
+                bicim = "TIFF"
+            elif imza.startswith(b"\x93NUMPY"):
+                surum = np.lib.format.read_magic(dosya)
+                if surum == (1, 0):
+                    sekil, _, _ = np.lib.format.read_array_header_1_0(dosya)
+                else:
+                    sekil, _, _ = np.lib.format.read_array_header_2_0(dosya)
+                yukseklik, genislik = sekil[:2]
+                kanal = sekil[2] if len(sekil) > 2 else 1
+                bicim = "NPY"
+            else:
+                return None
+        
+        return {"genislik": int(genislik), "yukseklik": int(yukseklik), "kanal": int(kanal), "bicim": bicim}
+        
+    except Exception as e:
+        print(f"Hata: Görüntü başlığı okunurken bir hata oluştu: {str(e)}")
+        return None
+
+def klasordeki_goruntuler(klasor):
+    """Klasördeki desteklenen görüntü dosyalarının yollarını ada göre sıralı döndürür"""
+    try:
+        return sorted(
+            os.path.join(klasor, ad) for ad in os.listdir(klasor)
+            if ad.lower().endswith(GORUNTU_UZANTILARI) and os.path.isfile(os.path.join(klasor, ad))
+        )
+    except OSError as e:
+        print(f"Hata: Klasör okunurken bir hata oluştu: {str(e)}")
+        return []
+
+class KucukResimOnbellegi:
+    """
+    Küçük resimleri (thumbnail) diskte, dosya içeriğinin özetiyle (hash) adlandırarak saklayan sınıf.
+    
+    İçerik özeti aynı görüntünün farklı yol veya adla bulunması durumunda da
+    küçük resmin yeniden kullanılmasını sağlar. Her dosyanın özetini yeniden
+    hesaplamamak için (yol, değişiklik zamanı, boyut) -> özet eşlemesi dizindeki
+    bir indeks dosyasında tutulur; böylece daha önce gezilen bir klasör yalnızca
+    dosya bilgisi okunarak açılır.
+    
+    Örnek:
+        onbellek = KucukResimOnbellegi()
+        baslik, kucuk = onbellek.al("foto.jpg")
+    """
+    def __init__(self, dizin=_KUCUK_RESIM_DIZINI, boyut=128):
+        self.dizin = dizin
+        self.boyut = boyut
+        self._kilit = threading.Lock()
+        self._indeks_yolu = os.path.join(dizin, "indeks.json")
+        self._indeks_degisti = False
+        os.makedirs(dizin, exist_ok=True)
+        try:
+            with open(self._indeks_yolu, "r", encoding="utf-8") as dosya:
+                self._indeks = json.load(dosya)
+        except (OSError, ValueError):
+            self._indeks = {}
+
+    def _icerik_ozeti(self, dosya_yolu):
+        """Dosya içeriğinin BLAKE2 özetini döndürür; önceden hesaplanmışsa indeksten alır"""
+        bilgi = os.stat(dosya_yolu)
+        indeks_anahtari = f"{os.path.abspath(dosya_yolu)}|{bilgi.st_mtime_ns}|{bilgi.st_size}"
+        with self._kilit:
+            kayit = self._indeks.get(indeks_anahtari)
+        if kayit is not None:
+            return kayit["ozet"], kayit.get("baslik")
+        
+        ozet = hashlib.blake2b(digest_size=16)
+        with open(dosya_yolu, "rb") as dosya:
+            for parca in iter(lambda: dosya.read(1024 * 1024), b""):
+                ozet.update(parca)
+        ozet = ozet.hexdigest()
+        
+        baslik = goruntu_basligi_oku(dosya_yolu)
+        with self._kilit:
+            self._indeks[indeks_anahtari] = {"ozet": ozet, "baslik": baslik}
+            self._indeks_degisti = True
+        return ozet, baslik
+
+    def _kucuk_resim_yolu(self, ozet):
+        """Özete karşılık gelen küçük resim dosyasının yolu"""
+        return os.path.join(self.dizin, f"{ozet}_{self.boyut}.jpg")
+
+    def _olustur(self, dosya_yolu, baslik):
+        """Görüntüyü çözerek küçük resmi oluşturur; JPEG'lerde küçültülmüş çözme kullanılır"""
+        olcek = 1
+        if baslik is not None and onizleme_destekleniyor(dosya_yolu):
+            en_buyuk = max(baslik["genislik"], baslik["yukseklik"])
+            for aday in (8, 4, 2):
+                if en_buyuk // aday >= self.boyut:
+                    olcek = aday
+                    break
+        
+        img = goruntu_oku(dosya_yolu, olcek=olcek, onbellek=False)
+        if img is None:
+            return None
+        if img.dtype != np.uint8:
+            img = cv2.normalize(img, None, 0, 255, cv2.NORM_MINMAX, dtype=cv2.CV_8U)
+        
+        h, w = img.shape[:2]
+        oran = self.boyut / max(h, w)
+        if oran < 1.0:
+            img = cv2.resize(img, (max(int(w * oran), 1), max(int(h * oran), 1)), interpolation=cv2.INTER_AREA)
+        return np.ascontiguousarray(img)
+
+    def al(self, dosya_yolu):
+        """
+        Dosyanın başlık bilgisini ve küçük resmini döndürür; küçük resim diskte yoksa oluşturup saklar
+        
+        Args:
+            dosya_yolu (str): Görüntünün dosya yolu
+            
+        Returns:
+            tuple: (başlık sözlüğü, küçük resim), hata durumunda (None, None)
+        """
+        try:
+            ozet, baslik = self._icerik_ozeti(dosya_yolu)
+            yol = self._kucuk_resim_yolu(ozet)
+            
+            kucuk = cv2.imread(yol, cv2.IMREAD_COLOR) if os.path.exists(yol) else None
+            if kucuk is None:
+                kucuk = self._olustur(dosya_yolu, baslik)
+                if kucuk is not None:
+                    cv2.imwrite(yol, kucuk, [cv2.IMWRITE_JPEG_QUALITY, 85])
+            return baslik, kucuk
+            
+        except Exception as e:
+            print(f"Hata: Küçük resim hazırlanırken bir hata oluştu: {str(e)}")
+            return None, None
+
+    def indeksi_kaydet(self):
+        """Özet indeksini diske yazar (yalnızca değişiklik varsa)"""
+        with self._kilit:
+            if not self._indeks_degisti:
+                return
+            veri = dict(self._indeks)
+            self._indeks_degisti = False
+        
+        gecici = self._indeks_yolu + ".tmp"
+        with open(gecici, "w", encoding="utf-8") as dosya:
+            json.dump(veri, dosya)
+        os.replace(gecici, self._indeks_yolu)
+
+def kucuk_resimleri_hazirla(dosya_yollari, onbellek):
+    """
+    Küçük resimleri iş parçacığı havuzunda paralel hazırlar
+    
+    Args:
+        dosya_yollari (list): Görüntü dosyalarının yolları
+        onbellek (KucukResimOnbellegi): Kullanılacak küçük resim önbelleği
+        
+    Returns:
+        list: Her dosya için (dosya_yolu, Future) çiftleri; Future sonucu onbellek.al çıktısıdır
+    """
+    global _kucuk_resim_havuzu
+    if _kucuk_resim_havuzu is None:
+        _kucuk_resim_havuzu = ThreadPoolExecutor(max_workers=os.cpu_count() or 4)
+    return [(yol, _kucuk_resim_havuzu.submit(onbellek.al, yol)) for yol in dosya_yollari]
+
+def kayit_parametreleri(profil, progresif=False):
+    """
+    Profilin dosya uzantısını ve cv2.imencode parametrelerini döndürür
+    
+    Args:
+        profil (str): KAYIT_PROFILLERI içindeki profil adı
+        progresif (bool, optional): JPEG profillerinde aşamalı (progressive) kodlama. Varsayılan False.
+        
+    Returns:
+        tuple: (uzantı, parametre listesi)
+    """
+    uzanti, parametreler, _ = KAYIT_PROFILLERI[profil]
+    parametreler = list(parametreler)
+    if progresif and uzanti == ".jpg":
+        parametreler += [cv2.IMWRITE_JPEG_PROGRESSIVE, 1]
+    return uzanti, parametreler
+
+def goruntu_kodla(img, profil="png_hizli", progresif=False):
+    """
+    Görüntüyü seçilen profille bellekte kodlar ve süresini ölçer
+    
+    Args:
+        img (numpy.ndarray): Kodlanacak görüntü
+        profil (str, optional): Kaydetme profili. Varsayılan "png_hizli".
+        progresif (bool, optional): JPEG için aşamalı kodlama. Varsayılan False.
+        
+    Returns:
+        tuple: (kodlanmış baytlar, süre (sn)), hata durumunda (None, 0.0)
+    """
+    try:
+        uzanti, parametreler = kayit_parametreleri(profil, progresif)
+        baslangic = time.perf_counter()
+        basarili, veri = cv2.imencode(uzanti, img, parametreler)
+        sure = time.perf_counter() - baslangic
+        if not basarili:
+            print("Hata: Görüntü kodlanamadı!")
+            return None, 0.0
+        return veri, sure
+        
+    except Exception as e:
+        print(f"Hata: Görüntü kodlanırken bir hata oluştu: {str(e)}")
+        return None, 0.0
+
+def profilleri_olc(img, progresif=False, ornek_piksel=250000):
+    """
+    Tüm kaydetme profilleriyle görüntüyü kodlayarak süre ve boyutları ölçer.
+    
+    Görüntü ornek_piksel değerinden büyükse ölçüm merkezden alınan bu büyüklükteki
+    bir örnek üzerinde yapılır ve sonuçlar piksel oranıyla ölçeklenir (tahmini).
+    Yüksek PNG sıkıştırma seviyeleri büyük görüntülerde dakikalar sürebileceği için
+    bu sınır ölçümün kısa kalmasını sağlar.
+    
+    Args:
+        img (numpy.ndarray): Ölçümde kullanılacak görüntü
+        progresif (bool, optional): JPEG profillerinde aşamalı kodlama. Varsayılan False.
+        ornek_piksel (int, optional): Ölçülecek en fazla piksel sayısı. None ise tüm görüntü. Varsayılan 250000.
+        
+    Returns:
+        list: Her profil için {"profil", "aciklama", "sure", "boyut", "tahmini"} sözlükleri
+    """
+    h, w = img.shape[:2]
+    oran = 1.0
+    ornek = img
+    if ornek_piksel is not None and h * w > ornek_piksel:
+        # En-boy oranını koruyarak merkezden örnek al
+        kucultme = (ornek_piksel / (h * w)) ** 0.5
+        oh, ow = max(int(h * kucultme), 1), max(int(w * kucultme), 1)
+        y0, x0 = (h - oh) // 2, (w - ow) // 2
+        ornek = img[y0:y0 + oh, x0:x0 + ow]
+        oran = (h * w) / (oh * ow)
+    
+    sonuclar = []
+    for profil, (_, _, aciklama) in KAYIT_PROFILLERI.items():
+        veri, sure = goruntu_kodla(ornek, profil, progresif)
+        sonuclar.append({
+            "profil": profil,
+            "aciklama": aciklama,
+            "sure": sure * oran,
+            "boyut": 0 if veri is None else int(veri.nbytes * oran),
+            "tahmini": oran > 1.0,
+        })
+    return sonuclar
+
+def baytlardan_oku(veri, olcek=1, gri=False):
+    """
+    Bellekteki kodlanmış görüntüyü (JPEG, PNG vb.) dosyaya yazmadan çözer.
+    
+    bytes, bytearray, memoryview veya uint8 numpy dizisi kabul edilir. Veri
+    kopyalanmadan np.frombuffer ile görüntülenir; bu nedenle başka bir servisin
+    önceden ayırdığı paylaşılan bir tamponun dilimi (memoryview) doğrudan verilebilir.
+    
+    Args:
+        veri (bytes-benzeri): Kodlanmış görüntü baytları
+        olcek (int, optional): Küçültme oranı (1, 2, 4 veya 8). Varsayılan 1.
+        gri (bool, optional): True ise gri tonlamalı çözülür. Varsayılan False.
+        
+    Returns:
+        numpy.ndarray: Çözülmüş görüntü, hata durumunda None
+    """
+    if veri is None:
+        print("Hata: Çözülecek veri yok!")
+        return None
+    
+    try:
+        tampon = np.frombuffer(veri, dtype=np.uint8)
+        img = cv2.imdecode(tampon, _okuma_bayragi(olcek, gri))
+        if img is None:
+            print("Hata: Görüntü verisi çözülemedi! Biçim desteklenmiyor olabilir.")
+            return None
+        return img
+        
+    except Exception as e:
+        print(f"Hata: Görüntü verisi çözülürken bir hata oluştu: {str(e)}")
+        return None
+
+def baytlara_kodla(img, profil="png_hizli", progresif=False, hedef=None):
+    """
+    Görüntüyü dosyaya yazmadan, seçilen kaydetme profiliyle bellekte kodlar.
+    
+    hedef verilmezse kodlanmış veri kopyalanmadan memoryview olarak döner.
+    Yazılabilir bir tampon (bytearray, memoryview, uint8 dizi) verilirse veri
+    bu tamponun başına yazılır ve yazılan bayt sayısı döner; böylece çağıran
+    taraf her istek için yeni bellek ayırmadan aynı tamponu kullanabilir.
+    
+    Args:
+        img (numpy.ndarray): Kodlanacak görüntü
+        profil (str, optional): KAYIT_PROFILLERI içindeki profil adı. Varsayılan "png_hizli".
+        progresif (bool, optional): JPEG için aşamalı kodlama. Varsayılan False.
+        hedef (bytes-benzeri, optional): Verinin yazılacağı yazılabilir tampon. Varsayılan None.
+        
+    Returns:
+        memoryview veya int: hedef yoksa kodlanmış veri, varsa yazılan bayt sayısı;
+                             hata durumunda None
+    """
+    if img is None:
+        print("Hata: Kodlanacak bir görüntü yok!")
+        return None
+    
+    veri, _ = goruntu_kodla(goruntu_al(img), profil, progresif)
+    if veri is None:
+        return None
+    
+    if hedef is None:
+        return memoryview(veri).cast("B")
+    
+    try:
+        hedef_dizi = np.frombuffer(hedef, dtype=np.uint8)
+        if veri.nbytes > hedef_dizi.nbytes:
+            print(f"Hata: Hedef tampon yetersiz! ({veri.nbytes} bayt gerekli, {hedef_dizi.nbytes} bayt var)")
+            return None
+        hedef_dizi[:veri.nbytes] = veri.ravel()
+        return veri.nbytes
+        
+    except Exception as e:
+        print(f"Hata: Kodlanmış veri tampona yazılırken bir hata oluştu: {str(e)}")
+        return None
+
+def baytlar_uzerinde_isle(veri, islem, *args, profil="png_hizli", progresif=False, hedef=None, **kwargs):
+    """
+    Kodlanmış görüntüyü çözer, verilen işlemi uygular ve sonucu yeniden kodlar.
+    Diske hiç yazılmadan bir Hafta fonksiyonunun bayt girdi/çıktı ile kullanılmasını sağlar.
+    
+    Örnek:
+        cikti = baytlar_uzerinde_isle(jpeg_baytlari, hafta5.gauss_filtre, 5, profil="jpeg_orta")
+    
+    Args:
+        veri (bytes-benzeri): Kodlanmış girdi görüntüsü
+        islem (callable): İlk argümanı görüntü olan ve görüntü döndüren fonksiyon
+        *args, **kwargs: islem fonksiyonuna aktarılacak ek argümanlar
+        profil (str, optional): Çıktı kaydetme profili. Varsayılan "png_hizli".
+        progresif (bool, optional): JPEG için aşamalı kodlama. Varsayılan False.
+        hedef (bytes-benzeri, optional): Çıktının yazılacağı tampon. Varsayılan None.
+        
+    Returns:
+        memoryview veya int: baytlara_kodla çıktısı, hata durumunda None
+    """
+    img = baytlardan_oku(veri)
+    if img is None:
+        return None
+    
+    sonuc = islem(img, *args, **kwargs)
+    if sonuc is None:
+        return None
+    return baytlara_kodla(sonuc, profil, progresif, hedef)
+
+class KayitKuyrugu:
+    """
+    Görüntüleri arka planda tek bir yazıcı iş parçacığıyla sırayla kodlayıp diske yazan sınıf.
+    
+    Kodlama ve yazma arayüz iş parçacığını bloklamaz. Her kayıt bittiğinde
+    geri_cagri yazıcı iş parçacığından {"dosya_yolu", "basarili", "sure",
+    "boyut", "hata"} sözlüğüyle çağrılır; Tkinter gibi iş parçacığı güvenli
+    olmayan arayüzlerde sonuç bir kuyruğa aktarılıp ana döngüden okunmalıdır.
+    Kuyruğa verilen görüntü yazma bitene kadar değiştirilmemelidir.
+    """
+    def __init__(self):
+        self._isler = queue.Queue()
+        self._is_parcacigi = threading.Thread(target=self._calis, name="KayitKuyrugu", daemon=True)
+        self._is_parcacigi.start()
+
+    def ekle(self, img, dosya_yolu, profil="png_hizli", progresif=False, geri_cagri=None):
+        """
+        Kaydetme işini kuyruğa ekler. Dosya uzantısı profile göre düzeltilir.
+        
+        Returns:
+            str: Görüntünün yazılacağı dosya yolu
+        """
+        uzanti = KAYIT_PROFILLERI[profil][0]
+        kok, mevcut = os.path.splitext(dosya_yolu)
+        if mevcut.lower() not in ((".jpg", ".jpeg") if uzanti == ".jpg" else (uzanti,)):
+            dosya_yolu = kok + uzanti
+        self._isler.put((img, dosya_yolu, profil, progresif, geri_cagri))
+        return dosya_yolu
+
+    def bekleyen(self):
+        """Kuyrukta bekleyen (henüz bitmemiş) iş sayısı"""
+        return self._isler.unfinished_tasks
+
+    def _calis(self):
+        while True:
+            img, dosya_yolu, profil, progresif, geri_cagri = self._isler.get()
+            sonuc = {"dosya_yolu": dosya_yolu, "basarili": False, "sure": 0.0, "boyut": 0, "hata": None}
+            try:
+                veri, sonuc["sure"] = goruntu_kodla(img, profil, progresif)
+                if veri is None:
+                    sonuc["hata"] = "Görüntü kodlanamadı"
+                else:
+                    # Baytlar doğrudan yazılır; Türkçe karakterli yollarda da sorun çıkmaz
+                    veri.tofile(dosya_yolu)
+                    sonuc["boyut"] = veri.nbytes
+                    sonuc["basarili"] = True
+            except Exception as e:
+                sonuc["hata"] = str(e)
+            finally:
+                self._isler.task_done()
+            
+            if geri_cagri is not None:
+                try:
+                    geri_cagri(sonuc)
+                except Exception as e:
+                    print(f"Hata: Kaydetme geri çağrısı çalışırken bir hata oluştu: {str(e)}")
+
+def goruntu_kaydet_arka_plan(img, dosya_yolu, profil="png_hizli", progresif=False, geri_cagri=None):
+    """
+    Görüntüyü modül genelindeki kayıt kuyruğu üzerinden arka planda kaydeder
+    
+    Args:
+        img (numpy.ndarray): Kaydedilecek görüntü
+        dosya_yolu (str): Hedef dosya yolu (uzantı profile göre düzeltilir)
+        profil (str, optional): Kaydetme profili. Varsayılan "png_hizli".
+        progresif (bool, optional): JPEG için aşamalı kodlama. Varsayılan False.
+        geri_cagri (callable, optional): Kayıt bitince sonuç sözlüğüyle çağrılır.
+        
+    Returns:
+        str: Görüntünün yazılacağı dosya yolu, hata durumunda None
+    """
+    if img is None:
+        print("Uyarı: Kaydedilecek bir görüntü yok!")
+        return None
+    
+    global _kayit_kuyrugu
+    if _kayit_kuyrugu is None:
+        _kayit_kuyrugu = KayitKuyrugu()
+    return _kayit_kuyrugu.ekle(img, dosya_yolu, profil, progresif, geri_cagri)
+
 def goruntu_kaydet(img, kalite=95):
     """
     Görüntüyü kullanıcının seçtiği konuma kaydeder
@@ -127,6 +1032,10 @@ def griye_cevir(img):
         return None
         
     try:
+        # Tek düzlemli görüntü zaten gri tonlamalıdır
+        if len(img.shape) == 2:
+            return img
+        
         # BGR'dan gri tonlamaya dönüştür
         gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
         return gray
@@ -135,6 +1044,187 @@ def griye_cevir(img):
         print(f"Hata: Gri tonlama işlemi uygulanırken bir hata oluştu: {str(e)}")
         return None
 
+class GoruntuTutamaci:
+    """
+    Yüklenen bir görüntüyü ve ondan türetilen gösterimleri (gri, YCrCb, HSV,
+    float32, 0-1 aralığına normalize edilmiş) birlikte tutan sınıf.
+    
+    Türetilmiş gösterimler ilk istendiklerinde hesaplanır ve saklanır; art arda
+    uygulanan filtreler aynı dönüşümü tekrar yapmaz. Saklanan diziler
+    paylaşıldığı için salt okunur işaretlenir. Piksel değerleri değiştiğinde
+    guncelle() çağrılmalıdır; bu çağrı sürüm numarasını artırır ve saklanan
+    gösterimleri geçersiz kılar.
+    
+    Örnek:
+        tutamac = GoruntuTutamaci(img)
+        gri = tutamac.gri()          # Hesaplanır
+        gri = tutamac.gri()          # Saklanandan döner
+        tutamac.guncelle(yeni_img)   # Türetilmiş gösterimler silinir
+    """
+    def __init__(self, img):
+        self.goruntu = img
+        self.surum = 0
+        self._turevler = {}
+
+    @property
+    def shape(self):
+        """Kaynak görüntünün boyutları"""
+        return self.goruntu.shape
+
+    def guncelle(self, img=None):
+        """
+        Görüntü değiştiğinde saklanan gösterimleri geçersiz kılar
+        
+        Args:
+            img (numpy.ndarray, optional): Yeni görüntü. Verilmezse mevcut görüntünün
+                                          yerinde değiştirildiği kabul edilir.
+        """
+        if img is not None:
+            self.goruntu = img
+        self.surum += 1
+        self._turevler.clear()
+
+    def _turev(self, ad, hesapla):
+        """Adı verilen gösterimi saklanandan döndürür veya hesaplayıp saklar"""
+        sonuc = self._turevler.get(ad)
+        if sonuc is None:
+            sonuc = hesapla()
+            if sonuc is not self.goruntu:
+                sonuc.flags.writeable = False
+            self._turevler[ad] = sonuc
+        return sonuc
+
+    def _bgr(self):
+        """Renk uzayı dönüşümleri için 3 kanallı görüntü"""
+        if len(self.goruntu.shape) == 2:
+            return cv2.cvtColor(self.goruntu, cv2.COLOR_GRAY2BGR)
+        return self.goruntu
+
+    def gri(self):
+        """Gri tonlamalı gösterim (görüntü zaten gri ise kendisi)"""
+        if len(self.goruntu.shape) == 2:
+            return self.goruntu
+        return self._turev("gri", lambda: cv2.cvtColor(self.goruntu, cv2.COLOR_BGR2GRAY))
+
+    def ycrcb(self):
+        """YCrCb renk uzayındaki gösterim"""
+        return self._turev("ycrcb", lambda: cv2.cvtColor(self._bgr(), cv2.COLOR_BGR2YCrCb))
+
+    def hsv(self):
+        """HSV renk uzayındaki gösterim"""
+        return self._turev("hsv", lambda: cv2.cvtColor(self._bgr(), cv2.COLOR_BGR2HSV))
+
+    def float32(self):
+        """float32 türündeki gösterim (değer aralığı korunur)"""
+        return self._turev("float32", lambda: self.goruntu.astype(np.float32))
+
+    def normalize(self):
+        """0-1 aralığına ölçeklenmiş float32 gösterim"""
+        return self._turev("normalize", lambda: self.float32() * np.float32(1.0 / 255.0))
+
+def goruntu_al(img):
+    """
+    GoruntuTutamaci veya doğrudan numpy dizisi olarak verilen görüntünün dizisini döndürür
+    
+    Args:
+        img (numpy.ndarray veya GoruntuTutamaci): Görüntü
+        
+    Returns:
+        numpy.ndarray: Görüntü dizisi
+    """
+    if isinstance(img, GoruntuTutamaci):
+        return img.goruntu
+    return img
+
+def gri_al(img):
+    """
+    Görüntünün gri tonlamalı halini kopya oluşturmadan döndürür.
+    
+    Tutamaç verilirse saklanan gri gösterim kullanılır. Dönen dizi kaynak
+    görüntünün kendisi veya paylaşılan bir dizi olabileceği için yerinde
+    değiştirilmemelidir.
+    
+    Args:
+        img (numpy.ndarray veya GoruntuTutamaci): Görüntü
+        
+    Returns:
+        numpy.ndarray: Gri tonlamalı görüntü
+    """
+    if isinstance(img, GoruntuTutamaci):
+        return img.gri()
+    if len(img.shape) > 2:
+        return cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+    return img
+
+def sozde_renkli_mi(img, ornek_sayisi=4096):
+    """
+    Görüntünün üç kanalı birbirinin aynı olan sözde renkli (3 kanallı kaydedilmiş
+    gri) bir görüntü olup olmadığını denetler.
+    
+    Önce seyrek bir ızgaradan alınan örnek pikseller karşılaştırılır; renkli
+    görüntülerin neredeyse tamamı bu aşamada elenir. Örnekler eşitse karar
+    tüm görüntü satır blokları halinde taranarak kesinleştirilir; böylece
+    yanlışlıkla tek düzleme indirilen renkli görüntü olmaz.
+    
+    Args:
+        img (numpy.ndarray): Denetlenecek görüntü
+        ornek_sayisi (int, optional): Ön denetimde bakılacak yaklaşık piksel sayısı. Varsayılan 4096.
+        
+    Returns:
+        bool: Üç kanal da aynıysa True
+    """
+    img = goruntu_al(img)
+    if img is None or img.ndim != 3 or img.shape[2] != 3:
+        return False
+    
+    h, w = img.shape[:2]
+    adim = max(1, int(np.sqrt(h * w / max(1, ornek_sayisi))))
+    ornek = img[::adim, ::adim]
+    if not (np.array_equal(ornek[:, :, 0], ornek[:, :, 1]) and
+            np.array_equal(ornek[:, :, 0], ornek[:, :, 2])):
+        return False
+    
+    # Önbelleğe sığan satır blokları halinde tam denetim; ilk farkta durulur
+    blok = max(1, (1 << 20) // max(1, w))
+    for y in range(0, h, blok):
+        b, g, r = cv2.split(img[y:y + blok])
+        if cv2.countNonZero(cv2.bitwise_or(cv2.bitwise_xor(b, g), cv2.bitwise_xor(b, r))):
+            return False
+    return True
+
+def tek_duzleme_indir(img):
+    """
+    Sözde renkli görüntüyü tek düzlemli (2 boyutlu) gri görüntüye indirir.
+    
+    Gerçek renkli veya zaten tek düzlemli görüntüler olduğu gibi döndürülür.
+    Gösterim veya renkli işlem gerektiğinde üç kanala uc_kanala_genislet ile
+    dönülebilir.
+    
+    Args:
+        img (numpy.ndarray): Görüntü
+        
+    Returns:
+        numpy.ndarray: Tek düzlemli veya değiştirilmemiş görüntü
+    """
+    if sozde_renkli_mi(img):
+        return np.ascontiguousarray(img[:, :, 0])
+    return img
+
+def uc_kanala_genislet(img):
+    """
+    Tek düzlemli görüntüyü 3 kanallı BGR görüntüye genişletir; 3 kanallı
+    görüntüler olduğu gibi döndürülür.
+    
+    Args:
+        img (numpy.ndarray): Görüntü
+        
+    Returns:
+        numpy.ndarray: 3 kanallı görüntü
+    """
+    if len(img.shape) == 2:
+        return cv2.cvtColor(img, cv2.COLOR_GRAY2BGR)
+    return img
+
 def negatif_al(img):
     """
     Görüntünün negatifini alır
@@ -158,9 +1248,19 @@ def negatif_al(img):
         print(f"Hata: Negatif işlemi uygulanırken bir hata oluştu: {str(e)}")
         return None
 
+# Kanal adı/numarası -> BGR kanal indeksi
+_KANAL_INDEKSLERI = {"blue": 0, "green": 1, "red": 2, 0: 0, 1: 1, 2: 2}
+
+# Tek kanalı koruyup diğerlerini sıfırlayan bit maskeleri (cv2 Scalar biçiminde)
+_KANAL_MASKELERI = ((255, 0, 0, 0), (0, 255, 0, 0), (0, 0, 255, 0))
+
 def kanallara_ayir(img):
     """
-    Görüntüyü R, G, B kanallarına ayırır
+    Görüntüyü R, G, B kanallarına ayırır.
+    
+    Kanallar kopyalanmadan, kaynak görüntü üzerinde adımlı (strided) görünümler
+    olarak döndürülür. Görünümler kaynakla belleği paylaştığı için değiştirilmeleri
+    gerekiyorsa önce kopyaları alınmalıdır.
     
     Args:
         img (numpy.ndarray): İşlenecek BGR görüntüsü
@@ -174,21 +1274,37 @@ def kanallara_ayir(img):
         return None, None, None
         
     try:
+        img = goruntu_al(img)
+        # Tek düzlemli görüntünün üç kanalı da aynı düzlemdir
+        if len(img.shape) == 2:
+            return img, img, img
+        
         # Görüntüyü ayrı kanallara ayır
-        b, g, r = cv2.split(img)
+        b, g, r = img[:, :, 0], img[:, :, 1], img[:, :, 2]
         return b, g, r
         
     except Exception as e:
         print(f"Hata: Kanal ayırma işlemi uygulanırken bir hata oluştu: {str(e)}")
         return None, None, None
 
-def kanali_goster(img, kanal):
+def _kanal_indeksi(kanal):
+    """'blue'/'green'/'red' veya 0/1/2 biçimindeki kanal seçimini indekse çevirir; geçersizse None"""
+    if isinstance(kanal, str):
+        kanal = kanal.lower()
+    return _KANAL_INDEKSLERI.get(kanal)
+
+def kanali_goster(img, kanal, hedef=None):
     """
     Belirli bir renk kanalını görselleştirir (B, G veya R)
     
+    Sonuç, seçilen kanalı koruyup diğerlerini sıfırlayan tek bir bit maskesi (AND)
+    işlemiyle üretilir; kanallara ayırma ve birleştirme için ara diziler oluşturulmaz.
+    
     Args:
         img (numpy.ndarray): İşlenecek görüntü
         kanal (str): 'blue', 'green' veya 'red' olarak kanal seçimi
+        hedef (numpy.ndarray, optional): Sonucun yazılacağı, görüntüyle aynı boyut ve
+                                         türde tampon. Verilirse yeni bellek ayrılmaz.
         
     Returns:
         numpy.ndarray: Belirtilen kanalı içeren görüntü, hata durumunda None
@@ -198,26 +1314,70 @@ def kanali_goster(img, kanal):
         return None
         
     try:
-        # Görüntüyü ayrı kanallara ayır
-        b, g, r = cv2.split(img)
-        zeros = np.zeros_like(b)
-        
-        if kanal.lower() == 'blue' or kanal == 0:
-            result = cv2.merge([b, zeros, zeros])
-        elif kanal.lower() == 'green' or kanal == 1:
-            result = cv2.merge([zeros, g, zeros])
-        elif kanal.lower() == 'red' or kanal == 2:
-            result = cv2.merge([zeros, zeros, r])
-        else:
+        img = uc_kanala_genislet(goruntu_al(img))
+        indeks = _kanal_indeksi(kanal)
+        if indeks is None:
             print("Hata: Geçersiz kanal seçimi! (blue, green veya red olmalı)")
             return None
-            
+        
+        if img.ndim != 3 or img.dtype != np.uint8:
+            print("Hata: Kanal gösterimi için 8 bit BGR görüntü gerekli!")
+            return None
+        
+        if hedef is None or hedef.shape != img.shape or hedef.dtype != img.dtype:
+            hedef = np.empty_like(img)
+        
+        result = cv2.bitwise_and(img, _KANAL_MASKELERI[indeks], dst=hedef)
         return result
         
     except Exception as e:
         print(f"Hata: Renk kanalı işlemi uygulanırken bir hata oluştu: {str(e)}")
         return None
 
+def kanal_mozaigi(img, hedef=None):
+    """
+    Kırmızı, yeşil, mavi kanalları ve gri tonlamalı hali 2x2 düzende tek bir
+    mozaik görüntüde birleştirir:
+    
+        [ Kırmızı | Yeşil ]
+        [ Mavi    | Gri   ]
+    
+    Her çeyrek doğrudan mozaik tamponuna yazılır; ara kanal görüntüleri oluşturulmaz.
+    
+    Args:
+        img (numpy.ndarray): BGR görüntü
+        hedef (numpy.ndarray, optional): (2*yükseklik, 2*genişlik, 3) boyutlu, yeniden
+                                         kullanılacak mozaik tamponu. Varsayılan None.
+        
+    Returns:
+        numpy.ndarray: Mozaik görüntü, hata durumunda None
+    """
+    if img is None:
+        print("Hata: İşlem yapılacak bir görüntü yok!")
+        return None
+    
+    try:
+        gri = gri_al(img)
+        img = uc_kanala_genislet(goruntu_al(img))
+        if img.ndim != 3 or img.dtype != np.uint8:
+            print("Hata: Kanal mozaiği için 8 bit BGR görüntü gerekli!")
+            return None
+        h, w = img.shape[:2]
+        
+        if hedef is None or hedef.shape != (2 * h, 2 * w, 3) or hedef.dtype != img.dtype:
+            hedef = np.empty((2 * h, 2 * w, 3), dtype=img.dtype)
+        
+        # Çeyrek görünümlerine doğrudan yaz
+        for (y, x), indeks in (((0, 0), 2), ((0, w), 1), ((h, 0), 0)):
+            cv2.bitwise_and(img, _KANAL_MASKELERI[indeks], dst=hedef[y:y + h, x:x + w])
+        cv2.cvtColor(gri, cv2.COLOR_GRAY2BGR, dst=hedef[h:, w:])
+        
+        return hedef
+        
+    except Exception as e:
+        print(f"Hata: Kanal mozaiği oluşturulurken bir hata oluştu: {str(e)}")
+        return None
+
 def goruntu_goster(img, baslik="Görüntü", bekle=True):
     """
     Görüntüyü ekranda gösterir
@@ -1,6 +1,11 @@
 import cv2
 import numpy as np
 import matplotlib.pyplot as plt
+import os
+import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 def parlaklik_ayarla(img, deger):
     """
@@ -18,37 +23,12 @@ def parlaklik_ayarla(img, deger):
         return None
     
     try:
-        # Görüntü kopyasını oluştur
-        sonuc = img.copy()
-        
-        # Görüntü gri tonlamalı ise
-        if len(img.shape) == 2:
-            rows, cols = img.shape
-            for i in range(rows):
-                for j in range(cols):
-                    piksel = int(img[i, j]) + deger
-                    # Sınırları kontrol et
-                    if piksel > 255:
-                        sonuc[i, j] = 255
-                    elif piksel < 0:
-                        sonuc[i, j] = 0
-                    else:
-                        sonuc[i, j] = piksel
-        
-        # Görüntü renkli ise
-        elif len(img.shape) == 3:
-            rows, cols, channels = img.shape
-            for i in range(rows):
-                for j in range(cols):
-                    for k in range(channels):
-                        piksel = int(img[i, j, k]) + deger
-                        # Sınırları kontrol et
-                        if piksel > 255:
-                            sonuc[i, j, k] = 255
-                        elif piksel < 0:
-                            sonuc[i, j, k] = 0
-                        else:
-                            sonuc[i, j, k] = piksel
+        # Piksel döngüsü yerine tüm dizi üzerinde yayınlama (broadcasting) ile toplama.
+        # Taşmayı önlemek için int16'da topla, sonra [0, 255] aralığına sınırla.
+        deger = max(-255, min(255, int(deger)))
+        sonuc = img.astype(np.int16) + deger
+        np.clip(sonuc, 0, 255, out=sonuc)
+        sonuc = sonuc.astype(img.dtype)
         
         return sonuc
         
@@ -72,6 +52,10 @@ def parlaklik_ayarla_hizli(img, deger):
         return None
     
     try:
+        # uint8 görüntülerde ara int16 kopya yerine tek geçişlik LUT kullan
+        if img.dtype == np.uint8:
+            return lut_uygula(img, parlaklik_lut(deger))
+
         # NumPy vektörel işlemleri kullanarak parlaklık ayarı
         sonuc = np.clip(img.astype(np.int16) + deger, 0, 255).astype(np.uint8)
         return sonuc
@@ -80,6 +64,30 @@ def parlaklik_ayarla_hizli(img, deger):
         print(f"Hata: Parlaklık ayarlanırken bir hata oluştu: {str(e)}")
         return None
 
+def gri_manuel(img):
+    """
+    BGR görüntüyü OpenCV kullanmadan gri tonlamaya çevirir.
+    cv2.COLOR_BGR2GRAY ile aynı 15 bitlik sabit noktalı katsayıları kullanır,
+    bu yüzden sonuç OpenCV ile birebir aynıdır.
+    
+    Args:
+        img (numpy.ndarray): İşlenecek görüntü
+        
+    Returns:
+        numpy.ndarray: Gri tonlamalı görüntü (gri girdi olduğu gibi döndürülür)
+    """
+    if len(img.shape) == 2:
+        return img
+    
+    # Y = 0.114*B + 0.587*G + 0.299*R (katsayılar 2^15 ile ölçeklenmiş)
+    b = img[:, :, 0].astype(np.uint32)
+    gray = b * 3735
+    gray += img[:, :, 1].astype(np.uint32) * 19235
+    gray += img[:, :, 2].astype(np.uint32) * 9798
+    gray += 1 << 14
+    gray >>= 15
+    return gray.astype(np.uint8)
+
 def esikleme(img, esik_degeri, max_deger=255):
     """
     Görüntüye eşikleme işlemi uygular (piksel değeri eşik değerinden büyükse 
@@ -97,24 +105,14 @@ def esikleme(img, esik_degeri, max_deger=255):
         print("Hata: İşlem yapılacak bir görüntü yok!")
         return None
     
-    # Görüntü renkli ise gri tonlamaya çevir
-    if len(img.shape) == 3:
-        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-    else:
-        gray = img.copy()
+    # Görüntü renkli ise gri tonlamaya çevir (OpenCV kullanmadan)
+    gray = gri_manuel(img)
     
     try:
-        # Manuel eşikleme
-        rows, cols = gray.shape
+        # Manuel eşikleme: döngü yerine mantıksal maske ile atama
         sonuc = np.zeros_like(gray)
+        sonuc[gray >= esik_degeri] = max_deger
         
-        for i in range(rows):
-            for j in range(cols):
-                if gray[i, j] >= esik_degeri:
-                    sonuc[i, j] = max_deger
-                else:
-                    sonuc[i, j] = 0
-                    
         return sonuc
         
     except Exception as e:
@@ -141,7 +139,8 @@ def esikleme_hizli(img, esik_degeri, max_deger=255):
     if len(img.shape) == 3:
         gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
     else:
-        gray = img.copy()
+        # Eşikleme yeni bir dizi ürettiği için girdi kopyalanmaz (salt okunur görüntüler de kullanılabilir)
+        gray = img
     
     try:
         # OpenCV'nin yerleşik fonksiyonunu kullanarak eşikleme
@@ -152,18 +151,61 @@ def esikleme_hizli(img, esik_degeri, max_deger=255):
         print(f"Hata: Eşikleme işlemi uygulanırken bir hata oluştu: {str(e)}")
         return None
 
+def hiz_karsilastir(img, deger=50, esik_degeri=127, tekrar=5):
+    """
+    Manuel (yalnızca NumPy) ve hızlı (OpenCV) parlaklık/eşikleme fonksiyonlarının
+    sürelerini ölçer ve yan yana yazdırır.
+    
+    Args:
+        img (numpy.ndarray): Test görüntüsü
+        deger (int, optional): Parlaklık değeri. Varsayılan 50.
+        esik_degeri (int, optional): Eşik değeri. Varsayılan 127.
+        tekrar (int, optional): Her fonksiyonun kaç kez çalıştırılacağı. Varsayılan 5.
+        
+    Returns:
+        dict: İşlem adı -> ortalama süre (saniye)
+    """
+    if img is None:
+        print("Hata: İşlem yapılacak bir görüntü yok!")
+        return None
+    
+    testler = [
+        ("parlaklik_ayarla", lambda: parlaklik_ayarla(img, deger)),
+        ("parlaklik_ayarla_hizli", lambda: parlaklik_ayarla_hizli(img, deger)),
+        ("esikleme", lambda: esikleme(img, esik_degeri)),
+        ("esikleme_hizli", lambda: esikleme_hizli(img, esik_degeri)),
+    ]
+    
+    sureler = {}
+    for ad, fonksiyon in testler:
+        fonksiyon()  # Isınma turu
+        baslangic = time.perf_counter()
+        for _ in range(tekrar):
+            fonksiyon()
+        sureler[ad] = (time.perf_counter() - baslangic) / tekrar
+    
+    h, w = img.shape[:2]
+    print(f"Hız karşılaştırması ({w}x{h}, {tekrar} tekrar ortalaması):")
+    for ad, sure in sureler.items():
+        print(f"  {ad:<24} {sure * 1000:10.2f} ms")
+    
+    return sureler
+
 def adaptif_esikleme(img, max_deger=255, adaptif_yontem=cv2.ADAPTIVE_THRESH_GAUSSIAN_C, 
-                    esik_tipi=cv2.THRESH_BINARY, blok_boyutu=11, c=2):
+                    esik_tipi=cv2.THRESH_BINARY, blok_boyutu=11, c=2, k=None):
     """
     Görüntüye adaptif eşikleme uygular.
     
     Args:
         img (numpy.ndarray): İşlenecek görüntü (gri tonlamalı olmalı)
         max_deger (int, optional): Eşik üstündeki piksellere atanacak değer. Varsayılan 255.
-        adaptif_yontem: cv2.ADAPTIVE_THRESH_MEAN_C veya cv2.ADAPTIVE_THRESH_GAUSSIAN_C
+        adaptif_yontem: cv2.ADAPTIVE_THRESH_MEAN_C, cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
+                        "sauvola" veya "niblack"
         esik_tipi: cv2.THRESH_BINARY veya cv2.THRESH_BINARY_INV
         blok_boyutu (int): Adaptif eşikleme için komşuluk bloğunun boyutu (tek sayı olmalı)
-        c (int): Hesaplanan eşik değerinden çıkarılan sabit
+        c (int): Hesaplanan eşik değerinden çıkarılan sabit (Sauvola/Niblack'te kullanılmaz)
+        k (float, optional): Sauvola/Niblack hassasiyet katsayısı. None ise yönteme göre
+                            varsayılan değer kullanılır.
         
     Returns:
         numpy.ndarray: Adaptif eşiklenmiş görüntü
@@ -176,9 +218,15 @@ def adaptif_esikleme(img, max_deger=255, adaptif_yontem=cv2.ADAPTIVE_THRESH_GAUS
     if len(img.shape) == 3:
         gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
     else:
-        gray = img.copy()
+        # Eşikleme yeni bir dizi ürettiği için girdi kopyalanmaz (salt okunur görüntüler de kullanılabilir)
+        gray = img
     
     try:
+        # Sauvola ve Niblack integral görüntüler üzerinden hesaplanır
+        if adaptif_yontem in ("sauvola", "niblack"):
+            return yerel_esikleme(gray, blok_boyutu, adaptif_yontem, k=k, max_deger=max_deger,
+                                  ters=(esik_tipi == cv2.THRESH_BINARY_INV))
+        
         # OpenCV'nin yerleşik fonksiyonunu kullanarak adaptif eşikleme
         sonuc = cv2.adaptiveThreshold(gray, max_deger, adaptif_yontem, 
                                       esik_tipi, blok_boyutu, c)
@@ -188,6 +236,296 @@ def adaptif_esikleme(img, max_deger=255, adaptif_yontem=cv2.ADAPTIVE_THRESH_GAUS
         print(f"Hata: Adaptif eşikleme işlemi uygulanırken bir hata oluştu: {str(e)}")
         return None
 
+# Integral görüntü (summed-area table) tabanlı yerel eşikleme
+# Görüntünün ve karesinin integralleri bir kez hesaplandıktan sonra her pikselin
+# pencere ortalaması ve standart sapması, pencere boyutundan bağımsız olarak
+# 4 okuma ile bulunur.
+
+_YEREL_ESIK_SATIR_BLOGU = 256
+_YEREL_ESIK_VARSAYILAN_K = {"sauvola": 0.2, "niblack": -0.2}
+
+def integral_goruntuler(img):
+    """
+    Görüntünün ve karesinin integral görüntülerini hesaplar.
+    
+    Args:
+        img (numpy.ndarray): İşlenecek görüntü (renkli ise gri tonlamaya çevrilir)
+        
+    Returns:
+        tuple: (toplam, kare_toplam) float64 integral görüntüler, boyut (h+1, w+1).
+               Hata durumunda (None, None)
+    """
+    if img is None:
+        print("Hata: İşlem yapılacak bir görüntü yok!")
+        return None, None
+    
+    # Görüntü renkli ise gri tonlamaya çevir
+    if len(img.shape) == 3:
+        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+    else:
+        gray = img
+    
+    try:
+        toplam, kare_toplam = cv2.integral2(gray, sdepth=cv2.CV_64F, sqdepth=cv2.CV_64F)
+        return toplam, kare_toplam
+        
+    except Exception as e:
+        print(f"Hata: Integral görüntü hesaplanırken bir hata oluştu: {str(e)}")
+        return None, None
+
+def _pencere_toplami(integral, y0, y1, x0, x1):
+    """Integral görüntüden her pikselin [y0, y1) x [x0, x1) penceresinin toplamını okur"""
+    # Önce satır farkı alınır, böylece sütun okuması iki kez yapılır
+    satir_farki = integral[y1] - integral[y0]
+    return np.take(satir_farki, x1, axis=1) - np.take(satir_farki, x0, axis=1)
+
+def yerel_esikleme(img, pencere=25, yontem="sauvola", k=None, r=128, max_deger=255,
+                   ters=False, integraller=None):
+    """
+    Sauvola veya Niblack yerel eşiklemesini integral görüntülerle uygular.
+    Maliyet pencere boyutundan bağımsız olarak piksel başına sabittir.
+    
+    Sauvola: T = m * (1 + k * (s / r - 1))
+    Niblack: T = m + k * s
+    
+    Args:
+        img (numpy.ndarray): İşlenecek görüntü (renkli ise gri tonlamaya çevrilir)
+        pencere (int, optional): Komşuluk penceresinin kenar uzunluğu. Varsayılan 25.
+        yontem (str, optional): "sauvola" veya "niblack". Varsayılan "sauvola".
+        k (float, optional): Hassasiyet katsayısı. None ise Sauvola için 0.2,
+                            Niblack için -0.2 kullanılır.
+        r (float, optional): Sauvola için standart sapmanın dinamik aralığı. Varsayılan 128.
+        max_deger (int, optional): Eşik üstündeki piksellere atanacak değer. Varsayılan 255.
+        ters (bool, optional): True ise sonuç tersine çevrilir (THRESH_BINARY_INV). Varsayılan False.
+        integraller (tuple, optional): integral_goruntuler ile önceden hesaplanmış
+                                      (toplam, kare_toplam). Varsayılan None.
+        
+    Returns:
+        numpy.ndarray: Eşiklenmiş görüntü
+    """
+    if img is None:
+        print("Hata: İşlem yapılacak bir görüntü yok!")
+        return None
+    
+    if yontem not in _YEREL_ESIK_VARSAYILAN_K:
+        print("Hata: Geçersiz yöntem! ('sauvola' veya 'niblack' olmalı)")
+        return None
+    
+    # Görüntü renkli ise gri tonlamaya çevir
+    if len(img.shape) == 3:
+        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+    else:
+        gray = img
+    
+    try:
+        if integraller is None:
+            integraller = integral_goruntuler(gray)
+        toplam, kare_toplam = integraller
+        
+        if k is None:
+            k = _YEREL_ESIK_VARSAYILAN_K[yontem]
+        
+        h, w = gray.shape[:2]
+        yaricap = max(1, int(pencere) // 2)
+        
+        # Sütun sınırları tüm satır blokları için ortaktır (kenarlarda pencere kırpılır)
+        x = np.arange(w)
+        x0 = np.clip(x - yaricap, 0, w)
+        x1 = np.clip(x + yaricap + 1, 0, w)
+        
+        sonuc = np.empty((h, w), dtype=np.uint8)
+        
+        # Geçici float64 dizilerin belleğini sınırlamak için satır blokları halinde işle
+        for bas in range(0, h, _YEREL_ESIK_SATIR_BLOGU):
+            son = min(h, bas + _YEREL_ESIK_SATIR_BLOGU)
+            y = np.arange(bas, son)
+            y0 = np.clip(y - yaricap, 0, h)
+            y1 = np.clip(y + yaricap + 1, 0, h)
+            
+            alan = (y1 - y0)[:, None] * (x1 - x0)[None, :]
+            ortalama = _pencere_toplami(toplam, y0, y1, x0, x1) / alan
+            varyans = _pencere_toplami(kare_toplam, y0, y1, x0, x1) / alan - ortalama ** 2
+            std = np.sqrt(np.maximum(varyans, 0))
+            
+            if yontem == "sauvola":
+                esik = ortalama * (1 + k * (std / r - 1))
+            else:
+                esik = ortalama + k * std
+            
+            ustte = gray[bas:son] > esik
+            if ters:
+                ustte = ~ustte
+            sonuc[bas:son] = np.where(ustte, max_deger, 0)
+        
+        return sonuc
+        
+    except Exception as e:
+        print(f"Hata: Yerel eşikleme işlemi uygulanırken bir hata oluştu: {str(e)}")
+        return None
+
+def yerel_esikleme_taramasi(img, pencereler, yontem="sauvola", k=None, r=128, max_deger=255):
+    """
+    Birden fazla pencere boyutu için yerel eşikleme uygular. Tüm pencereler
+    aynı integral görüntü çiftini paylaşır.
+    
+    Args:
+        img (numpy.ndarray): İşlenecek görüntü
+        pencereler (list): Denenecek pencere boyutları
+        yontem (str, optional): "sauvola" veya "niblack". Varsayılan "sauvola".
+        k (float, optional): Hassasiyet katsayısı. Varsayılan None (yönteme göre).
+        r (float, optional): Sauvola dinamik aralığı. Varsayılan 128.
+        max_deger (int, optional): Eşik üstündeki piksellere atanacak değer. Varsayılan 255.
+        
+    Returns:
+        dict: Pencere boyutu -> eşiklenmiş görüntü
+    """
+    if img is None:
+        print("Hata: İşlem yapılacak bir görüntü yok!")
+        return None
+    
+    # Görüntü renkli ise gri tonlamaya çevir
+    if len(img.shape) == 3:
+        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+    else:
+        gray = img
+    
+    integraller = integral_goruntuler(gray)
+    if integraller[0] is None:
+        return None
+    
+    return {pencere: yerel_esikleme(gray, pencere, yontem, k, r, max_deger, integraller=integraller)
+            for pencere in pencereler}
+
+# Histogram servisi
+# Aynı görüntünün histogramı hem arayüzde hem iyileştirme fonksiyonlarında tekrar
+# tekrar hesaplanmasın diye tüm kanalların histogramı bir kez hesaplanır ve
+# görüntü nesnesinin kimliği + sürüm numarası ile önbellekte tutulur.
+
+_HISTOGRAM_ONBELLEK_BOYUTU = 16
+_histogram_onbellegi = OrderedDict()
+
+class HistogramBilgisi:
+    """
+    Bir görüntünün tüm kanallarına ait 256 kutulu histogramlarını ve bunlardan
+    türetilen CDF, min/max ve yüzdelik değerlerini tutan sınıf.
+    """
+    def __init__(self, hist):
+        # hist: (kanal_sayisi, 256) boyutlu piksel sayıları
+        self.hist = hist
+        self.kanal_sayisi = hist.shape[0]
+        self.piksel_sayisi = int(hist[0].sum())
+        self._cdf = None
+
+    def cdf(self, kanal=0, normalize=False):
+        """
+        Kanalın kümülatif histogramını döndürür.
+        
+        Args:
+            kanal (int, optional): Kanal indeksi. Varsayılan 0.
+            normalize (bool, optional): True ise [0, 1] aralığına ölçekler. Varsayılan False.
+            
+        Returns:
+            numpy.ndarray: 256 elemanlı kümülatif dağılım
+        """
+        if self._cdf is None:
+            self._cdf = np.cumsum(self.hist, axis=1)
+        
+        cdf = self._cdf[kanal]
+        if normalize:
+            return cdf / max(self.piksel_sayisi, 1)
+        return cdf
+
+    def min_max(self, kanal=0):
+        """Kanaldaki en küçük ve en büyük piksel değerini döndürür"""
+        dolu = np.flatnonzero(self.hist[kanal])
+        if len(dolu) == 0:
+            return 0, 0
+        return int(dolu[0]), int(dolu[-1])
+
+    def yuzdelik(self, yuzde, kanal=0):
+        """
+        Piksellerin en az yuzde %'sinin altında ya da eşit kaldığı en küçük değeri döndürür.
+        
+        Args:
+            yuzde (float): 0-100 arası yüzdelik
+            kanal (int, optional): Kanal indeksi. Varsayılan 0.
+            
+        Returns:
+            int: Yüzdelik değeri (0-255)
+        """
+        # En az bir piksel kapsanmalı; böylece %0 en küçük değeri verir
+        hedef = max(yuzde / 100.0 * self.piksel_sayisi, 1)
+        deger = int(np.searchsorted(self.cdf(kanal), hedef, side='left'))
+        return min(deger, 255)
+
+    def calc_hist(self, kanal=0):
+        """Kanal histogramını cv2.calcHist çıktısıyla aynı biçimde (256x1 float32) döndürür"""
+        return self.hist[kanal].astype(np.float32).reshape(256, 1)
+
+def histogram_bilgisi(img, surum=0):
+    """
+    Görüntünün tüm kanallarının histogramını hesaplar veya önbellekten döndürür.
+    
+    Önbellek anahtarı görüntü nesnesinin kimliği ve sürüm numarasıdır. Görüntü
+    yerinde (in-place) değiştirildiyse farklı bir surum verilmelidir.
+    
+    Args:
+        img (numpy.ndarray): Histogramı hesaplanacak görüntü
+        surum (int, optional): Görüntünün sürüm numarası. Varsayılan 0.
+        
+    Returns:
+        HistogramBilgisi: Histogram verileri, hata durumunda None
+    """
+    if img is None:
+        print("Hata: İşlem yapılacak bir görüntü yok!")
+        return None
+    
+    anahtar = (id(img), surum)
+    kayit = _histogram_onbellegi.get(anahtar)
+    # id değerleri yeniden kullanılabildiğinden zayıf referansla aynı nesne olduğunu doğrula
+    if kayit is not None and kayit[0]() is img:
+        _histogram_onbellegi.move_to_end(anahtar)
+        return kayit[1]
+    
+    try:
+        kanal_sayisi = 1 if len(img.shape) == 2 else img.shape[2]
+        hist = np.empty((kanal_sayisi, 256), dtype=np.int64)
+        for i in range(kanal_sayisi):
+            hist[i] = cv2.calcHist([img], [i], None, [256], [0, 256]).ravel()
+        
+        bilgi = HistogramBilgisi(hist)
+        _histogram_onbellegi[anahtar] = (weakref.ref(img), bilgi)
+        while len(_histogram_onbellegi) > _HISTOGRAM_ONBELLEK_BOYUTU:
+            _histogram_onbellegi.popitem(last=False)
+        
+        return bilgi
+        
+    except Exception as e:
+        print(f"Hata: Histogram hesaplanırken bir hata oluştu: {str(e)}")
+        return None
+
+def esitleme_lut(bilgi, kanal=0):
+    """
+    Histogramdan eşitleme arama tablosunu oluşturur (cv2.equalizeHist ile aynı sonuç).
+    
+    Args:
+        bilgi (HistogramBilgisi): Görüntünün histogram bilgisi
+        kanal (int, optional): Kanal indeksi. Varsayılan 0.
+        
+    Returns:
+        numpy.ndarray: uint8 tipinde 256 elemanlı tablo
+    """
+    hist = bilgi.hist[kanal]
+    ilk, _ = bilgi.min_max(kanal)
+    
+    # Tüm pikseller aynı değerdeyse görüntü değişmeden kalır
+    if hist[ilk] == bilgi.piksel_sayisi:
+        return np.full(256, ilk, dtype=np.uint8)
+    
+    olcek = np.float32(255.0 / (bilgi.piksel_sayisi - hist[ilk]))
+    toplam = (bilgi.cdf(kanal) - hist[ilk]).astype(np.float32)
+    return np.clip(np.rint(toplam * olcek), 0, 255).astype(np.uint8)
+
 def histogram_hesapla(img, goster=False):
     """
     Görüntünün histogramını hesaplar.
@@ -204,14 +542,16 @@ def histogram_hesapla(img, goster=False):
         return None
     
     try:
+        # Tüm kanalların histogramı tek seferde hesaplanır (veya önbellekten gelir)
+        bilgi = histogram_bilgisi(img)
+        
         # Görüntü renkli ise
         if len(img.shape) == 3:
-            # Her kanal için ayrı histogram hesapla
             color = ('b', 'g', 'r')
             hist_data = []
             
             for i, col in enumerate(color):
-                hist = cv2.calcHist([img], [i], None, [256], [0, 256])
+                hist = bilgi.calc_hist(i)
                 hist_data.append(hist)
                 
                 if goster:
@@ -228,7 +568,7 @@ def histogram_hesapla(img, goster=False):
         
         # Görüntü gri tonlamalı ise
         else:
-            hist = cv2.calcHist([img], [0], None, [256], [0, 256])
+            hist = bilgi.calc_hist(0)
             
             if goster:
                 plt.figure()
@@ -284,9 +624,11 @@ def histogram_esitleme(img, goster=False):
                 plt.figure(figsize=(12, 5))
                 
                 # BGR histogramları
+                bilgi_orig = histogram_bilgisi(img)
+                bilgi_eq = histogram_bilgisi(sonuc)
                 for i, col in enumerate(['b', 'g', 'r']):
-                    hist_orig = cv2.calcHist([img], [i], None, [256], [0, 256])
-                    hist_eq = cv2.calcHist([sonuc], [i], None, [256], [0, 256])
+                    hist_orig = bilgi_orig.calc_hist(i)
+                    hist_eq = bilgi_eq.calc_hist(i)
                     
                     plt.subplot(1, 2, 1)
                     plt.plot(hist_orig, color=col)
@@ -309,13 +651,20 @@ def histogram_esitleme(img, goster=False):
         
         # Görüntü gri tonlamalı ise
         else:
-            # Histogram eşitleme
-            sonuc = cv2.equalizeHist(img)
+            # Histogram eşitleme (önbellekteki histogram varsa yeniden hesaplanmaz)
+            if img.dtype == np.uint8:
+                bilgi_orig = histogram_bilgisi(img)
+                sonuc = cv2.LUT(img, esitleme_lut(bilgi_orig))
+            else:
+                bilgi_orig = None
+                sonuc = cv2.equalizeHist(img)
             
             if goster:
                 # Orijinal ve eşitlenmiş histogramları göster
-                hist_orig = cv2.calcHist([img], [0], None, [256], [0, 256])
-                hist_eq = cv2.calcHist([sonuc], [0], None, [256], [0, 256])
+                if bilgi_orig is None:
+                    bilgi_orig = histogram_bilgisi(img)
+                hist_orig = bilgi_orig.calc_hist(0)
+                hist_eq = histogram_bilgisi(sonuc).calc_hist(0)
                 
                 plt.figure(figsize=(12, 5))
                 
@@ -342,14 +691,364 @@ def histogram_esitleme(img, goster=False):
         print(f"Hata: Histogram eşitleme işlemi uygulanırken bir hata oluştu: {str(e)}")
         return None
 
-def kontrast_germe(img, goster=False):
+# Karo tabanlı, paralel CLAHE (Contrast Limited Adaptive Histogram Equalization)
+# Karo histogramları iş parçacığı havuzunda bir kez hesaplanır; yalnızca kırpma
+# limiti değiştiğinde histogramlar yeniden kullanılır, sadece tablolar ve
+# ara değerleme yeniden yapılır.
+
+_is_parcacigi_havuzu = None
+_clahe_onbellegi = {}
+
+def _havuz_al():
+    """Modül genelinde paylaşılan iş parçacığı havuzunu döndürür (ilk çağrıda oluşturur)"""
+    global _is_parcacigi_havuzu
+    if _is_parcacigi_havuzu is None:
+        _is_parcacigi_havuzu = ThreadPoolExecutor(max_workers=os.cpu_count() or 4)
+    return _is_parcacigi_havuzu
+
+def _ara_deger_konumlari(uzunluk, karo_boyu):
+    """
+    Her piksel için sol/üst karo indeksini ve sağ/alt karonun ağırlığını döndürür.
+    
+    OpenCV CLAHE ile aynı float32 aritmetiği kullanılır: konum = x / karo_boyu - 0.5.
+    Karo merkezlerinin dışında kalan kenar piksellerinde indeks -1 veya son karo
+    olabilir; uygulamada komşu indeksler ızgara sınırına sabitlenir.
+    """
+    konum = np.arange(uzunluk, dtype=np.float32) * (np.float32(1.0) / np.float32(karo_boyu)) - np.float32(0.5)
+    ilk = np.floor(konum)
+    return ilk.astype(np.int64), (konum - ilk).astype(np.float32)
+
+class ClaheIslemci:
+    """
+    Bir görüntünün karo histogramlarını bir kez hesaplayıp farklı kırpma
+    limitleriyle CLAHE uygulamayı sağlayan sınıf.
+    
+    Renkli görüntülerde histogram_esitleme'de olduğu gibi yalnızca YCrCb
+    uzayının Y (parlaklık) kanalı işlenir. Karo düzeni, kırpma, tablo ve ara
+    değerleme cv2.createCLAHE ile aynıdır: boyut ızgaraya tam bölünmüyorsa
+    görüntü sağdan ve alttan BORDER_REFLECT_101 ile doldurulur ve tüm karolar
+    eşit boyutta olur. Sonuç OpenCV ile birebir aynıdır (ızgara görüntüden
+    büyükse karo sayısı görüntü boyutuna indirilir; OpenCV bu durumda
+    dolgu yapamadığı için sonuçlar karşılaştırılamaz).
+    
+    Not: izgara (satır, sütun) sırasındadır; cv2.createCLAHE'nin tileGridSize
+    değeri ise (sütun, satır) sırasındadır.
+    
+    Örnek:
+        islemci = ClaheIslemci(img, izgara=(8, 8))
+        sonuc1 = islemci.uygula(2.0)
+        sonuc2 = islemci.uygula(4.0)  # Karo histogramları yeniden hesaplanmaz
+    """
+    def __init__(self, img, izgara=(8, 8)):
+        self.renkli = len(img.shape) == 3
+        self.kanal, self.ycrcb = self._kanal_ayir(img)
+        
+        h, w = self.kanal.shape
+        self.boyut = (h, w)
+        self.karo_y = max(1, min(int(izgara[0]), h))
+        self.karo_x = max(1, min(int(izgara[1]), w))
+        
+        # OpenCV gibi: boyutlardan biri ızgaraya tam bölünmüyorsa her iki eksen de
+        # karo - (boyut % karo) kadar yansıtmalı kenarla doldurulur (tam bölünen eksen
+        # bir karo boyu kadar büyür); karo boyutları doldurulmuş görüntüden hesaplanır
+        ek_y = ek_x = 0
+        kaynak = self.kanal
+        if h % self.karo_y or w % self.karo_x:
+            ek_y = self.karo_y - h % self.karo_y
+            ek_x = self.karo_x - w % self.karo_x
+            kaynak = cv2.copyMakeBorder(self.kanal, 0, ek_y, 0, ek_x, cv2.BORDER_REFLECT_101)
+        
+        self.karo_boyu_y = (h + ek_y) // self.karo_y
+        self.karo_boyu_x = (w + ek_x) // self.karo_x
+        self.karo_alani = self.karo_boyu_y * self.karo_boyu_x
+        
+        self.hist = self._karo_histogramlari(kaynak)
+        self.y_ilk, self.y_agirlik = _ara_deger_konumlari(h, self.karo_boyu_y)
+        self.x_ilk, self.x_agirlik = _ara_deger_konumlari(w, self.karo_boyu_x)
+
+    def _kanal_ayir(self, img):
+        """İşlenecek tek kanalı ve renkli görüntülerde YCrCb dönüşümünü döndürür"""
+        if self.renkli:
+            ycrcb = cv2.cvtColor(img, cv2.COLOR_BGR2YCrCb)
+            return np.ascontiguousarray(ycrcb[:, :, 0]), ycrcb
+        return img, None
+
+    def birak(self):
+        """
+        Görüntü verisine olan referansları bırakır; yalnızca karo histogramları ve
+        ara değerleme konumları kalır. Sonraki uygula çağrılarında görüntü
+        yeniden verilmelidir.
+        """
+        self.kanal = None
+        self.ycrcb = None
+
+    def _karo_histogramlari(self, kaynak):
+        """Tüm karoların histogramlarını iş parçacığı havuzunda paralel hesaplar"""
+        hist = np.zeros((self.karo_y, self.karo_x, 256), dtype=np.int64)
+        by, bx = self.karo_boyu_y, self.karo_boyu_x
+        
+        def hesapla(i, j):
+            karo = kaynak[i * by:(i + 1) * by, j * bx:(j + 1) * bx]
+            hist[i, j] = cv2.calcHist([karo], [0], None, [256], [0, 256]).ravel()
+        
+        isler = [_havuz_al().submit(hesapla, i, j)
+                 for i in range(self.karo_y) for j in range(self.karo_x)]
+        for is_ in isler:
+            is_.result()
+        return hist
+
+    def tablolar(self, kirpma_limiti=2.0):
+        """
+        Karo histogramlarını kırpıp fazlalığı dağıtarak her karo için eşitleme tablosunu hesaplar.
+        
+        Args:
+            kirpma_limiti (float, optional): OpenCV CLAHE ile aynı anlamda kırpma limiti.
+                                            0 veya negatifse kırpma yapılmaz. Varsayılan 2.0.
+            
+        Returns:
+            numpy.ndarray: (karo_y, karo_x, 256) boyutlu uint8 tablolar
+        """
+        hist = self.hist.reshape(-1, 256).copy()
+        
+        if kirpma_limiti > 0:
+            limit = max(int(kirpma_limiti * self.karo_alani / 256), 1)
+            
+            # Limiti aşan kısım kesilir ve tüm kutulara eşit dağıtılır
+            fazlalik = np.maximum(hist - limit, 0).sum(axis=1)
+            np.minimum(hist, limit, out=hist)
+            hist += (fazlalik // 256)[:, None]
+            
+            # Bölünmeyen kalan, OpenCV'deki gibi eşit adımlı kutulara birer birer eklenir
+            kalan = fazlalik % 256
+            for karo in np.flatnonzero(kalan):
+                adim = max(256 // kalan[karo], 1)
+                hist[karo, 0:adim * kalan[karo]:adim] += 1
+        
+        cdf = np.cumsum(hist, axis=1).astype(np.float32)
+        olcek = np.float32(255.0) / np.float32(self.karo_alani)
+        tablo = np.clip(np.rint(cdf * olcek), 0, 255).astype(np.uint8)
+        return tablo.reshape(self.karo_y, self.karo_x, 256)
+
+    def uygula(self, kirpma_limiti=2.0, img=None):
+        """
+        Hazır karo histogramlarıyla CLAHE uygular. Her piksel çevresindeki dört
+        karonun tablosu arasında çift doğrusal ara değerleme ile eşlenir.
+        
+        Args:
+            kirpma_limiti (float, optional): Kırpma limiti. Varsayılan 2.0.
+            img (numpy.ndarray, optional): Histogramların hesaplandığı görüntü. Yalnızca
+                                           birak() çağrıldıktan sonra gereklidir.
+            
+        Returns:
+            numpy.ndarray: CLAHE uygulanmış görüntü
+        """
+        if img is not None:
+            kanal, ycrcb = self._kanal_ayir(img)
+        else:
+            kanal, ycrcb = self.kanal, self.ycrcb
+        if kanal is None or kanal.shape != self.boyut:
+            print("Hata: CLAHE için histogramların hesaplandığı görüntü verilmelidir!")
+            return None
+        
+        tablo = self.tablolar(kirpma_limiti)
+        sonuc = np.empty_like(kanal)
+        
+        # Aynı dört karoyu paylaşan piksel blokları (hücreler) bağımsız işlenebilir
+        y_bloklar = np.flatnonzero(np.diff(self.y_ilk, prepend=-2, append=self.karo_y + 1))
+        x_bloklar = np.flatnonzero(np.diff(self.x_ilk, prepend=-2, append=self.karo_x + 1))
+        
+        def hucre_isle(y0, y1, x0, x1):
+            ty = self.y_ilk[y0]
+            tx = self.x_ilk[x0]
+            ty1, ty2 = max(ty, 0), min(ty + 1, self.karo_y - 1)
+            tx1, tx2 = max(tx, 0), min(tx + 1, self.karo_x - 1)
+            
+            parca = kanal[y0:y1, x0:x1]
+            wy = self.y_agirlik[y0:y1, None]
+            wx = self.x_agirlik[None, x0:x1]
+            wy1 = np.float32(1) - wy
+            wx1 = np.float32(1) - wx
+            
+            # OpenCV ile aynı float32 işlem sırası
+            ust = cv2.LUT(parca, tablo[ty1, tx1]) * wx1 + cv2.LUT(parca, tablo[ty1, tx2]) * wx
+            alt = cv2.LUT(parca, tablo[ty2, tx1]) * wx1 + cv2.LUT(parca, tablo[ty2, tx2]) * wx
+            sonuc[y0:y1, x0:x1] = np.rint(ust * wy1 + alt * wy)
+        
+        isler = [_havuz_al().submit(hucre_isle, y_bloklar[a], y_bloklar[a + 1],
+                                    x_bloklar[b], x_bloklar[b + 1])
+                 for a in range(len(y_bloklar) - 1) for b in range(len(x_bloklar) - 1)]
+        for is_ in isler:
+            is_.result()
+        
+        if not self.renkli:
+            return sonuc
+        
+        ycrcb = ycrcb.copy()
+        ycrcb[:, :, 0] = sonuc
+        return cv2.cvtColor(ycrcb, cv2.COLOR_YCrCb2BGR)
+
+def clahe_uygula(img, kirpma_limiti=2.0, izgara=(8, 8)):
+    """
+    Görüntüye karo tabanlı kontrast sınırlı uyarlamalı histogram eşitleme (CLAHE) uygular.
+    
+    Son kullanılan görüntünün karo histogramları saklanır; aynı görüntü ve ızgara
+    ile yalnızca kırpma limiti değiştirilerek yapılan çağrılar histogramları
+    yeniden hesaplamaz. Önbellek görüntüye yalnızca zayıf referans tutar;
+    görüntü serbest bırakıldığında kayıt geçersizleşir.
+    
+    Args:
+        img (numpy.ndarray): İşlenecek uint8 görüntü
+        kirpma_limiti (float, optional): Kırpma limiti. Varsayılan 2.0.
+        izgara (tuple, optional): (satır, sütun) karo sayısı. Varsayılan (8, 8).
+        
+    Returns:
+        numpy.ndarray: CLAHE uygulanmış görüntü
+    """
+    if img is None:
+        print("Hata: İşlem yapılacak bir görüntü yok!")
+        return None
+    
+    try:
+        anahtar = (id(img), tuple(izgara))
+        kayit = _clahe_onbellegi.get(anahtar)
+        if kayit is not None and kayit[0]() is img:
+            islemci = kayit[1]
+        else:
+            islemci = ClaheIslemci(img, izgara)
+            # Önbellekteki işlemci görüntüyü tutmamalı; aksi halde zayıf referans anlamsızlaşır
+            islemci.birak()
+            # Yalnızca son görüntünün histogramları tutulur
+            _clahe_onbellegi.clear()
+            _clahe_onbellegi[anahtar] = (weakref.ref(img), islemci)
+        
+        return islemci.uygula(kirpma_limiti, img)
+        
+    except Exception as e:
+        print(f"Hata: CLAHE işlemi uygulanırken bir hata oluştu: {str(e)}")
+        return None
+
+def hedef_cdf_hazirla(kaynak):
+    """
+    Histogram eşleştirmede kullanılacak hedef kümülatif dağılımları hazırlar.
+    Bir toplu işte referans bir kez hazırlanıp tüm görüntülerde yeniden kullanılabilir.
+    
+    Args:
+        kaynak: Referans görüntü, HistogramBilgisi veya kanal başına 256 değerlik
+                hedef dağılım (256 elemanlı ya da uint8 olmayan (kanal_sayisi, 256) dizi)
+        
+    Returns:
+        numpy.ndarray: (kanal_sayisi, 256) boyutlu, [0, 1] aralığında normalize CDF
+    """
+    if kaynak is None:
+        print("Hata: Referans histogram veya görüntü yok!")
+        return None
+    
+    try:
+        if isinstance(kaynak, HistogramBilgisi):
+            hist = kaynak.hist.astype(np.float64)
+        else:
+            kaynak = np.asarray(kaynak)
+            # 256 elemanlı 1B dizi veya uint8 olmayan (kanal, 256) dizi hazır dağılımdır,
+            # diğerleri görüntü olarak kabul edilir
+            dagilim_mi = (kaynak.ndim == 1 and kaynak.size == 256) or \
+                         (kaynak.ndim == 2 and kaynak.shape[1] == 256 and kaynak.dtype != np.uint8)
+            if dagilim_mi:
+                hist = kaynak.reshape(-1, 256).astype(np.float64)
+            else:
+                hist = histogram_bilgisi(kaynak).hist.astype(np.float64)
+        
+        cdf = np.cumsum(hist, axis=1)
+        return cdf / np.maximum(cdf[:, -1:], 1e-12)
+        
+    except Exception as e:
+        print(f"Hata: Hedef dağılım hazırlanırken bir hata oluştu: {str(e)}")
+        return None
+
+def eslestirme_lut(kaynak_cdf, hedef_cdf):
+    """
+    İki normalize CDF'den histogram eşleştirme arama tablosu oluşturur.
+    Her değer, hedef CDF'de kaynak CDF değerine ulaşan en küçük değere eşlenir.
+    
+    Args:
+        kaynak_cdf (numpy.ndarray): Görüntünün 256 elemanlı normalize CDF'si
+        hedef_cdf (numpy.ndarray): Hedefin 256 elemanlı normalize CDF'si
+        
+    Returns:
+        numpy.ndarray: uint8 tipinde 256 elemanlı tablo
+    """
+    tablo = np.searchsorted(hedef_cdf, kaynak_cdf, side='left')
+    return np.minimum(tablo, 255).astype(np.uint8)
+
+def histogram_eslestirme(img, referans=None, hedef_cdf=None):
+    """
+    Görüntünün histogramını bir referans görüntüye veya hazır hedef dağılıma eşler.
+    Her kanal için tablo iki CDF'den hesaplanır ve tüm kanallar tek cv2.LUT ile eşlenir.
+    
+    Tek kanallı hedef renkli görüntünün her kanalına uygulanır. Gri görüntüye üç
+    kanallı hedef verilirse kanal CDF'leri gri dönüşüm ağırlıklarıyla (0.114 B,
+    0.587 G, 0.299 R) tek bir CDF'de birleştirilir; kanalları eşit referanslarda
+    referansın gri dağılımı doğrudan kullanılır.
+    
+    Args:
+        img (numpy.ndarray): İşlenecek uint8 görüntü
+        referans (optional): Referans görüntü veya hedef dağılım (bkz. hedef_cdf_hazirla)
+        hedef_cdf (numpy.ndarray, optional): hedef_cdf_hazirla ile önceden hazırlanmış CDF.
+                                             Toplu işlerde referansı tekrar hesaplamamak için.
+        
+    Returns:
+        numpy.ndarray: Histogramı eşlenmiş görüntü
+    """
+    if img is None:
+        print("Hata: İşlem yapılacak bir görüntü yok!")
+        return None
+    
+    if hedef_cdf is None:
+        hedef_cdf = hedef_cdf_hazirla(referans)
+        if hedef_cdf is None:
+            return None
+    
+    try:
+        bilgi = histogram_bilgisi(img)
+        
+        # Tek kanallı hedef tüm kanallara uygulanır
+        if hedef_cdf.shape[0] == 1:
+            hedef_cdf = np.repeat(hedef_cdf, bilgi.kanal_sayisi, axis=0)
+        elif bilgi.kanal_sayisi == 1 and hedef_cdf.shape[0] == 3:
+            # Kanalları eşit (3 kanallı kaydedilmiş gri) hedefin tek kanalı yeterlidir; renkli
+            # hedefin kanal dağılımları gri dönüşüm ağırlıklarıyla birleştirilir
+            if np.array_equal(hedef_cdf[1:], hedef_cdf[:2]):
+                hedef_cdf = hedef_cdf[:1]
+            else:
+                hedef_cdf = np.array([[0.114, 0.587, 0.299]]) @ hedef_cdf
+        elif hedef_cdf.shape[0] != bilgi.kanal_sayisi:
+            print("Hata: Görüntü ve referansın kanal sayıları uyuşmuyor!")
+            return None
+        
+        tablolar = [eslestirme_lut(bilgi.cdf(i, normalize=True), hedef_cdf[i])
+                    for i in range(bilgi.kanal_sayisi)]
+        tablo = np.stack(tablolar, axis=-1).reshape(1, 256, len(tablolar))
+        
+        return cv2.LUT(img, tablo)
+        
+    except Exception as e:
+        print(f"Hata: Histogram eşleştirme işlemi uygulanırken bir hata oluştu: {str(e)}")
+        return None
+
+def kontrast_germe(img, goster=False, alt_yuzde=0, ust_yuzde=100):
     """
     Doğrusal kontrast germe uygular.
     
+    Germe sınırları yalnızca 256 kutulu histogramdan bulunur ve her kanal tek bir
+    arama tablosuyla yeniden eşlenir; görüntünün float32 kopyası oluşturulmaz.
+    
     Args:
         img (numpy.ndarray): İşlenecek görüntü
         goster (bool, optional): True ise orijinal ve kontrast gerilmiş görüntüleri gösterir.
                                 Varsayılan False.
+        alt_yuzde (float, optional): Alt kırpma yüzdeliği; bu yüzdeliğin altındaki pikseller
+                                    0'a eşlenir. Varsayılan 0 (minimum değer).
+        ust_yuzde (float, optional): Üst kırpma yüzdeliği; bu yüzdeliğin üstündeki pikseller
+                                    255'e eşlenir. Varsayılan 100 (maksimum değer).
         
     Returns:
         numpy.ndarray: Kontrast gerilmiş görüntü
@@ -359,22 +1058,34 @@ def kontrast_germe(img, goster=False):
         return None
     
     try:
+        # Germe sınırları tam görüntü taraması yerine ortak histogramdan okunur
+        bilgi = histogram_bilgisi(img)
+        
+        if img.dtype == np.uint8:
+            # Her kanal için sınırları yüzdeliklerden bul ve tablosunu oluştur
+            tablolar = [germe_lut(bilgi.yuzdelik(alt_yuzde, i), bilgi.yuzdelik(ust_yuzde, i))
+                        for i in range(bilgi.kanal_sayisi)]
+            
+            # Tüm kanallar tek bir cv2.LUT çağrısıyla tek geçişte eşlenir
+            tablo = np.stack(tablolar, axis=-1).reshape(1, 256, len(tablolar))
+            sonuc = cv2.LUT(img, tablo)
+        
         # Görüntü renkli ise her kanalı ayrı ayrı işle
-        if len(img.shape) == 3:
+        elif len(img.shape) == 3:
             # Kanalları ayır
             b, g, r = cv2.split(img)
             
             # Her kanal için kontrast germe
-            b_stretched = kontrast_germe_kanali(b)
-            g_stretched = kontrast_germe_kanali(g)
-            r_stretched = kontrast_germe_kanali(r)
+            b_stretched = kontrast_germe_kanali(b, *bilgi.min_max(0))
+            g_stretched = kontrast_germe_kanali(g, *bilgi.min_max(1))
+            r_stretched = kontrast_germe_kanali(r, *bilgi.min_max(2))
             
             # Kanalları birleştir
             sonuc = cv2.merge([b_stretched, g_stretched, r_stretched])
             
         else:
             # Gri tonlamalı görüntü için kontrast germe
-            sonuc = kontrast_germe_kanali(img)
+            sonuc = kontrast_germe_kanali(img, *bilgi.min_max(0))
         
         if goster:
             plt.figure(figsize=(10, 5))
@@ -405,19 +1116,35 @@ def kontrast_germe(img, goster=False):
         print(f"Hata: Kontrast germe işlemi uygulanırken bir hata oluştu: {str(e)}")
         return None
 
-def kontrast_germe_kanali(kanal):
+def kontrast_germe_kanali(kanal, min_val=None, max_val=None):
     """
     Görüntü kanalına doğrusal kontrast germe uygular.
     
     Args:
         kanal (numpy.ndarray): İşlenecek tek kanallı görüntü
+        min_val (int, optional): Kanalın bilinen minimum değeri. None ise hesaplanır.
+        max_val (int, optional): Kanalın bilinen maksimum değeri. None ise hesaplanır.
         
     Returns:
         numpy.ndarray: Kontrast gerilmiş kanal
     """
+    # uint8 kanalda sınırlar histogramdan bulunur ve formül tablo olarak uygulanır
+    if kanal.dtype == np.uint8:
+        if min_val is None or max_val is None:
+            bilgi = histogram_bilgisi(kanal)
+            kanal_min, kanal_max = bilgi.min_max(0)
+            min_val = kanal_min if min_val is None else min_val
+            max_val = kanal_max if max_val is None else max_val
+        
+        if max_val > min_val:
+            return cv2.LUT(kanal, germe_lut(min_val, max_val))
+        return kanal  # min ve max aynıysa değişiklik yapmadan döndür
+    
     # Minimum ve maksimum piksel değerlerini bul
-    min_val = np.min(kanal)
-    max_val = np.max(kanal)
+    if min_val is None:
+        min_val = np.min(kanal)
+    if max_val is None:
+        max_val = np.max(kanal)
     
     # Kontrast germe formülüyle yeni görüntüyü hesapla
     # (x - min) / (max - min) * 255
@@ -426,6 +1153,179 @@ def kontrast_germe_kanali(kanal):
     else:
         return kanal  # min ve max aynıysa değişiklik yapmadan döndür
 
+def germe_lut(min_val, max_val):
+    """
+    Doğrusal kontrast germe için arama tablosu oluşturur.
+    [min_val, max_val] aralığı [0, 255]'e gerilir, aralık dışı değerler kırpılır.
+    
+    Args:
+        min_val (int): 0'a eşlenecek değer
+        max_val (int): 255'e eşlenecek değer
+        
+    Returns:
+        numpy.ndarray: uint8 tipinde 256 elemanlı tablo
+    """
+    if max_val <= min_val:
+        return np.arange(256, dtype=np.uint8)
+    
+    # kontrast_germe_kanali ile aynı float32 formülü, yalnızca 256 değer için
+    degerler = np.clip(np.arange(256, dtype=np.float32), min_val, max_val)
+    return ((degerler - min_val) / (max_val - min_val) * 255).astype(np.uint8)
+
+def _hist_al(kaynak, kanal=0):
+    """HistogramBilgisi, görüntü veya 256 elemanlı diziden histogram vektörünü döndürür"""
+    if isinstance(kaynak, HistogramBilgisi):
+        return kaynak.hist[kanal].astype(np.float64)
+    
+    kaynak = np.asarray(kaynak)
+    if kaynak.size == 256:
+        return kaynak.reshape(256).astype(np.float64)
+    
+    return histogram_bilgisi(kaynak).hist[kanal].astype(np.float64)
+
+def otsu_esik_degeri(kaynak, kanal=0):
+    """
+    Otsu eşik değerini yalnızca 256 kutulu histogramdan O(256) işlemle hesaplar.
+    Sonuç cv2.THRESH_OTSU ile aynıdır.
+    
+    Args:
+        kaynak: HistogramBilgisi, 256 elemanlı histogram veya görüntü
+        kanal (int, optional): Kanal indeksi. Varsayılan 0.
+        
+    Returns:
+        int: Sınıflar arası varyansı en büyük yapan eşik değeri
+    """
+    hist = _hist_al(kaynak, kanal)
+    p = hist / max(hist.sum(), 1)
+    
+    # Her olası eşik için sınıf ağırlığı ve kümülatif ortalama
+    omega = np.cumsum(p)
+    mu = np.cumsum(p * np.arange(256))
+    mu_t = mu[-1]
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sigma_b = (mu_t * omega - mu) ** 2 / (omega * (1 - omega))
+    sigma_b = np.nan_to_num(sigma_b, nan=0.0, posinf=0.0)
+    
+    return int(np.argmax(sigma_b))
+
+def coklu_otsu_esikleri(kaynak, sinif_sayisi=3, kanal=0):
+    """
+    Çok seviyeli Otsu eşiklerini histogram üzerinde dinamik programlama ile bulur.
+    Karmaşıklık görüntü boyutundan bağımsızdır: O(sinif_sayisi * 256^2).
+    
+    Args:
+        kaynak: HistogramBilgisi, 256 elemanlı histogram veya görüntü
+        sinif_sayisi (int, optional): Sınıf sayısı (eşik sayısı + 1). Varsayılan 3.
+        kanal (int, optional): Kanal indeksi. Varsayılan 0.
+        
+    Returns:
+        list: Artan sırada sinif_sayisi - 1 adet eşik değeri. Her eşik, kendi
+              sınıfına dahil olan en büyük piksel değeridir.
+    """
+    if sinif_sayisi < 2:
+        print("Hata: Sınıf sayısı en az 2 olmalıdır!")
+        return None
+    
+    hist = _hist_al(kaynak, kanal)
+    p = hist / max(hist.sum(), 1)
+    
+    # Kümülatif ağırlık ve momentler (başa 0 eklenerek aralık toplamı kolaylaşır)
+    P = np.concatenate(([0.0], np.cumsum(p)))
+    S = np.concatenate(([0.0], np.cumsum(p * np.arange(256))))
+    
+    # skor[a, b]: [a, b] aralığının w * mu^2 katkısı (sınıflar arası varyansa eşdeğer)
+    a = np.arange(256)[:, None]
+    b = np.arange(256)[None, :]
+    w = P[b + 1] - P[a]
+    m = S[b + 1] - S[a]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        skor = np.where((b >= a) & (w > 0), m * m / w, 0.0)
+    skor[b < a] = -np.inf
+    
+    # en_iyi[j]: [0, j] aralığının k sınıfa en iyi bölünmesinin skoru
+    en_iyi = skor[0].copy()
+    secimler = []
+    for _ in range(sinif_sayisi - 1):
+        # Son sınıf [i+1, j], önceki sınıflar [0, i]
+        aday = en_iyi[:, None] + np.vstack((skor[1:], np.full((1, 256), -np.inf)))
+        secim = np.argmax(aday, axis=0)
+        en_iyi = aday[secim, np.arange(256)]
+        secimler.append(secim)
+    
+    # Geriye doğru izleyerek eşikleri çıkar
+    esikler = []
+    j = 255
+    for secim in reversed(secimler):
+        j = int(secim[j])
+        esikler.append(j)
+    
+    return sorted(esikler)
+
+def otsu_esikleme(img, max_deger=255):
+    """
+    Görüntüye histogramdan hesaplanan Otsu eşiği ile ikili eşikleme uygular.
+    
+    Args:
+        img (numpy.ndarray): İşlenecek görüntü
+        max_deger (int, optional): Eşik üstündeki piksellere atanacak değer. Varsayılan 255.
+        
+    Returns:
+        tuple: (eşik değeri, eşiklenmiş görüntü), hata durumunda (None, None)
+    """
+    if img is None:
+        print("Hata: İşlem yapılacak bir görüntü yok!")
+        return None, None
+    
+    # Görüntü renkli ise gri tonlamaya çevir
+    if len(img.shape) == 3:
+        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+    else:
+        gray = img
+    
+    try:
+        esik = otsu_esik_degeri(histogram_bilgisi(gray))
+        return esik, cv2.LUT(gray, esik_lut(esik, max_deger))
+        
+    except Exception as e:
+        print(f"Hata: Otsu eşikleme işlemi uygulanırken bir hata oluştu: {str(e)}")
+        return None, None
+
+def coklu_otsu_esikleme(img, sinif_sayisi=3):
+    """
+    Görüntüyü çok seviyeli Otsu eşikleriyle sinif_sayisi adet gri seviyeye ayırır.
+    Seviyeler 0 ile 255 arasında eşit aralıklıdır.
+    
+    Args:
+        img (numpy.ndarray): İşlenecek görüntü
+        sinif_sayisi (int, optional): Sınıf sayısı. Varsayılan 3.
+        
+    Returns:
+        tuple: (eşik listesi, bölütlenmiş görüntü), hata durumunda (None, None)
+    """
+    if img is None:
+        print("Hata: İşlem yapılacak bir görüntü yok!")
+        return None, None
+    
+    # Görüntü renkli ise gri tonlamaya çevir
+    if len(img.shape) == 3:
+        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+    else:
+        gray = img
+    
+    try:
+        esikler = coklu_otsu_esikleri(histogram_bilgisi(gray), sinif_sayisi)
+        
+        # Her değerin sınıf indeksini bul ve eşit aralıklı gri seviyeye eşle
+        sinif = np.searchsorted(np.array(esikler), np.arange(256), side='left')
+        tablo = (sinif * 255 // (sinif_sayisi - 1)).astype(np.uint8)
+        
+        return esikler, cv2.LUT(gray, tablo)
+        
+    except Exception as e:
+        print(f"Hata: Çok seviyeli Otsu eşikleme uygulanırken bir hata oluştu: {str(e)}")
+        return None, None
+
 def kontrast_ayarla(img, alpha, beta=0):
     """
     Görüntüye kontrast (alpha) ve parlaklık (beta) ayarı uygular.
@@ -443,14 +1343,176 @@ def kontrast_ayarla(img, alpha, beta=0):
         return None
     
     try:
+        # uint8 görüntülerde formül 256 değer için bir kez hesaplanır
+        if img.dtype == np.uint8:
+            return lut_uygula(img, kontrast_lut(alpha, beta))
+
         # Formül: g(x,y) = alpha * f(x,y) + beta
         sonuc = cv2.convertScaleAbs(img, alpha=alpha, beta=beta)
         return sonuc
-        
+
     except Exception as e:
         print(f"Hata: Kontrast ayarlama işlemi uygulanırken bir hata oluştu: {str(e)}")
         return None
 
+# Nokta işlemleri için arama tablosu (LUT) motoru
+# uint8 bir görüntüde her nokta işlemi 256 girişlik bir tabloya indirgenebilir.
+# Ardışık tablolar birleştirildiğinde tüm zincir görüntü üzerinde tek geçişte uygulanır.
+
+def parlaklik_lut(deger):
+    """
+    Parlaklık ayarı için 256 elemanlı arama tablosu oluşturur.
+
+    Args:
+        deger (int): Pozitif değerler parlaklığı artırır, negatif değerler azaltır
+
+    Returns:
+        numpy.ndarray: uint8 tipinde 256 elemanlı tablo
+    """
+    return np.clip(np.arange(256, dtype=np.int32) + int(deger), 0, 255).astype(np.uint8)
+
+def kontrast_lut(alpha, beta=0):
+    """
+    Kontrast (alpha) ve parlaklık (beta) ayarı için arama tablosu oluşturur.
+    Tablo cv2.convertScaleAbs ile aynı yuvarlamayı kullanır.
+
+    Args:
+        alpha (float): Kontrast faktörü (1.0 = orijinal kontrast)
+        beta (int, optional): Parlaklık değeri. Varsayılan 0.
+
+    Returns:
+        numpy.ndarray: uint8 tipinde 256 elemanlı tablo
+    """
+    rampa = np.arange(256, dtype=np.uint8).reshape(1, 256)
+    return cv2.convertScaleAbs(rampa, alpha=alpha, beta=beta).reshape(256)
+
+def esik_lut(esik_degeri, max_deger=255, esit_dahil=False):
+    """
+    İkili eşikleme için arama tablosu oluşturur.
+
+    Args:
+        esik_degeri (int): Eşik değeri
+        max_deger (int, optional): Eşik üstündeki piksellere atanacak değer. Varsayılan 255.
+        esit_dahil (bool, optional): True ise eşiğe eşit pikseller de max_deger alır
+                                    (esikleme ile aynı), False ise yalnızca büyükler
+                                    (esikleme_hizli ile aynı). Varsayılan False.
+
+    Returns:
+        numpy.ndarray: uint8 tipinde 256 elemanlı tablo
+    """
+    degerler = np.arange(256)
+    if esit_dahil:
+        maske = degerler >= esik_degeri
+    else:
+        maske = degerler > esik_degeri
+    return np.where(maske, max_deger, 0).astype(np.uint8)
+
+def negatif_lut():
+    """
+    Negatif alma (255 - x) için arama tablosu oluşturur.
+
+    Returns:
+        numpy.ndarray: uint8 tipinde 256 elemanlı tablo
+    """
+    return (255 - np.arange(256)).astype(np.uint8)
+
+def lut_birlestir(*tablolar):
+    """
+    Sırayla uygulanacak arama tablolarını tek bir tabloda birleştirir.
+
+    Args:
+        *tablolar (numpy.ndarray): Uygulanma sırasına göre 256 elemanlı tablolar
+
+    Returns:
+        numpy.ndarray: Tüm işlemlerin bileşkesi olan tablo
+    """
+    sonuc = np.arange(256, dtype=np.uint8)
+    for tablo in tablolar:
+        # Önceki tablonun çıktısı sonraki tablonun indeksi olur
+        sonuc = tablo[sonuc]
+    return sonuc
+
+def lut_uygula(img, tablo):
+    """
+    Arama tablosunu görüntünün tüm kanallarına tek geçişte uygular.
+
+    Args:
+        img (numpy.ndarray): uint8 tipinde işlenecek görüntü
+        tablo (numpy.ndarray): 256 elemanlı uint8 tablo
+
+    Returns:
+        numpy.ndarray: Tablo uygulanmış görüntü
+    """
+    if img is None:
+        print("Hata: İşlem yapılacak bir görüntü yok!")
+        return None
+
+    if img.dtype != np.uint8:
+        print("Hata: Arama tablosu yalnızca uint8 görüntülere uygulanabilir!")
+        return None
+
+    try:
+        return cv2.LUT(img, tablo)
+
+    except Exception as e:
+        print(f"Hata: Arama tablosu uygulanırken bir hata oluştu: {str(e)}")
+        return None
+
+class NoktaIslemZinciri:
+    """
+    Parlaklık, kontrast, eşikleme ve negatif gibi nokta işlemlerini tek bir
+    arama tablosunda biriktiren sınıf. Zincir ne kadar uzun olursa olsun
+    görüntü üzerinde yalnızca bir kez geçilir.
+
+    Örnek:
+        sonuc = NoktaIslemZinciri().parlaklik(20).kontrast(1.3).esik(127).uygula(img)
+
+    Not: Renkli görüntülerde eşikleme de dahil tüm işlemler her kanala ayrı ayrı uygulanır.
+    """
+    def __init__(self):
+        self.tablo = np.arange(256, dtype=np.uint8)
+        self.islemler = []
+
+    def ekle(self, tablo, ad="lut"):
+        """Zincirin sonuna hazır bir arama tablosu ekler"""
+        self.tablo = tablo[self.tablo]
+        self.islemler.append(ad)
+        return self
+
+    def parlaklik(self, deger):
+        """Zincire parlaklık ayarı ekler"""
+        return self.ekle(parlaklik_lut(deger), f"parlaklik({deger})")
+
+    def kontrast(self, alpha, beta=0):
+        """Zincire kontrast ayarı ekler"""
+        return self.ekle(kontrast_lut(alpha, beta), f"kontrast({alpha}, {beta})")
+
+    def esik(self, esik_degeri, max_deger=255, esit_dahil=False):
+        """Zincire ikili eşikleme ekler"""
+        return self.ekle(esik_lut(esik_degeri, max_deger, esit_dahil), f"esik({esik_degeri})")
+
+    def negatif(self):
+        """Zincire negatif alma ekler"""
+        return self.ekle(negatif_lut(), "negatif")
+
+    def sifirla(self):
+        """Zinciri birim tabloya döndürür"""
+        self.tablo = np.arange(256, dtype=np.uint8)
+        self.islemler = []
+        return self
+
+    def uygula(self, img):
+        """
+        Birikmiş tabloyu görüntüye tek geçişte uygular.
+
+        Args:
+            img (numpy.ndarray): uint8 tipinde işlenecek görüntü
+
+        Returns:
+            numpy.ndarray: İşlenmiş görüntü
+        """
+        return lut_uygula(img, self.tablo)
+
 def goruntu_goster(img, baslik="Görüntü", bekle=True):
     """
     Görüntüyü ekranda gösterir
@@ -1,6 +1,111 @@
 import cv2
 import numpy as np
 import matplotlib.pyplot as plt
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+# Doğrusal kısmı işaretli permütasyon olan afin matrisler için kayıpsız OpenCV
+# karşılıkları: (M[0,0], M[0,1], M[1,0], M[1,1]) -> kırpılmış kaynağa uygulanacak işlem
+_TAM_SAYI_AFIN_ISLEMLERI = {
+    (1, 0, 0, 1): lambda k, d: np.copyto(d, k),
+    (-1, 0, 0, 1): lambda k, d: cv2.flip(k, 1, dst=d),
+    (1, 0, 0, -1): lambda k, d: cv2.flip(k, 0, dst=d),
+    (-1, 0, 0, -1): lambda k, d: cv2.flip(k, -1, dst=d),
+    (0, 1, 1, 0): lambda k, d: cv2.transpose(k, dst=d),
+    (0, 1, -1, 0): lambda k, d: cv2.rotate(k, cv2.ROTATE_90_COUNTERCLOCKWISE, dst=d),
+    (0, -1, 1, 0): lambda k, d: cv2.rotate(k, cv2.ROTATE_90_CLOCKWISE, dst=d),
+    (0, -1, -1, 0): lambda k, d: cv2.flip(cv2.transpose(k), -1, dst=d),
+}
+
+def _tam_sayi_afin(img, M, dsize):
+    """
+    Afin dönüşüm pikselleri yalnızca yer değiştiriyorsa (90 derecenin katları,
+    aynalama, tam sayı taşıma) cv2.warpAffine yerine kayıpsız hızlı yolu uygular.
+    
+    Matrisin doğrusal kısmı işaretli bir permütasyon ve ötelemesi tam sayı ise
+    her çıktı pikseli tam olarak bir kaynak pikseline denk gelir; interpolasyon
+    yöntemi ne olursa olsun warpAffine (BORDER_CONSTANT, 0) ile birebir aynı
+    sonuç, yalnızca tuvale düşen kaynak bölgesi kopyalanarak üretilir.
+    
+    Args:
+        img (numpy.ndarray): Kaynak görüntü
+        M (numpy.ndarray): 2x3 afin matris (kaynak -> hedef)
+        dsize (tuple): Çıktı (genişlik, yükseklik)
+        
+    Returns:
+        numpy.ndarray: Dönüştürülmüş görüntü, hızlı yol uygulanamıyorsa None
+    """
+    M = np.asarray(M, dtype=np.float64)
+    yuvarlak = np.round(M)
+    if np.abs(M - yuvarlak).max() > 1e-9:
+        return None
+    islem = _TAM_SAYI_AFIN_ISLEMLERI.get(tuple(int(v) for v in yuvarlak[:, :2].ravel()))
+    if islem is None:
+        return None
+    
+    L, t = yuvarlak[:, :2].astype(np.int64), yuvarlak[:, 2].astype(np.int64)
+    h, w = img.shape[:2]
+    dw, dh = dsize
+    sonuc = np.zeros((dh, dw) + img.shape[2:], dtype=img.dtype)
+    
+    # Kaynak köşelerinin hedefteki sınır kutusu ile tuvalin kesişimi
+    koseler = np.array([[0, 0], [w - 1, 0], [0, h - 1], [w - 1, h - 1]]) @ L.T + t
+    x0, y0 = np.maximum(koseler.min(axis=0), 0)
+    x1, y1 = np.minimum(koseler.max(axis=0), [dw - 1, dh - 1])
+    if x0 > x1 or y0 > y1:
+        return sonuc
+    
+    # Kesişimin kaynaktaki karşılığı (L'nin tersi kendi transpozudur)
+    kaynak = (np.array([[x0, y0], [x1, y1]]) - t) @ L
+    kx0, ky0 = kaynak.min(axis=0)
+    kx1, ky1 = kaynak.max(axis=0)
+    
+    islem(img[ky0:ky1 + 1, kx0:kx1 + 1], sonuc[y0:y1 + 1, x0:x1 + 1])
+    return sonuc
+
+def _olcek_ve_aynalama(img, M, dsize, interpolation):
+    """
+    Afin matris yalnızca tuvalin ölçeklenmesi ve tüm tuvale göre aynalanmasından
+    oluşuyorsa sonucu cv2.resize ve cv2.flip ile üretir.
+    
+    warpAffine tuvalin dışını siyah kabul ettiği için büyütmede en dıştaki satır
+    ve sütun siyahla karışır; cv2.resize ise kenar pikselini tekrarlar. Bu yol
+    olcekleme ve aynalama fonksiyonlarının art arda çağrılmasıyla birebir aynı
+    sonucu verir.
+    
+    Args:
+        img (numpy.ndarray): Kaynak görüntü
+        M (numpy.ndarray): 2x3 afin matris (kaynak -> hedef)
+        dsize (tuple): Çıktı (genişlik, yükseklik)
+        interpolation (int): İnterpolasyon yöntemi
+        
+    Returns:
+        numpy.ndarray: Dönüştürülmüş görüntü, matris bu biçimde değilse None
+    """
+    M = np.asarray(M, dtype=np.float64)
+    if abs(M[0, 1]) > 1e-9 or abs(M[1, 0]) > 1e-9 or M[0, 0] == 0 or M[1, 1] == 0:
+        return None
+    
+    h, w = img.shape[:2]
+    dw, dh = dsize
+    for olcek, oteleme, kaynak, hedef in ((M[0, 0], M[0, 2], w, dw), (M[1, 1], M[1, 2], h, dh)):
+        # cv2.resize hizalaması x' = s * x + (s - 1) / 2, aynalamada x'' = hedef - 1 - x'
+        s = hedef / kaynak
+        beklenen = (s - 1) / 2 if olcek > 0 else hedef - 1 - (s - 1) / 2
+        if not np.isclose(abs(olcek), s, rtol=0, atol=1e-9) or not np.isclose(oteleme, beklenen, rtol=0, atol=1e-6):
+            return None
+    
+    sonuc = cv2.resize(img, (dw, dh), interpolation=interpolation)
+    if M[0, 0] < 0 and M[1, 1] < 0:
+        sonuc = cv2.flip(sonuc, -1)
+    elif M[0, 0] < 0:
+        sonuc = cv2.flip(sonuc, 1)
+    elif M[1, 1] < 0:
+        sonuc = cv2.flip(sonuc, 0)
+    return sonuc
 
 def tasima(img, dx, dy):
     """
@@ -25,8 +130,11 @@ def tasima(img, dx, dy):
         # Taşıma matrisi oluştur
         T = np.float32([[1, 0, dx], [0, 1, dy]])
         
-        # Görüntüyü taşı
-        moved_image = cv2.warpAffine(img, T, (w, h))
+        # Tam sayı taşımada piksel değerleri değişmez: interpolasyonsuz kopyala
+        moved_image = _tam_sayi_afin(img, T, (w, h))
+        if moved_image is None:
+            # Görüntüyü taşı
+            moved_image = cv2.warpAffine(img, T, (w, h))
         
         return moved_image
         
@@ -103,10 +211,83 @@ def aynalama_her_iki_eksen(img):
         print(f"Hata: Aynalama işlemi uygulanırken bir hata oluştu: {str(e)}")
         return None
 
+def _nokta_ayna_indeksleri(n, merkez):
+    """
+    Tek eksen için aynalama_nokta eşlemesini hesaplar: kaynak k -> hedef int(2*merkez - k).
+    
+    Aynı hedefe birden fazla kaynak düşerse (merkez tam sayı değilse) döngüdeki gibi
+    en son yazan, yani en büyük kaynak indeksi kazanır.
+    
+    Returns:
+        tuple: (hedef indeksleri, kaynak indeksleri) olarak dilim veya dizi çifti
+    """
+    kaynak = np.arange(n)
+    hedef = np.trunc(2 * merkez - kaynak).astype(np.int64)  # int() gibi sıfıra doğru kesme
+    gecerli = (hedef >= 0) & (hedef < n)
+    kaynak, hedef = kaynak[gecerli], hedef[gecerli]
+    if kaynak.size == 0:
+        return None, None
+    
+    # Hedefler kaynakla birlikte azalır; ters sırada ilk görülen, döngüde son yazandır
+    hedef, ilk = np.unique(hedef[::-1], return_index=True)
+    kaynak = kaynak[::-1][ilk]
+    
+    # Tam sayı merkezde eşleme bire birdir: dizi yerine (kopyasız) dilim kullan
+    if np.all(np.diff(hedef) == 1) and np.all(np.diff(kaynak) == -1):
+        son = kaynak[-1] - 1
+        return slice(hedef[0], hedef[-1] + 1), slice(kaynak[0], None if son < 0 else son, -1)
+    return hedef, kaynak
+
 def aynalama_nokta(img, x0, y0):
     """
     Görüntüyü belirtilen (x0, y0) noktasına göre aynalar.
     
+    Piksel döngüsü yerine indeks aritmetiği kullanılır: tam sayı noktalarda ters
+    dilimleme, diğerlerinde gelişmiş (fancy) indeksleme. Sonuç döngülü sürümle
+    (_aynalama_nokta_dongu) birebir aynıdır.
+    
+    Args:
+        img (numpy.ndarray): İşlenecek görüntü
+        x0 (int): Aynalama noktasının x koordinatı
+        y0 (int): Aynalama noktasının y koordinatı
+        
+    Returns:
+        numpy.ndarray: Belirtilen noktaya göre aynalanmış görüntü
+    """
+    if img is None:
+        print("Hata: İşlem yapılacak bir görüntü yok!")
+        return None
+    
+    try:
+        h, w = img.shape[:2]
+        result = img.copy()
+        
+        # Eşleme eksenlere ayrılabilir: x2 yalnızca x1'e, y2 yalnızca y1'e bağlıdır
+        hedef_x, kaynak_x = _nokta_ayna_indeksleri(w, x0)
+        hedef_y, kaynak_y = _nokta_ayna_indeksleri(h, y0)
+        if hedef_x is None or hedef_y is None:
+            return result
+        
+        if isinstance(hedef_x, slice) and isinstance(hedef_y, slice):
+            result[hedef_y, hedef_x] = img[kaynak_y, kaynak_x]
+        else:
+            # Dilimleri kendi ekseninin uzunluğuyla indeks dizisine çevirip
+            # satır/sütun çaprazlamasıyla kopyala
+            hedef_y, kaynak_y = (np.arange(h)[i] if isinstance(i, slice) else i for i in (hedef_y, kaynak_y))
+            hedef_x, kaynak_x = (np.arange(w)[i] if isinstance(i, slice) else i for i in (hedef_x, kaynak_x))
+            result[np.ix_(hedef_y, hedef_x)] = img[np.ix_(kaynak_y, kaynak_x)]
+        
+        return result
+        
+    except Exception as e:
+        print(f"Hata: Aynalama işlemi uygulanırken bir hata oluştu: {str(e)}")
+        return None
+
+def _aynalama_nokta_dongu(img, x0, y0):
+    """
+    aynalama_nokta'nın piksel döngülü ilk sürümü. Yalnızca doğrulama ve hız
+    karşılaştırması (geometri_hiz_karsilastir) için tutulur.
+    
     Args:
         img (numpy.ndarray): İşlenecek görüntü
         x0 (int): Aynalama noktasının x koordinatı
@@ -205,16 +386,90 @@ def egme_y(img, sh_y):
     except Exception as e:
         print(f"Hata: Y ekseninde eğme işlemi uygulanırken bir hata oluştu: {str(e)}")
         return None
-def olcekleme(img, scale_factor, interpolation=cv2.INTER_LINEAR):
+class MipPiramidi:
+    """
+    Bir görüntünün art arda yarıya küçültülmüş seviyelerini (mip seviyeleri) saklayan sınıf.
+    
+    Büyük oranlı küçültmeler tek bir cv2.resize yerine 2 katlık küçültmelerin
+    ardından tek bir kesirli yeniden boyutlandırma ile yapılır. Seviyeler ilk
+    gerektiklerinde hesaplanır ve saklanır; aynı görüntünün farklı ölçeklerdeki
+    sonraki küçültmeleri (ör. yakınlaştırma seviyeleri) hazır seviyelerden başlar.
+    Saklanan seviyeler paylaşıldığı için salt okunur işaretlenir.
+    
+    Yöntemler:
+        "kutu":  2x2 blok ortalaması (cv2.INTER_AREA'nın tam 2 katlık hızlı yolu).
+                 Tek boyutlu kenarlarda son satır/sütun atlanır.
+        "gauss": cv2.pyrDown (5x5 Gauss süzgeci + yarıya örnekleme)
+    
+    Örnek:
+        mip = MipPiramidi(img)
+        onizleme = mip.olcekle(1 / 16)
+        yakin = mip.olcekle(1 / 4)    # 1/4 seviyesi zaten hazır
+    """
+    def __init__(self, img, yontem="kutu"):
+        if yontem not in ("kutu", "gauss"):
+            raise ValueError("Piramit yöntemi 'kutu' veya 'gauss' olmalıdır")
+        self.goruntu = img
+        self.yontem = yontem
+        self.seviyeler = [img]
+
+    def _kucult(self, img):
+        """Bir sonraki (yarı boyutlu) seviyeyi üretir"""
+        if self.yontem == "gauss":
+            return cv2.pyrDown(img)
+        h, w = img.shape[:2]
+        # Çift boyuta kırpılan görüntüde INTER_AREA birebir 2x2 ortalamasıdır
+        return cv2.resize(img[:h - h % 2, :w - w % 2], (w // 2, h // 2), interpolation=cv2.INTER_AREA)
+
+    def seviye(self, k):
+        """k'ıncı seviyeyi (1/2**k boyut) döndürür; gerekirse hesaplar"""
+        while len(self.seviyeler) <= k:
+            sonraki = self._kucult(self.seviyeler[-1])
+            sonraki.flags.writeable = False
+            self.seviyeler.append(sonraki)
+        return self.seviyeler[k]
+
+    def boyuta_getir(self, boyut, interpolation=cv2.INTER_AREA):
+        """
+        Görüntüyü (genişlik, yükseklik) boyutuna küçültür: hedeften küçük olmayan en
+        derin seviyeden başlayıp tek bir kesirli yeniden boyutlandırma yapar
+        
+        Returns:
+            numpy.ndarray: Yeni boyutlu görüntü (her zaman yeni bir dizi)
+        """
+        yeni_w, yeni_h = boyut
+        k = 0
+        while True:
+            h, w = self.seviye(k).shape[:2]
+            if w // 2 < yeni_w or h // 2 < yeni_h or min(w, h) < 2:
+                break
+            k += 1
+        return cv2.resize(self.seviye(k), (yeni_w, yeni_h), interpolation=interpolation)
+
+    def olcekle(self, scale_factor, interpolation=cv2.INTER_AREA):
+        """Kaynak görüntüyü olcekleme ile aynı boyut hesabıyla ölçekler"""
+        h, w = self.goruntu.shape[:2]
+        return self.boyuta_getir((int(w * scale_factor), int(h * scale_factor)), interpolation)
+
+def olcekleme(img, scale_factor, interpolation=cv2.INTER_LINEAR, piramit=False, mip=None):
     """
     Görüntüyü belirtilen ölçek faktörüyle büyütür veya küçültür.
     
+    Büyük oranlı küçültmelerde (ör. 1/16 önizleme) piramit seçeneği tek adımlı
+    yeniden boyutlandırma yerine 2 katlık küçültmeleri art arda uygular; bu,
+    INTER_AREA'dan hızlı, INTER_LINEAR'dan ise örtüşmesiz (aliasing'siz) sonuç verir.
+    
     Args:
         img (numpy.ndarray): İşlenecek görüntü
         scale_factor (float): Ölçek faktörü. 1.0'dan büyük değerler büyütme, 
                              küçük değerler küçültme yapar
-        interpolation (int, optional): Interpolasyon yöntemi. 
-                                     Varsayılan: cv2.INTER_LINEAR.
+        interpolation (int, optional): Interpolasyon yöntemi. Piramit modunda son
+                                     kesirli adımda kullanılır. Varsayılan: cv2.INTER_LINEAR.
+        piramit (bool veya str, optional): 0.5'ten küçük ölçeklerde piramit ile küçült.
+                                         True veya "kutu" 2x2 blok ortalaması, "gauss"
+                                         cv2.pyrDown kullanır. Varsayılan False.
+        mip (MipPiramidi, optional): Aynı görüntü için saklanan seviyeler. Verilirse
+                                     küçültmeler bu seviyelerden başlar. Varsayılan None.
         
     Returns:
         numpy.ndarray: Ölçeklenmiş görüntü
@@ -230,6 +485,17 @@ def olcekleme(img, scale_factor, interpolation=cv2.INTER_LINEAR):
         new_w = int(w * scale_factor)
         new_h = int(h * scale_factor)
         
+        # Boyut değişmiyorsa yeniden örnekleme yapmadan kopyala
+        if (new_w, new_h) == (w, h):
+            return img.copy()
+        
+        # Küçültmelerde saklanan veya geçici mip seviyelerinden başla
+        if scale_factor < 1.0 and mip is not None and mip.goruntu is img:
+            return mip.boyuta_getir((new_w, new_h), interpolation)
+        if scale_factor < 0.5 and piramit:
+            yontem = piramit if isinstance(piramit, str) else "kutu"
+            return MipPiramidi(img, yontem).boyuta_getir((new_w, new_h), interpolation)
+        
         # Görüntüyü yeniden boyutlandır
         resized = cv2.resize(img, (new_w, new_h), interpolation=interpolation)
         
@@ -239,11 +505,60 @@ def olcekleme(img, scale_factor, interpolation=cv2.INTER_LINEAR):
         print(f"Hata: Ölçekleme işlemi uygulanırken bir hata oluştu: {str(e)}")
         return None
 
-def olcekleme_manuel(img, scale_factor):
+def olcekleme_manuel(img, scale_factor, alan_ortalamasi=False):
     """
-    Görüntüyü manuel olarak (piksel değiştirme ile) küçültür. 
+    Görüntüyü manuel olarak (OpenCV kullanmadan) küçültür. 
     Bu fonksiyon sadece küçültme için uygundur (scale_factor > 1).
     
+    Varsayılan yöntem her scale_factor'üncü pikseli adımlı dilimleme ile seçer
+    (döngülü sürümle birebir aynı sonuç). alan_ortalamasi True ise her
+    scale_factor x scale_factor blok ortalanır; örtüşme (aliasing) azalır.
+    
+    Args:
+        img (numpy.ndarray): İşlenecek görüntü
+        scale_factor (int): Küçültme faktörü (2 = yarı boyut, 3 = üçte bir boyut)
+        alan_ortalamasi (bool, optional): True ise blok ortalaması alınır. Varsayılan False.
+        
+    Returns:
+        numpy.ndarray: Küçültülmüş görüntü
+    """
+    if img is None:
+        print("Hata: İşlem yapılacak bir görüntü yok!")
+        return None
+    
+    if scale_factor < 1:
+        print("Hata: Ölçek faktörü 1'den büyük olmalıdır!")
+        return None
+    
+    try:
+        scale_factor = int(scale_factor)
+        h, w = img.shape[:2]
+        
+        new_h, new_w = h // scale_factor, w // scale_factor
+        
+        if not alan_ortalamasi:
+            # Her scale_factor'üncü satır ve sütunu seç
+            return img[:new_h * scale_factor:scale_factor, :new_w * scale_factor:scale_factor].astype(np.uint8)
+        
+        # Blokları ayrı eksenlere aç: (new_h, s, new_w, s, ...) ve blok içinde topla
+        bloklar = img[:new_h * scale_factor, :new_w * scale_factor].reshape(
+            (new_h, scale_factor, new_w, scale_factor) + img.shape[2:])
+        toplam = bloklar.sum(axis=(1, 3), dtype=np.uint32)
+        
+        # Tam sayı bölmede yarımı ekleyerek en yakına yuvarla
+        alan = scale_factor * scale_factor
+        result = (toplam + alan // 2) // alan
+        return result.astype(np.uint8)
+        
+    except Exception as e:
+        print(f"Hata: Manuel ölçekleme işlemi uygulanırken bir hata oluştu: {str(e)}")
+        return None
+
+def _olcekleme_manuel_dongu(img, scale_factor):
+    """
+    olcekleme_manuel'in piksel döngülü ilk sürümü. Yalnızca doğrulama ve hız
+    karşılaştırması (geometri_hiz_karsilastir) için tutulur.
+    
     Args:
         img (numpy.ndarray): İşlenecek görüntü
         scale_factor (int): Küçültme faktörü (2 = yarı boyut, 3 = üçte bir boyut)
@@ -282,6 +597,73 @@ def olcekleme_manuel(img, scale_factor):
         print(f"Hata: Manuel ölçekleme işlemi uygulanırken bir hata oluştu: {str(e)}")
         return None
 
+def geometri_hiz_karsilastir(img, x0=None, y0=None, scale_factor=4, tekrar=5):
+    """
+    aynalama_nokta ve olcekleme_manuel fonksiyonlarının vektörel sürümlerini
+    piksel döngülü ilk sürümleriyle karşılaştırır; süreleri ve sonuçların
+    birebir aynı olup olmadığını yazdırır.
+    
+    Döngülü sürümler büyük görüntülerde onlarca saniye sürebildiği için
+    yalnızca bir kez çalıştırılır.
+    
+    Args:
+        img (numpy.ndarray): Test görüntüsü
+        x0 (int, optional): Aynalama noktasının x koordinatı. Varsayılan görüntü merkezi.
+        y0 (int, optional): Aynalama noktasının y koordinatı. Varsayılan görüntü merkezi.
+        scale_factor (int, optional): Küçültme faktörü. Varsayılan 4.
+        tekrar (int, optional): Vektörel sürümlerin kaç kez çalıştırılacağı. Varsayılan 5.
+        
+    Returns:
+        dict: İşlem adı -> (döngülü süre, vektörel süre, sonuçlar aynı mı)
+    """
+    if img is None:
+        print("Hata: İşlem yapılacak bir görüntü yok!")
+        return None
+    
+    h, w = img.shape[:2]
+    if x0 is None:
+        x0 = w // 2
+    if y0 is None:
+        y0 = h // 2
+    
+    # Eksenlerin ayrı indekslendiğini sınamak için genişliği yüksekliğinden büyük
+    # bir görünüm, tam sayı x ve kesirli (0.5 olmayan) y noktası kullanılır
+    genis = img if w > h else img.swapaxes(0, 1)
+    genis_x0, genis_y0 = genis.shape[1] * 2 // 3, genis.shape[0] / 3 + 0.3
+    
+    testler = [
+        ("aynalama_nokta",
+         lambda: _aynalama_nokta_dongu(img, x0, y0),
+         lambda: aynalama_nokta(img, x0, y0)),
+        ("aynalama_kesirli",
+         lambda: _aynalama_nokta_dongu(genis, genis_x0, genis_y0),
+         lambda: aynalama_nokta(genis, genis_x0, genis_y0)),
+        ("olcekleme_manuel",
+         lambda: _olcekleme_manuel_dongu(img, scale_factor),
+         lambda: olcekleme_manuel(img, scale_factor)),
+    ]
+    
+    sonuclar = {}
+    for ad, dongu, vektorel in testler:
+        baslangic = time.perf_counter()
+        beklenen = dongu()
+        dongu_suresi = time.perf_counter() - baslangic
+        
+        sonuc = vektorel()  # Isınma turu
+        baslangic = time.perf_counter()
+        for _ in range(tekrar):
+            vektorel()
+        vektorel_suresi = (time.perf_counter() - baslangic) / tekrar
+        
+        sonuclar[ad] = (dongu_suresi, vektorel_suresi, np.array_equal(beklenen, sonuc))
+    
+    print(f"Geometri hız karşılaştırması ({w}x{h}):")
+    for ad, (dongu_suresi, vektorel_suresi, ayni) in sonuclar.items():
+        print(f"  {ad:<18} döngü {dongu_suresi * 1000:10.1f} ms | vektörel {vektorel_suresi * 1000:8.2f} ms | "
+              f"{dongu_suresi / max(vektorel_suresi, 1e-9):8.0f}x | {'aynı' if ayni else 'FARKLI'}")
+    
+    return sonuclar
+
 def dondurme(img, angle, center=None, scale=1.0, interpolation=cv2.INTER_LINEAR):
     """
     Görüntüyü belirtilen açıda döndürür.
@@ -311,8 +693,11 @@ def dondurme(img, angle, center=None, scale=1.0, interpolation=cv2.INTER_LINEAR)
         # Döndürme matrisi oluştur
         rotation_matrix = cv2.getRotationMatrix2D(center, angle, scale)
         
-        # Döndürme işlemini uygula
-        rotated = cv2.warpAffine(img, rotation_matrix, (w, h), flags=interpolation)
+        # 90 derecenin katlarında (ölçek 1, tam sayı merkez) kayıpsız hızlı yol
+        rotated = _tam_sayi_afin(img, rotation_matrix, (w, h))
+        if rotated is None:
+            # Döndürme işlemini uygula
+            rotated = cv2.warpAffine(img, rotation_matrix, (w, h), flags=interpolation)
         
         return rotated
         
@@ -320,6 +705,577 @@ def dondurme(img, angle, center=None, scale=1.0, interpolation=cv2.INTER_LINEAR)
         print(f"Hata: Döndürme işlemi uygulanırken bir hata oluştu: {str(e)}")
         return None
 
+class AfinDonusumBirlestirici:
+    """
+    Taşıma, eğme, döndürme, ölçekleme ve aynalama adımlarını 3x3 matrislerin
+    çarpımı olarak biriktiren ve görüntüye tek bir cv2.warpAffine ile uygulayan sınıf.
+    
+    Adımlar ayrı fonksiyonlarla art arda uygulandığında görüntü her adımda yeniden
+    örneklenir (interpolasyon yapılır). Birleştiricide görüntü yalnızca bir kez
+    örneklenir; işlem daha hızlıdır ve ara adımlardaki bulanıklaşma birikmez.
+    
+    Her adım tek başına çağrılan fonksiyonla aynı kuralları kullanır: döndürme
+    merkezi o anki tuvalin ortasıdır, eğme tuvali genişletir, aynalama o anki tuval
+    boyutuna göre yapılır. Çıktı boyutu adımların tuval boyutunu izler ("adimlar")
+    veya dönüştürülmüş görüntünün tamamını kapsayan sınır kutusundan hesaplanır ("kapsa").
+    
+    Zincir yalnızca ölçekleme ve tuval aynalamasından oluşuyorsa sonuç cv2.resize
+    ile üretilir ve olcekleme ile birebir aynıdır. Ölçekleme döndürme, eğme veya
+    taşıma ile birlikte kullanıldığında warpAffine tuvalin dışını siyah kabul eder;
+    büyütmede görüntünün en dış satır ve sütunu siyahla karışarak koyulaşır.
+    
+    Örnek:
+        birlestirici = AfinDonusumBirlestirici().tasi(20, 10).dondur(30).olcekle(0.5)
+        sonuc = birlestirici.uygula(img)
+    """
+    # Adım adı -> arayüzde gösterilecek açıklama
+    ADIM_ADLARI = {
+        "tasima": "Taşıma",
+        "egme_x": "X Eğme",
+        "egme_y": "Y Eğme",
+        "dondurme": "Döndürme",
+        "olcekleme": "Ölçekleme",
+        "aynalama_dikey": "Dikey Aynalama",
+        "aynalama_yatay": "Yatay Aynalama",
+        "aynalama_her_iki_eksen": "Her İki Eksende Aynalama",
+        "aynalama_nokta": "Noktaya Göre Aynalama",
+    }
+
+    def __init__(self):
+        self.adimlar = []
+
+    def _ekle(self, ad, *parametreler):
+        self.adimlar.append((ad, parametreler))
+        return self
+
+    def tasi(self, dx, dy):
+        """tasima ile aynı: (dx, dy) kadar taşır"""
+        return self._ekle("tasima", dx, dy)
+
+    def eg_x(self, sh_x):
+        """egme_x ile aynı: X ekseninde eğer ve tuvali genişletir"""
+        return self._ekle("egme_x", sh_x)
+
+    def eg_y(self, sh_y):
+        """egme_y ile aynı: Y ekseninde eğer ve tuvali uzatır"""
+        return self._ekle("egme_y", sh_y)
+
+    def dondur(self, aci, merkez=None, olcek=1.0):
+        """dondurme ile aynı: merkez verilmezse tuvalin ortası etrafında döndürür"""
+        return self._ekle("dondurme", aci, merkez, olcek)
+
+    def olcekle(self, olcek):
+        """olcekleme ile aynı: tuvali int(boyut * olcek) olacak şekilde ölçekler"""
+        return self._ekle("olcekleme", olcek)
+
+    def aynala_dikey(self):
+        """aynalama_dikey ile aynı (soldan sağa çevirir)"""
+        return self._ekle("aynalama_dikey")
+
+    def aynala_yatay(self):
+        """aynalama_yatay ile aynı (yukarıdan aşağıya çevirir)"""
+        return self._ekle("aynalama_yatay")
+
+    def aynala_her_iki_eksen(self):
+        """aynalama_her_iki_eksen ile aynı"""
+        return self._ekle("aynalama_her_iki_eksen")
+
+    def aynala_nokta(self, x0, y0):
+        """
+        (x0, y0) noktasına göre aynalar. aynalama_nokta'dan farklı olarak
+        aynalanmış görüntünün dışında kalan bölgeler siyah olur.
+        """
+        return self._ekle("aynalama_nokta", x0, y0)
+
+    def geri_al(self):
+        """Son eklenen adımı kaldırır"""
+        if self.adimlar:
+            self.adimlar.pop()
+        return self
+
+    def temizle(self):
+        """Tüm adımları kaldırır"""
+        self.adimlar.clear()
+        return self
+
+    def aciklamalar(self):
+        """Adımların okunabilir açıklamalarının listesi"""
+        sonuc = []
+        for ad, parametreler in self.adimlar:
+            degerler = ", ".join(str(p) for p in parametreler if p is not None)
+            sonuc.append(f"{self.ADIM_ADLARI[ad]} ({degerler})" if degerler else self.ADIM_ADLARI[ad])
+        return sonuc
+
+    @staticmethod
+    def _adim_matrisi(ad, parametreler, w, h):
+        """Tek adımın 3x3 matrisini ve adımdan sonraki tuval boyutunu döndürür"""
+        M = np.eye(3)
+        if ad == "tasima":
+            dx, dy = parametreler
+            M[0, 2], M[1, 2] = dx, dy
+        elif ad == "egme_x":
+            sh_x, = parametreler
+            M[0, 1] = sh_x
+            w = w + int(abs(sh_x) * h)
+        elif ad == "egme_y":
+            sh_y, = parametreler
+            M[1, 0] = sh_y
+            h = h + int(abs(sh_y) * w)
+        elif ad == "dondurme":
+            aci, merkez, olcek = parametreler
+            if merkez is None:
+                merkez = (w // 2, h // 2)
+            M[:2] = cv2.getRotationMatrix2D(merkez, aci, olcek)
+        elif ad == "olcekleme":
+            olcek, = parametreler
+            yeni_w, yeni_h = int(w * olcek), int(h * olcek)
+            # cv2.resize'ın piksel merkezi hizalaması: x' = sx * x + (sx - 1) / 2
+            sx, sy = yeni_w / w, yeni_h / h
+            M[0, 0], M[0, 2] = sx, (sx - 1) / 2
+            M[1, 1], M[1, 2] = sy, (sy - 1) / 2
+            w, h = yeni_w, yeni_h
+        elif ad == "aynalama_dikey":
+            M[0, 0], M[0, 2] = -1, w - 1
+        elif ad == "aynalama_yatay":
+            M[1, 1], M[1, 2] = -1, h - 1
+        elif ad == "aynalama_her_iki_eksen":
+            M[0, 0], M[0, 2] = -1, w - 1
+            M[1, 1], M[1, 2] = -1, h - 1
+        elif ad == "aynalama_nokta":
+            x0, y0 = parametreler
+            M[0, 0], M[0, 2] = -1, 2 * x0
+            M[1, 1], M[1, 2] = -1, 2 * y0
+        return M, (w, h)
+
+    def matris(self, boyut, cerceve="adimlar"):
+        """
+        Birikmiş dönüşüm matrisini ve çıktı boyutunu hesaplar
+        
+        Args:
+            boyut (tuple): Giriş görüntüsünün (genişlik, yükseklik) değeri
+            cerceve (str, optional): "adimlar" adımların tuval boyutunu kullanır,
+                                     "kapsa" dönüştürülmüş görüntünün tamamını içeren
+                                     sınır kutusunu kullanır. Varsayılan "adimlar".
+            
+        Returns:
+            tuple: (2x3 afin matris, (çıktı genişliği, çıktı yüksekliği))
+        """
+        w, h = boyut
+        toplam = np.eye(3)
+        for ad, parametreler in self.adimlar:
+            M, (w, h) = self._adim_matrisi(ad, parametreler, w, h)
+            toplam = M @ toplam
+        
+        if cerceve == "kapsa":
+            # Giriş köşelerini dönüştür ve sınır kutusunu sıfırdan başlat
+            gw, gh = boyut
+            koseler = np.array([[0, 0, 1], [gw - 1, 0, 1], [0, gh - 1, 1], [gw - 1, gh - 1, 1]], dtype=np.float64)
+            donusmus = koseler @ toplam[:2].T
+            en_kucuk = donusmus.min(axis=0)
+            en_buyuk = donusmus.max(axis=0)
+            toplam[0, 2] -= en_kucuk[0]
+            toplam[1, 2] -= en_kucuk[1]
+            w, h = (np.ceil(en_buyuk - en_kucuk - 1e-6).astype(int) + 1)
+        
+        return toplam[:2], (int(w), int(h))
+
+    def uygula(self, img, interpolation=cv2.INTER_LINEAR, cerceve="adimlar"):
+        """
+        Biriken tüm adımları görüntüye tek bir yeniden örneklemeyle uygular
+        
+        Args:
+            img (numpy.ndarray): İşlenecek görüntü
+            interpolation (int, optional): İnterpolasyon yöntemi. Varsayılan cv2.INTER_LINEAR.
+            cerceve (str, optional): Çıktı boyutu seçimi ("adimlar" veya "kapsa"). Varsayılan "adimlar".
+            
+        Returns:
+            numpy.ndarray: Dönüştürülmüş görüntü, hata durumunda None
+        """
+        if img is None:
+            print("Hata: İşlem yapılacak bir görüntü yok!")
+            return None
+        
+        try:
+            h, w = img.shape[:2]
+            M, (yeni_w, yeni_h) = self.matris((w, h), cerceve)
+            if yeni_w <= 0 or yeni_h <= 0:
+                print("Hata: Dönüşüm sonucunda görüntü boyutu sıfır oldu!")
+                return None
+            
+            # Sonuç yalnızca piksel yer değiştirmesiyse (aynalama, 90 derece katları,
+            # tam sayı taşıma) interpolasyonsuz hızlı yol kullanılır
+            sonuc = _tam_sayi_afin(img, M, (yeni_w, yeni_h))
+            # Yalnızca ölçekleme ve tuval aynalamasından oluşan zincirler cv2.resize ile
+            # yapılır; böylece kenarlar olcekleme'deki gibi siyahla karışmaz
+            if sonuc is None:
+                sonuc = _olcek_ve_aynalama(img, M, (yeni_w, yeni_h), interpolation)
+            if sonuc is None:
+                sonuc = cv2.warpAffine(img, M, (yeni_w, yeni_h), flags=interpolation)
+            return sonuc
+            
+        except Exception as e:
+            print(f"Hata: Birleşik afin dönüşüm uygulanırken bir hata oluştu: {str(e)}")
+            return None
+
+# Remap haritası önbelleği için varsayılan bellek sınırı (bayt)
+_REMAP_ONBELLEGI_BUTCESI = 256 * 1024 * 1024
+
+# OpenCV'nin warpAffine/warpPerspective içindeki sabit nokta ayarları
+_INTER_BITS = 5
+_INTER_TAB_SIZE = 1 << _INTER_BITS
+_AB_BITS = 10
+_AB_SCALE = 1 << _AB_BITS
+
+def _sabit_noktali_haritalar(X, Y, en_yakin):
+    """
+    1/32 piksel (en yakın komşuda tam piksel) birimindeki tam sayı koordinatları
+    cv2.remap'in CV_16SC2 + tablo indeksi biçimine dönüştürür
+    """
+    harita1 = np.empty(X.shape + (2,), dtype=np.int16)
+    if en_yakin:
+        harita1[..., 0] = np.clip(X, -32768, 32767)
+        harita1[..., 1] = np.clip(Y, -32768, 32767)
+        return harita1, None
+    harita1[..., 0] = np.clip(X >> _INTER_BITS, -32768, 32767)
+    harita1[..., 1] = np.clip(Y >> _INTER_BITS, -32768, 32767)
+    harita2 = ((Y & (_INTER_TAB_SIZE - 1)) * _INTER_TAB_SIZE + (X & (_INTER_TAB_SIZE - 1))).astype(np.uint16)
+    return harita1, harita2
+
+def _afin_haritalari(M, cikti_boyutu, en_yakin):
+    """warpAffine'in koordinat yuvarlamasını birebir izleyen remap haritaları"""
+    dw, dh = cikti_boyutu
+    Mt = cv2.invertAffineTransform(np.asarray(M, dtype=np.float64))
+    xs = np.arange(dw, dtype=np.float64)
+    ys = np.arange(dh, dtype=np.float64)[:, None]
+    
+    # warpAffine: satır terimi ve sütun terimi ayrı ayrı AB_BITS hassasiyetinde yuvarlanır
+    yuvarlama = _AB_SCALE // 2 if en_yakin else _AB_SCALE // _INTER_TAB_SIZE // 2
+    kaydirma = _AB_BITS if en_yakin else _AB_BITS - _INTER_BITS
+    X = (np.rint(Mt[0, 0] * xs * _AB_SCALE).astype(np.int64) +
+         np.rint((Mt[0, 1] * ys + Mt[0, 2]) * _AB_SCALE).astype(np.int64) + yuvarlama) >> kaydirma
+    Y = (np.rint(Mt[1, 0] * xs * _AB_SCALE).astype(np.int64) +
+         np.rint((Mt[1, 1] * ys + Mt[1, 2]) * _AB_SCALE).astype(np.int64) + yuvarlama) >> kaydirma
+    return _sabit_noktali_haritalar(X, Y, en_yakin)
+
+def _perspektif_haritalari(M, cikti_boyutu, en_yakin):
+    """warpPerspective'in koordinat yuvarlamasını birebir izleyen remap haritaları"""
+    dw, dh = cikti_boyutu
+    Mt = np.linalg.inv(np.asarray(M, dtype=np.float64))
+    xs = np.arange(dw, dtype=np.float64)
+    ys = np.arange(dh, dtype=np.float64)[:, None]
+    
+    X0 = Mt[0, 0] * xs + Mt[0, 1] * ys + Mt[0, 2]
+    Y0 = Mt[1, 0] * xs + Mt[1, 1] * ys + Mt[1, 2]
+    W = Mt[2, 0] * xs + Mt[2, 1] * ys + Mt[2, 2]
+    olcek = 1.0 if en_yakin else float(_INTER_TAB_SIZE)
+    W = np.where(W != 0, olcek / np.where(W != 0, W, 1.0), 0.0)
+    
+    sinir = float(np.iinfo(np.int32).max)
+    X = np.rint(np.clip(X0 * W, -sinir, sinir)).astype(np.int64)
+    Y = np.rint(np.clip(Y0 * W, -sinir, sinir)).astype(np.int64)
+    return _sabit_noktali_haritalar(X, Y, en_yakin)
+
+def remap_haritalari(M, cikti_boyutu, interpolation=cv2.INTER_LINEAR, perspektif=False):
+    """
+    Dönüşümün cv2.remap haritalarını önbelleğe koymadan hesaplar. Haritalar
+    başka bir sürece gönderilecek veya ayrıca saklanacaksa kullanılır.
+    
+    Args:
+        M (numpy.ndarray): 2x3 afin veya 3x3 perspektif matris (kaynak -> hedef)
+        cikti_boyutu (tuple): Çıktının (genişlik, yükseklik) değeri
+        interpolation (int, optional): İnterpolasyon yöntemi. Varsayılan cv2.INTER_LINEAR.
+        perspektif (bool, optional): M 3x3 perspektif matris ise True. Varsayılan False.
+        
+    Returns:
+        tuple: (harita1, harita2) cv2.remap'e verilecek haritalar
+    """
+    olustur = _perspektif_haritalari if perspektif else _afin_haritalari
+    return olustur(M, tuple(cikti_boyutu), interpolation == cv2.INTER_NEAREST)
+
+class RemapHaritaOnbellegi:
+    """
+    Sabit bir geometrik dönüşüm (döndürme, eğme, perspektif) için cv2.remap
+    koordinat haritalarını bayt bütçesiyle sınırlı LRU düzeninde saklayan sınıf.
+    
+    Aynı matris sabit kameradan gelen birçok kareye uygulandığında her piksel için
+    koordinat dönüşümü yalnızca bir kez hesaplanır; sonraki karelerde yalnızca
+    piksel toplama (gather) maliyeti ödenir. Haritalar sabit noktalı CV_16SC2
+    biçiminde ve OpenCV'nin warp fonksiyonlarıyla aynı yuvarlamayla üretilir.
+    Anahtar matris, giriş boyutu, çıktı boyutu, dönüşüm türü ve en yakın komşu
+    seçiminden oluşur. Erişim kilitle korunur.
+    """
+    def __init__(self, bayt_butcesi=_REMAP_ONBELLEGI_BUTCESI):
+        self.bayt_butcesi = bayt_butcesi
+        self._kayitlar = OrderedDict()
+        self._kilit = threading.Lock()
+        self.kullanilan_bayt = 0
+        self.isabet = 0
+        self.iska = 0
+        self.tahliye = 0
+
+    @staticmethod
+    def anahtar(M, giris_boyutu, cikti_boyutu, perspektif=False, en_yakin=False):
+        """Dönüşüm için önbellek anahtarını döndürür"""
+        M = np.round(np.asarray(M, dtype=np.float64), 9)
+        return (M.tobytes(), tuple(giris_boyutu), tuple(cikti_boyutu), perspektif, en_yakin)
+
+    @staticmethod
+    def _boyut(haritalar):
+        return sum(h.nbytes for h in haritalar if h is not None)
+
+    def al(self, M, giris_boyutu, cikti_boyutu, perspektif=False, en_yakin=False):
+        """
+        Dönüşümün remap haritalarını döndürür; önbellekte yoksa hesaplayıp saklar
+        
+        Args:
+            M (numpy.ndarray): 2x3 afin veya 3x3 perspektif matris (kaynak -> hedef)
+            giris_boyutu (tuple): Giriş görüntüsünün (genişlik, yükseklik) değeri
+            cikti_boyutu (tuple): Çıktının (genişlik, yükseklik) değeri
+            perspektif (bool, optional): M 3x3 perspektif matris ise True. Varsayılan False.
+            en_yakin (bool, optional): En yakın komşu interpolasyonu için haritalar. Varsayılan False.
+            
+        Returns:
+            tuple: (harita1, harita2) cv2.remap'e verilecek haritalar
+        """
+        anahtar = self.anahtar(M, giris_boyutu, cikti_boyutu, perspektif, en_yakin)
+        with self._kilit:
+            haritalar = self._kayitlar.get(anahtar)
+            if haritalar is not None:
+                self._kayitlar.move_to_end(anahtar)
+                self.isabet += 1
+                return haritalar
+            self.iska += 1
+        
+        # Hesaplama kilit dışında yapılır; aynı anda iki iş aynı haritayı hesaplarsa biri saklanır
+        olustur = _perspektif_haritalari if perspektif else _afin_haritalari
+        haritalar = olustur(M, cikti_boyutu, en_yakin)
+        for harita in haritalar:
+            if harita is not None:
+                harita.flags.writeable = False
+        
+        boyut = self._boyut(haritalar)
+        if boyut <= self.bayt_butcesi:
+            with self._kilit:
+                eski = self._kayitlar.pop(anahtar, None)
+                if eski is not None:
+                    self.kullanilan_bayt -= self._boyut(eski)
+                self._kayitlar[anahtar] = haritalar
+                self.kullanilan_bayt += boyut
+                while self.kullanilan_bayt > self.bayt_butcesi and self._kayitlar:
+                    _, cikan = self._kayitlar.popitem(last=False)
+                    self.kullanilan_bayt -= self._boyut(cikan)
+                    self.tahliye += 1
+        return haritalar
+
+    def temizle(self):
+        """Tüm kayıtları siler (istatistikler korunur)"""
+        with self._kilit:
+            self._kayitlar.clear()
+            self.kullanilan_bayt = 0
+
+    def istatistikler(self):
+        """
+        Önbellek durumunu döndürür
+        
+        Returns:
+            dict: kayit, kullanilan_bayt, bayt_butcesi, isabet, iska ve tahliye
+        """
+        with self._kilit:
+            return {
+                "kayit": len(self._kayitlar),
+                "kullanilan_bayt": self.kullanilan_bayt,
+                "bayt_butcesi": self.bayt_butcesi,
+                "isabet": self.isabet,
+                "iska": self.iska,
+                "tahliye": self.tahliye,
+            }
+
+# Modül genelinde paylaşılan remap haritası önbelleği
+remap_onbellegi = RemapHaritaOnbellegi()
+
+def remap_uygula(img, M, cikti_boyutu, interpolation=cv2.INTER_LINEAR, perspektif=False):
+    """
+    Afin veya perspektif dönüşümü önbellekteki remap haritalarıyla uygular.
+    
+    Haritalar cv2.warpAffine / cv2.warpPerspective ile aynı sabit noktalı
+    yuvarlamayla üretilir; sonuç pratikte birebir aynıdır, yalnızca yuvarlama
+    sınırına düşen nadir piksellerde ve kübik interpolasyonda en fazla ±1 farklıdır.
+    
+    Args:
+        img (numpy.ndarray): İşlenecek görüntü
+        M (numpy.ndarray): 2x3 afin veya 3x3 perspektif matris (kaynak -> hedef)
+        cikti_boyutu (tuple): Çıktının (genişlik, yükseklik) değeri
+        interpolation (int, optional): İnterpolasyon yöntemi. Varsayılan cv2.INTER_LINEAR.
+        perspektif (bool, optional): M 3x3 perspektif matris ise True. Varsayılan False.
+        
+    Returns:
+        numpy.ndarray: Dönüştürülmüş görüntü, hata durumunda None
+    """
+    if img is None:
+        print("Hata: İşlem yapılacak bir görüntü yok!")
+        return None
+    
+    try:
+        h, w = img.shape[:2]
+        if max(h, w) > 32767:
+            # CV_16SC2 koordinatları bu boyutları gösteremez
+            if perspektif:
+                return cv2.warpPerspective(img, M, tuple(cikti_boyutu), flags=interpolation)
+            return cv2.warpAffine(img, M, tuple(cikti_boyutu), flags=interpolation)
+        
+        en_yakin = interpolation == cv2.INTER_NEAREST
+        harita1, harita2 = remap_onbellegi.al(M, (w, h), cikti_boyutu, perspektif, en_yakin)
+        return cv2.remap(img, harita1, harita2, interpolation, borderMode=cv2.BORDER_CONSTANT)
+        
+    except Exception as e:
+        print(f"Hata: Remap dönüşümü uygulanırken bir hata oluştu: {str(e)}")
+        return None
+
+# Rastgele geometrik veri artırma (augmentation)
+# Parametreler parti halinde vektörel olarak örneklenir, her örneğin taşıma,
+# döndürme, ölçekleme, eğme ve aynalama adımları tek bir 2x3 matriste birleşir
+# ve görüntü tek bir warpAffine ile üretilir. Warp'lar iş parçacığı havuzunda
+# çalışır (OpenCV işlem sırasında GIL'i bırakır).
+
+_artirma_havuzu = None
+
+def _artirma_havuzu_al():
+    """Veri artırma için paylaşılan iş parçacığı havuzunu döndürür (ilk çağrıda oluşturur)"""
+    global _artirma_havuzu
+    if _artirma_havuzu is None:
+        _artirma_havuzu = ThreadPoolExecutor(max_workers=os.cpu_count() or 4)
+    return _artirma_havuzu
+
+def rastgele_afin_matrisleri(adet, boyut, rng=None, aci_araligi=(-15, 15), olcek_araligi=(0.9, 1.1),
+                             tasima_orani=0.1, egme_araligi=(-0.1, 0.1), aynalama_olasiligi=0.5,
+                             cikti_boyutu=None):
+    """
+    adet kadar rastgele afin dönüşüm matrisini tek seferde (vektörel) üretir.
+    
+    Her matris sırasıyla yatay aynalama, görüntü merkezi etrafında döndürme ve
+    ölçekleme (dondurme ile aynı yön), X eğmesi (egme_x) ve taşımayı (tasima)
+    birleştirir; merkez çıktı tuvalinin merkezine taşınır.
+    
+    Args:
+        adet (int): Üretilecek matris sayısı
+        boyut (tuple): Giriş görüntüsünün (genişlik, yükseklik) değeri
+        rng (numpy.random.Generator, optional): Rastgele sayı üreteci. Varsayılan yeni üreteç.
+        aci_araligi (tuple, optional): Döndürme açısı aralığı (derece). Varsayılan (-15, 15).
+        olcek_araligi (tuple, optional): Ölçek aralığı. Varsayılan (0.9, 1.1).
+        tasima_orani (float, optional): Boyuta oranla en büyük taşıma. Varsayılan 0.1.
+        egme_araligi (tuple, optional): X eğme faktörü aralığı. Varsayılan (-0.1, 0.1).
+        aynalama_olasiligi (float, optional): Yatay aynalama olasılığı. Varsayılan 0.5.
+        cikti_boyutu (tuple, optional): Çıktının (genişlik, yükseklik) değeri. Varsayılan giriş boyutu.
+        
+    Returns:
+        numpy.ndarray: (adet, 2, 3) boyutlu float64 matrisler
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    w, h = boyut
+    cw, ch = cikti_boyutu if cikti_boyutu is not None else boyut
+    
+    aci = np.deg2rad(rng.uniform(*aci_araligi, size=adet))
+    olcek = rng.uniform(*olcek_araligi, size=adet)
+    egme = rng.uniform(*egme_araligi, size=adet)
+    tx = rng.uniform(-tasima_orani, tasima_orani, size=adet) * cw
+    ty = rng.uniform(-tasima_orani, tasima_orani, size=adet) * ch
+    ayna = np.where(rng.random(adet) < aynalama_olasiligi, -1.0, 1.0)
+    
+    # Doğrusal kısım: Eğme · Döndürme/Ölçek · Aynalama (dondurme ile aynı açı yönü)
+    cos, sin = olcek * np.cos(aci), olcek * np.sin(aci)
+    a = cos * ayna
+    b = sin
+    c = -sin * ayna
+    d = cos
+    L = np.empty((adet, 2, 2))
+    L[:, 0, 0] = a + egme * c
+    L[:, 0, 1] = b + egme * d
+    L[:, 1, 0] = c
+    L[:, 1, 1] = d
+    
+    # Giriş merkezini çıktı merkezine götüren öteleme + rastgele taşıma
+    merkez = np.array([(w - 1) / 2, (h - 1) / 2])
+    M = np.empty((adet, 2, 3))
+    M[:, :, :2] = L
+    M[:, :, 2] = np.array([(cw - 1) / 2, (ch - 1) / 2]) - L @ merkez + np.stack([tx, ty], axis=1)
+    return M
+
+def _artirma_parcasi(kaynaklar, indeksler, matrisler, hedef, cikti_boyutu, interpolation, kenar):
+    """Bir iş parçacığının payına düşen örnekleri doğrudan hedef dilimlerine yazar"""
+    for i in range(len(matrisler)):
+        cv2.warpAffine(kaynaklar[indeksler[i]], matrisler[i], cikti_boyutu, dst=hedef[i],
+                       flags=interpolation, borderMode=kenar)
+
+def artirma_uret(goruntuler, adet, parti_boyutu=64, cikti_boyutu=None, tohum=None,
+                 interpolation=cv2.INTER_LINEAR, kenar=cv2.BORDER_CONSTANT, hedef=None, **parametreler):
+    """
+    Rastgele geometrik veri artırma partileri üreten üreteç (generator).
+    
+    Her partinin parametreleri rastgele_afin_matrisleri ile vektörel olarak
+    örneklenir; her örnek tek bir warpAffine ile, iş parçacığı havuzunda ve
+    doğrudan parti dizisinin içine üretilir.
+    
+    Args:
+        goruntuler (numpy.ndarray veya list): Tek görüntü veya aynı boyutlu görüntüler.
+                                              Her örnek için kaynak rastgele seçilir.
+        adet (int): Toplam üretilecek örnek sayısı
+        parti_boyutu (int, optional): Parti başına örnek sayısı. Varsayılan 64.
+        cikti_boyutu (tuple, optional): Çıktının (genişlik, yükseklik) değeri. Varsayılan giriş boyutu.
+        tohum (int, optional): Tekrarlanabilir sonuçlar için rastgele tohum. Varsayılan None.
+        interpolation (int, optional): İnterpolasyon yöntemi. Varsayılan cv2.INTER_LINEAR.
+        kenar (int, optional): Kenar doldurma yöntemi. Varsayılan cv2.BORDER_CONSTANT.
+        hedef (numpy.ndarray, optional): (parti_boyutu, yükseklik, genişlik[, kanal]) boyutlu,
+                                         önceden ayrılmış parti dizisi. Verilirse her parti bu
+                                         diziye yazılır ve görünümü döndürülür; bir sonraki parti
+                                         istenmeden önce kullanılmalı veya kopyalanmalıdır.
+        **parametreler: rastgele_afin_matrisleri'nin aralık parametreleri
+        
+    Yields:
+        tuple: (parti dizisi, (n, 2, 3) matrisler, (n,) kaynak indeksleri)
+    """
+    if isinstance(goruntuler, np.ndarray):
+        goruntuler = [goruntuler]
+    if not goruntuler or any(g is None for g in goruntuler):
+        print("Hata: İşlem yapılacak bir görüntü yok!")
+        return
+    
+    h, w = goruntuler[0].shape[:2]
+    if any(g.shape != goruntuler[0].shape for g in goruntuler):
+        print("Hata: Tüm görüntüler aynı boyutta olmalıdır!")
+        return
+    
+    cikti_boyutu = tuple(cikti_boyutu) if cikti_boyutu is not None else (w, h)
+    parti_sekli = (parti_boyutu, cikti_boyutu[1], cikti_boyutu[0]) + goruntuler[0].shape[2:]
+    if hedef is not None and (hedef.shape != parti_sekli or hedef.dtype != goruntuler[0].dtype
+                              or not hedef.flags.c_contiguous):
+        print(f"Hata: Hedef dizi {parti_sekli} boyutlu, bitişik ve {goruntuler[0].dtype} türünde olmalıdır!")
+        return
+    
+    rng = np.random.default_rng(tohum)
+    havuz = _artirma_havuzu_al()
+    parca_sayisi = os.cpu_count() or 4
+    
+    uretilen = 0
+    while uretilen < adet:
+        n = min(parti_boyutu, adet - uretilen)
+        matrisler = rastgele_afin_matrisleri(n, (w, h), rng, cikti_boyutu=cikti_boyutu, **parametreler)
+        indeksler = rng.integers(0, len(goruntuler), size=n)
+        parti = hedef[:n] if hedef is not None else np.empty((n,) + parti_sekli[1:], dtype=goruntuler[0].dtype)
+        
+        # Partiyi iş parçacıkları arasında bitişik parçalara böl
+        sinirlar = np.linspace(0, n, min(parca_sayisi, n) + 1).astype(int)
+        isler = [
+            havuz.submit(_artirma_parcasi, goruntuler, indeksler[b:e], matrisler[b:e], parti[b:e],
+                         cikti_boyutu, interpolation, kenar)
+            for b, e in zip(sinirlar[:-1], sinirlar[1:])
+        ]
+        for is_ in isler:
+            is_.result()
+        
+        uretilen += n
+        yield parti, matrisler, indeksler
+
 def kirpma(img, x, y, genislik, yukseklik):
     """
     Görüntüyü belirtilen koordinatlardan başlayarak, verilen genişlik ve yükseklikte kırpar.
@@ -371,6 +1327,7 @@ class MouseSeciciKirpma:
         self.start_y = -1
         self.end_x = -1
         self.end_y = -1
+        self.secim = None
 
     def on_mouse(self, event, x, y, flags, param):
         """Mouse olaylarını işleyen fonksiyon"""
@@ -407,16 +1364,16 @@ class MouseSeciciKirpma:
         # Görüntüyü göster
         cv2.imshow(self.window_name, current_img)
 
-    def secim_yap(self, img):
+    def bolge_sec(self, img):
         """
-        Görüntüyü gösterir ve kullanıcının mouse ile seçim yapmasını sağlar.
-        Seçim tamamlandığında, seçilen bölgeyi kırpar ve döndürür.
+        Görüntüyü gösterir ve kullanıcının mouse ile dikdörtgen bir bölge seçmesini sağlar.
+        Görüntüyü kırpmaz, yalnızca seçilen bölgenin koordinatlarını döndürür.
         
         Args:
-            img (numpy.ndarray): Kırpılacak görüntü
+            img (numpy.ndarray): Üzerinde seçim yapılacak görüntü
             
         Returns:
-            numpy.ndarray: Kırpılmış görüntü veya None (iptal edilirse)
+            tuple: Seçilen bölgenin (x, y, genişlik, yükseklik) değeri veya None (iptal edilirse)
         """
         if img is None:
             print("Hata: İşlem yapılacak bir görüntü yok!")
@@ -434,6 +1391,7 @@ class MouseSeciciKirpma:
             self.start_y = -1
             self.end_x = -1
             self.end_y = -1
+            self.secim = None
             
             # Pencereyi oluştur ve mouse olaylarını bağla
             cv2.namedWindow(self.window_name)
@@ -457,30 +1415,49 @@ class MouseSeciciKirpma:
                 print("Seçim iptal edildi.")
                 return None
             
-            # Seçim yapıldıysa kırpma işlemini gerçekleştir
             if len(self.roi_pts) == 2:
                 x1, y1 = self.roi_pts[0]
                 x2, y2 = self.roi_pts[1]
                 
-                # Kırpma bölgesini hesapla
+                # Seçim bölgesini hesapla
                 x = min(x1, x2)
                 y = min(y1, y2)
                 w = abs(x2 - x1)
                 h = abs(y2 - y1)
                 
-                # Kırpma işlemini uygula
-                cropped = kirpma(self.img, x, y, w, h)
+                if w == 0 or h == 0:
+                    print("Geçerli bir seçim yapılmadı.")
+                    return None
                 
+                self.secim = (x, y, w, h)
                 print(f"Seçilen bölge: X={x}, Y={y}, Genişlik={w}, Yükseklik={h}")
-                return cropped
+                return self.secim
             else:
                 print("Geçerli bir seçim yapılmadı.")
                 return None
                 
         except Exception as e:
-            print(f"Hata: Mouse ile kırpma işlemi sırasında bir hata oluştu: {str(e)}")
+            print(f"Hata: Mouse ile bölge seçimi sırasında bir hata oluştu: {str(e)}")
             return None
 
+    def secim_yap(self, img):
+        """
+        Görüntüyü gösterir ve kullanıcının mouse ile seçim yapmasını sağlar.
+        Seçim tamamlandığında, seçilen bölgeyi kırpar ve döndürür.
+        
+        Args:
+            img (numpy.ndarray): Kırpılacak görüntü
+            
+        Returns:
+            numpy.ndarray: Kırpılmış görüntü veya None (iptal edilirse)
+        """
+        secim = self.bolge_sec(img)
+        if secim is None:
+            return None
+        
+        # Kırpma işlemini uygula
+        return kirpma(self.img, *secim)
+
 def mouse_ile_kirp(img):
     """
     Mouse ile seçim yaparak görüntüyü kırpma işlemini gerçekleştirir.
@@ -494,6 +1471,109 @@ def mouse_ile_kirp(img):
     secici = MouseSeciciKirpma()
     return secici.secim_yap(img)
 
+def mouse_ile_bolge_sec(img):
+    """
+    Mouse ile dikdörtgen çizerek görüntü üzerinde bir işlem bölgesi seçer.
+    
+    Args:
+        img (numpy.ndarray): Üzerinde seçim yapılacak görüntü
+        
+    Returns:
+        tuple: Seçilen bölgenin (x, y, genişlik, yükseklik) değeri veya None (iptal edilirse)
+    """
+    secici = MouseSeciciKirpma("Mouse ile Bölge Seçimi")
+    return secici.bolge_sec(img)
+
+def _bolge_tuvali(img, ornek):
+    """Tam görüntünün, işlem sonucuyla aynı kanal sayısı ve türdeki kopyasını oluşturur"""
+    if img.ndim == 3 and ornek.ndim == 2:
+        tuval = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+    elif img.ndim == 2 and ornek.ndim == 3:
+        tuval = cv2.cvtColor(img, cv2.COLOR_GRAY2BGR)
+    else:
+        tuval = img.copy()
+    
+    if tuval.dtype != ornek.dtype:
+        tuval = tuval.astype(ornek.dtype)
+    return tuval
+
+def bolgede_uygula(img, bolge, islem, hale=0, hedef=None):
+    """
+    Bir görüntü işlemini yalnızca seçilen dikdörtgen bölgeye uygular.
+    
+    İşlem, bölge ve çevresindeki hale (genellikle çekirdek yarıçapı) kadar
+    genişletilmiş alanın görünümü üzerinde çalıştırılır; böylece bölge
+    kenarındaki pikseller tüm görüntü işlenmiş gibi komşularını görür. Sonucun
+    yalnızca bölgeye düşen kısmı tam görüntünün kopyasına yapıştırılır. Büyük
+    görüntülerde ağır bir filtrenin küçük bir alanda denenmesi, işlem süresini
+    tüm görüntü yerine bölgenin boyutuyla orantılı hale getirir.
+    
+    Histogram eşitleme, Otsu veya frekans filtreleri gibi tüm görüntüye bağlı
+    işlemler bölge içindeki verilerle hesaplanır. Sobel, Compass veya Gabor gibi
+    sonucu en küçük/en büyük değere göre normalize eden işlemler de bölge ve hale
+    içindeki değer aralığına göre normalize edilir; bölgedeki parlaklık tam
+    görüntüdekinden farklı olabilir. Canny'nin histerezis takibi gibi hale ile
+    sınırlanamayan işlemler bölge kenarında küçük farklar verebilir.
+    
+    Aynı bölgede art arda deneme yapılırken önceki sonuç hedef olarak verilirse
+    yalnızca bölge yazılır; tam görüntünün kopyalanması veya renk dönüşümü her
+    çağrıda tekrarlanmaz. Hedef görüntünün kendisi de olabilir (yerinde işlem).
+    
+    Args:
+        img (numpy.ndarray): İşlenecek tam görüntü
+        bolge (tuple): İşlem bölgesinin (x, y, genişlik, yükseklik) değeri
+        islem (callable): Görüntü alıp aynı boyutta görüntü döndüren işlem
+        hale (int, optional): Bölgenin her yönde genişletileceği piksel sayısı. Varsayılan 0.
+        hedef (numpy.ndarray, optional): Sonucun yapıştırılacağı tam boyutlu görüntü. Verilmezse
+                                         veya boyutu, kanal sayısı ya da türü işlem sonucuna
+                                         uymuyorsa görüntünün bir kopyası oluşturulur.
+        
+    Returns:
+        numpy.ndarray: Bölgesi işlenmiş tam görüntü (uygunsa hedef dizinin kendisi)
+    """
+    if img is None:
+        print("Hata: İşlem yapılacak bir görüntü yok!")
+        return None
+    
+    try:
+        h, w = img.shape[:2]
+        x, y, genislik, yukseklik = (int(v) for v in bolge)
+        
+        # Bölgeyi görüntü sınırlarına göre ayarla (kirpma ile aynı kurallar)
+        x = max(0, min(x, w - 1))
+        y = max(0, min(y, h - 1))
+        genislik = min(genislik, w - x)
+        yukseklik = min(yukseklik, h - y)
+        if genislik <= 0 or yukseklik <= 0:
+            print("Hata: İşlem bölgesi boş!")
+            return None
+        
+        # Hale ile genişletilmiş alan (görüntü dışına taşmadan)
+        hale = max(0, int(hale))
+        x0, y0 = max(0, x - hale), max(0, y - hale)
+        x1, y1 = min(w, x + genislik + hale), min(h, y + yukseklik + hale)
+        
+        sonuc = islem(img[y0:y1, x0:x1])
+        if sonuc is None:
+            return None
+        if sonuc.shape[:2] != (y1 - y0, x1 - x0):
+            print("Hata: Bölge işleme yalnızca görüntü boyutunu koruyan işlemlerle kullanılabilir!")
+            return None
+        
+        ic = sonuc[y - y0:y - y0 + yukseklik, x - x0:x - x0 + genislik]
+        
+        # Hedef yoksa veya işlem sonucuna uymuyorsa tam görüntünün kopyası oluşturulur
+        if hedef is None or hedef.shape != (h, w) + sonuc.shape[2:] or hedef.dtype != sonuc.dtype:
+            hedef = _bolge_tuvali(img, sonuc)
+        
+        # Sonucu tam görüntünün bölge görünümüne yapıştır
+        hedef[y:y + yukseklik, x:x + genislik] = ic
+        return hedef
+        
+    except Exception as e:
+        print(f"Hata: Bölge işleme sırasında bir hata oluştu: {str(e)}")
+        return None
+
 def goruntu_goster(img, baslik="Görüntü", bekle=True):
     """
     Görüntüyü ekranda gösterir
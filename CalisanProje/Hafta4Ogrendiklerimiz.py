@@ -1,15 +1,42 @@
 import cv2
 import numpy as np
 import matplotlib.pyplot as plt
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+import Hafta1Ogrendiklerimiz as hafta1
+import Hafta3Ogrendiklerimiz as hafta3
 
-def perspektif_duzeltme(img, kaynak_noktalar, hedef_boyut=(500, 500)):
+# Toplu düzeltmede iş süreçlerine başlangıçta bir kez gönderilen homografi listesi
+# ve sürecin son işlediği köşe setinin (indeks, harita1, harita2) haritaları
+_toplu_matrisler = None
+_toplu_haritalar = None
+
+def _hedef_noktalar(hedef_boyut):
+    """Düzeltilmiş görüntünün köşe noktalarını (sol üst, sağ üst, sol alt, sağ alt) döndürür"""
+    width, height = hedef_boyut
+    return np.float32([
+        [0, 0],           # Sol üst
+        [width, 0],       # Sağ üst
+        [0, height],      # Sol alt
+        [width, height]   # Sağ alt
+    ])
+
+def perspektif_duzeltme(img, kaynak_noktalar, hedef_boyut=(500, 500), harita_onbellegi=False):
     """
     Belirtilen 4 nokta arasındaki perspektifi düzelterek yeni bir görüntü oluşturur.
     
+    Sabit kameradan gelen çok sayıda karede aynı noktalar kullanılıyorsa
+    harita_onbellegi=True ile koordinat haritaları bir kez hesaplanıp
+    hafta3.remap_onbellegi'nde saklanır; sonuç cv2.warpPerspective ile aynıdır
+    (nadir piksellerde en fazla ±1 fark olabilir).
+    
     Args:
         img (numpy.ndarray): İşlenecek görüntü
         kaynak_noktalar (numpy.ndarray): Dönüştürülecek 4 nokta (sol üst, sağ üst, sol alt, sağ alt sırasıyla)
         hedef_boyut (tuple, optional): Çıktı görüntüsünün boyutu (genişlik, yükseklik). Varsayılan (500, 500).
+        harita_onbellegi (bool, optional): True ise önbellekteki remap haritaları kullanılır. Varsayılan False.
         
     Returns:
         numpy.ndarray: Perspektifi düzeltilmiş görüntü
@@ -22,18 +49,16 @@ def perspektif_duzeltme(img, kaynak_noktalar, hedef_boyut=(500, 500)):
         width, height = hedef_boyut
         
         # Hedef noktaları belirle (düzgün dikdörtgen)
-        hedef_noktalar = np.float32([
-            [0, 0],           # Sol üst
-            [width, 0],       # Sağ üst
-            [0, height],      # Sol alt
-            [width, height]   # Sağ alt
-        ])
+        hedef_noktalar = _hedef_noktalar(hedef_boyut)
         
         # Perspektif dönüşüm matrisini hesapla
         matrix = cv2.getPerspectiveTransform(kaynak_noktalar, hedef_noktalar)
         
         # Perspektif dönüşümünü uygula
-        duzeltilmis_goruntu = cv2.warpPerspective(img, matrix, (width, height))
+        if harita_onbellegi:
+            duzeltilmis_goruntu = hafta3.remap_uygula(img, matrix, (width, height), perspektif=True)
+        else:
+            duzeltilmis_goruntu = cv2.warpPerspective(img, matrix, (width, height))
         
         return duzeltilmis_goruntu
         
@@ -177,7 +202,7 @@ def kullanici_etkilesimli_perspektif_duzeltme(img, hedef_boyut=(500, 500), gorun
         cv2.destroyAllWindows()
         return None
 
-def manuel_perspektif_duzeltme(img, sol_ust, sag_ust, sol_alt, sag_alt, hedef_boyut=(500, 500)):
+def manuel_perspektif_duzeltme(img, sol_ust, sag_ust, sol_alt, sag_alt, hedef_boyut=(500, 500), harita_onbellegi=False):
     """
     Manuel olarak belirtilen 4 nokta arasındaki perspektifi düzeltir.
     
@@ -188,6 +213,7 @@ def manuel_perspektif_duzeltme(img, sol_ust, sag_ust, sol_alt, sag_alt, hedef_bo
         sol_alt (tuple): Sol alt köşe koordinatları (x, y)
         sag_alt (tuple): Sağ alt köşe koordinatları (x, y)
         hedef_boyut (tuple, optional): Çıktı görüntüsünün boyutu (genişlik, yükseklik). Varsayılan (500, 500).
+        harita_onbellegi (bool, optional): perspektif_duzeltme ile aynı. Varsayılan False.
         
     Returns:
         numpy.ndarray: Perspektifi düzeltilmiş görüntü
@@ -201,7 +227,7 @@ def manuel_perspektif_duzeltme(img, sol_ust, sag_ust, sol_alt, sag_alt, hedef_bo
         kaynak_noktalar = np.float32([sol_ust, sag_ust, sol_alt, sag_alt])
         
         # Perspektif düzeltme işlemini uygula
-        return perspektif_duzeltme(img, kaynak_noktalar, hedef_boyut)
+        return perspektif_duzeltme(img, kaynak_noktalar, hedef_boyut, harita_onbellegi)
         
     except Exception as e:
         print(f"Hata: Manuel perspektif düzeltme sırasında bir hata oluştu: {str(e)}")
@@ -237,6 +263,208 @@ def goruntu_ac_ve_perspektif_duzelt():
         print(f"Hata: Perspektif düzeltme işlemi sırasında bir hata oluştu: {str(e)}")
         return None
 
+def _toplu_baslat(matrisler, is_sureci=True):
+    """İş sürecini başlatır: homografileri saklar, harita önbelleğini boşaltır"""
+    global _toplu_matrisler, _toplu_haritalar
+    _toplu_matrisler = matrisler
+    _toplu_haritalar = None
+    if is_sureci:
+        # Paralellik süreçlerden gelir; OpenCV'nin iç iş parçacıkları çekirdekleri aşırı yüklemesin
+        cv2.setNumThreads(1)
+
+def _toplu_harita_al(indeks, hedef_boyut, interpolation):
+    """
+    Köşe setinin remap haritalarını döndürür. Süreç yalnızca son kullandığı köşe
+    setinin haritalarını saklar; bellek köşe seti sayısıyla büyümez.
+    """
+    global _toplu_haritalar
+    if _toplu_haritalar is None or _toplu_haritalar[0] != indeks:
+        # Önce eski haritalar bırakılır; iki set aynı anda bellekte tutulmaz
+        _toplu_haritalar = None
+        harita1, harita2 = hafta3.remap_haritalari(_toplu_matrisler[indeks], hedef_boyut,
+                                                   interpolation, perspektif=True)
+        _toplu_haritalar = (indeks, harita1, harita2)
+    return _toplu_haritalar[1], _toplu_haritalar[2]
+
+def _toplu_duzelt(is_):
+    """Tek bir dosyayı okur, köşe setinin haritalarıyla düzeltir ve kaydeder"""
+    giris_yolu, cikis_yolu, indeks, hedef_boyut, interpolation, profil = is_
+    try:
+        img = hafta1.goruntu_oku(giris_yolu, onbellek=False)
+        if img is None:
+            return giris_yolu, None, "Görüntü okunamadı"
+        
+        if max(img.shape[:2]) > 32767:
+            # CV_16SC2 koordinatları bu boyutları gösteremez
+            sonuc = cv2.warpPerspective(img, _toplu_matrisler[indeks], hedef_boyut, flags=interpolation)
+        else:
+            harita1, harita2 = _toplu_harita_al(indeks, hedef_boyut, interpolation)
+            sonuc = cv2.remap(img, harita1, harita2, interpolation, borderMode=cv2.BORDER_CONSTANT)
+        
+        veri, _ = hafta1.goruntu_kodla(sonuc, profil)
+        if veri is None:
+            return giris_yolu, None, "Görüntü kodlanamadı"
+        # Baytlar doğrudan yazılır; Türkçe karakterli yollarda da sorun çıkmaz
+        veri.tofile(cikis_yolu)
+        return giris_yolu, cikis_yolu, None
+        
+    except Exception as e:
+        return giris_yolu, None, str(e)
+
+def _toplu_grup_duzelt(isler):
+    """Aynı köşe setine ait dosyaları sırayla düzeltir; haritalar bir kez oluşturulur"""
+    return [_toplu_duzelt(is_) for is_ in isler]
+
+def _kose_noktalari(noktalar):
+    """Köşe listesini (4, 2) boyutlu float32 diziye çevirir"""
+    noktalar = np.float32(noktalar)
+    if noktalar.size != 8:
+        raise ValueError("4 köşe noktası (x, y) gerekli")
+    return noktalar.reshape(4, 2)
+
+def toplu_perspektif_duzeltme(klasor, cikis_klasoru, kaynak_noktalar=None, kose_dosyasi=None,
+                              hedef_boyut=(500, 500), interpolation=cv2.INTER_LINEAR,
+                              profil="png_hizli", surec_sayisi=None):
+    """
+    Klasördeki tüm görüntülere perspektif düzeltme uygular ve sonuçları çıkış klasörüne yazar.
+    
+    Köşeler tüm dosyalar için tek bir set (kaynak_noktalar) veya dosya adı -> 4 köşe
+    eşlemesi içeren bir JSON dosyası (kose_dosyasi) ile verilir; JSON'da bulunmayan
+    dosyalarda kaynak_noktalar kullanılır. Birbirinden farklı her köşe seti için
+    homografi bir kez hesaplanır ve iş süreçlerine başlangıçta gönderilir. Dosyalar
+    köşe setine göre gruplanıp parçalar halinde süreç havuzuna verilir; her süreç
+    remap haritalarını ilk ihtiyaçta kendisi oluşturur ve yalnızca son kullandığı
+    köşe setininkini saklar. Böylece süreç başına bellek köşe seti sayısından
+    bağımsız kalır ve aynı biçimdeki form taramaları gibi yığınlar gözetimsiz ve
+    çekirdek sayısıyla orantılı hızda işlenir.
+    
+    Çıkış dosyası giriş dosyasının adını ve kaydetme profilinin uzantısını alır.
+    Aynı adlı farklı uzantılı girişlerde (a.jpg, a.png) kaynak uzantısı ada eklenir
+    (a_jpg.png, a_png.png); yine de çakışan girişler işlenmeden hatalar'a yazılır.
+    
+    Windows'ta süreç havuzu kullanıldığı için çağıran betiğin
+    if __name__ == "__main__": bloğu içinde çalışması gerekir.
+    
+    Args:
+        klasor (str): Görüntülerin bulunduğu klasör
+        cikis_klasoru (str): Düzeltilmiş görüntülerin yazılacağı klasör (yoksa oluşturulur)
+        kaynak_noktalar (list, optional): 4 köşe (sol üst, sağ üst, sol alt, sağ alt). Varsayılan None.
+        kose_dosyasi (str, optional): {"dosya_adi": [[x, y], [x, y], [x, y], [x, y]], ...}
+                                      biçiminde JSON dosyası. Varsayılan None.
+        hedef_boyut (tuple, optional): Çıktı görüntüsünün boyutu (genişlik, yükseklik). Varsayılan (500, 500).
+        interpolation (int, optional): İnterpolasyon yöntemi. Varsayılan cv2.INTER_LINEAR.
+        profil (str, optional): hafta1.KAYIT_PROFILLERI içindeki kaydetme profili. Varsayılan "png_hizli".
+        surec_sayisi (int, optional): İş süreci sayısı. None ise çekirdek sayısı; 1 ise
+                                      havuz kurulmadan bu süreçte çalışılır. Varsayılan None.
+        
+    Returns:
+        dict: yazilan (çıkış yolları), hatalar (dosya -> hata mesajı), homografi_sayisi ve sure (sn);
+              hata durumunda None
+    """
+    try:
+        baslangic = time.perf_counter()
+        hedef_boyut = tuple(int(v) for v in hedef_boyut)
+        
+        # Köşe setlerini hazırla
+        varsayilan = _kose_noktalari(kaynak_noktalar) if kaynak_noktalar is not None else None
+        dosya_koseleri = {}
+        if kose_dosyasi is not None:
+            with open(kose_dosyasi, "r", encoding="utf-8") as dosya:
+                dosya_koseleri = {ad: _kose_noktalari(n) for ad, n in json.load(dosya).items()}
+        if varsayilan is None and not dosya_koseleri:
+            print("Hata: Köşe noktaları (kaynak_noktalar veya kose_dosyasi) verilmedi!")
+            return None
+        
+        dosyalar = hafta1.klasordeki_goruntuler(klasor)
+        if not dosyalar:
+            print(f"Hata: Klasörde görüntü bulunamadı! ({klasor})")
+            return None
+        os.makedirs(cikis_klasoru, exist_ok=True)
+        uzanti = hafta1.KAYIT_PROFILLERI[profil][0]
+        
+        # Her farklı köşe seti için homografi yalnızca bir kez hesaplanır
+        hedef_noktalar = _hedef_noktalar(hedef_boyut)
+        indeksler = {}
+        matrisler = []
+        isler = []
+        hatalar = {}
+        
+        # Aynı gövdeli dosyalar (a.jpg, a.png) aynı çıkış adına düşmesin diye kaynak
+        # uzantısı gövdeye eklenir (a_jpg.png, a_png.png). Büyük/küçük harf duyarsız
+        # dosya sistemleri için karşılaştırma küçük harfle yapılır.
+        govdeler = {}
+        for yol in dosyalar:
+            govde = os.path.splitext(os.path.basename(yol))[0].lower()
+            govdeler[govde] = govdeler.get(govde, 0) + 1
+        kullanilan = set()
+        
+        for yol in dosyalar:
+            ad = os.path.basename(yol)
+            noktalar = dosya_koseleri.get(ad, varsayilan)
+            if noktalar is None:
+                hatalar[yol] = "Köşe noktaları bulunamadı"
+                continue
+            
+            anahtar = noktalar.tobytes()
+            if anahtar not in indeksler:
+                indeksler[anahtar] = len(matrisler)
+                matrisler.append(cv2.getPerspectiveTransform(noktalar, hedef_noktalar))
+            
+            govde, kaynak_uzanti = os.path.splitext(ad)
+            if govdeler[govde.lower()] > 1:
+                govde = f"{govde}_{kaynak_uzanti.lstrip('.')}"
+            cikis_yolu = os.path.join(cikis_klasoru, govde + uzanti)
+            if cikis_yolu.lower() in kullanilan:
+                hatalar[yol] = f"Çıkış dosyası başka bir girişle çakışıyor: {cikis_yolu}"
+                continue
+            kullanilan.add(cikis_yolu.lower())
+            
+            isler.append((yol, cikis_yolu, indeksler[anahtar], hedef_boyut, interpolation, profil))
+        
+        # Dosyaları süreç havuzunda düzelt
+        surec_sayisi = min(surec_sayisi or os.cpu_count() or 1, max(1, len(isler)))
+        if surec_sayisi == 1:
+            try:
+                _toplu_baslat(matrisler, is_sureci=False)
+                sonuclar = [_toplu_duzelt(is_) for is_ in isler]
+            finally:
+                # Haritalar fonksiyon döndükten sonra modülde tutulmasın
+                _toplu_baslat(None, is_sureci=False)
+        else:
+            # Her görev tek köşe setinin dosyalarından oluşur; büyük gruplar süreçlere
+            # dağılabilsin diye parçalara bölünür
+            gruplar = {}
+            for is_ in isler:
+                gruplar.setdefault(is_[2], []).append(is_)
+            parca = max(1, len(isler) // (surec_sayisi * 4))
+            gorevler = [grup[i:i + parca] for grup in gruplar.values() for i in range(0, len(grup), parca)]
+            
+            with ProcessPoolExecutor(max_workers=surec_sayisi, initializer=_toplu_baslat,
+                                     initargs=(matrisler,)) as havuz:
+                sonuclar = [sonuc for gorev in havuz.map(_toplu_grup_duzelt, gorevler) for sonuc in gorev]
+            
+            # Sonuçları giriş sırasına döndür
+            sira = {is_[0]: i for i, is_ in enumerate(isler)}
+            sonuclar.sort(key=lambda sonuc: sira[sonuc[0]])
+        
+        yazilan = []
+        for giris_yolu, cikis_yolu, hata in sonuclar:
+            if hata is None:
+                yazilan.append(cikis_yolu)
+            else:
+                hatalar[giris_yolu] = hata
+        
+        return {
+            "yazilan": yazilan,
+            "hatalar": hatalar,
+            "homografi_sayisi": len(matrisler),
+            "sure": time.perf_counter() - baslangic,
+        }
+        
+    except Exception as e:
+        print(f"Hata: Toplu perspektif düzeltme sırasında bir hata oluştu: {str(e)}")
+        return None
+
 def goruntu_goster(img, baslik="Görüntü", bekle=True):
     """
     Görüntüyü ekranda gösterir
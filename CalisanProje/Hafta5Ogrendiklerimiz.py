@@ -1,6 +1,7 @@
 import cv2
 import numpy as np
 import matplotlib.pyplot as plt
+import Hafta1Ogrendiklerimiz as hafta1
 
 def ortalama_filtre(img, kernel_size=5):
     """
@@ -18,6 +19,8 @@ def ortalama_filtre(img, kernel_size=5):
         return None
     
     try:
+        img = hafta1.goruntu_al(img)
+        
         # Tek sayı kontrolü
         if kernel_size % 2 == 0:
             kernel_size += 1
@@ -48,6 +51,8 @@ def ortalama_filtre_manuel(img, kernel_size=3):
         return None
     
     try:
+        img = hafta1.goruntu_al(img)
+        
         # Tek sayı kontrolü
         if kernel_size % 2 == 0:
             kernel_size += 1
@@ -100,6 +105,8 @@ def medyan_filtre(img, kernel_size=5):
         return None
     
     try:
+        img = hafta1.goruntu_al(img)
+        
         # Tek sayı kontrolü
         if kernel_size % 2 == 0:
             kernel_size += 1
@@ -130,6 +137,8 @@ def medyan_filtre_manuel(img, kernel_size=3):
         return None
     
     try:
+        img = hafta1.goruntu_al(img)
+        
         # Tek sayı kontrolü
         if kernel_size % 2 == 0:
             kernel_size += 1
@@ -183,6 +192,8 @@ def gauss_filtre(img, kernel_size=5, sigma=1.0):
         return None
     
     try:
+        img = hafta1.goruntu_al(img)
+        
         # Tek sayı kontrolü
         if kernel_size % 2 == 0:
             kernel_size += 1
@@ -213,6 +224,8 @@ def gauss_filtre_manuel(img, kernel_size=5, sigma=1.0):
         return None
     
     try:
+        img = hafta1.goruntu_al(img)
+        
         # Tek sayı kontrolü
         if kernel_size % 2 == 0:
             kernel_size += 1
@@ -262,6 +275,8 @@ def konservatif_filtre(img):
         return None
     
     try:
+        img = hafta1.goruntu_al(img)
+        
         # Sonuç görüntüsü için kopya oluştur
         filtered_img = img.copy()
         
@@ -323,10 +338,7 @@ def crimmins_speckle_filtre(img, iterations=1):
     
     try:
         # Renkli görüntüyü gri tonlamaya çevir
-        if len(img.shape) == 3:
-            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-        else:
-            gray = img.copy()
+        gray = hafta1.gri_al(img)
         
         # Sonuç görüntüsü
         result = gray.copy()
@@ -374,10 +386,7 @@ def fft_goruntu(img):
     
     try:
         # Görüntü gri tonlamalı değilse, gri tonlamaya çevir
-        if len(img.shape) > 2:
-            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-        else:
-            gray = img.copy()
+        gray = hafta1.gri_al(img)
         
         # Fourier dönüşümü uygula
         f_transform = np.fft.fft2(gray)
@@ -406,10 +415,7 @@ def goruntu_fft_goster(img, baslik="Fourier Dönüşümü"):
     
     try:
         # Görüntü gri tonlamalı değilse, gri tonlamaya çevir
-        if len(img.shape) > 2:
-            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-        else:
-            gray = img.copy()
+        gray = hafta1.gri_al(img)
         
         # Fourier dönüşümünü al
         _, magnitude_spectrum = fft_goruntu(gray)
@@ -451,10 +457,7 @@ def alcak_geciren_filtre(img, kesme_frekansi=30):
     
     try:
         # Görüntü gri tonlamalı değilse, gri tonlamaya çevir
-        if len(img.shape) > 2:
-            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-        else:
-            gray = img.copy()
+        gray = hafta1.gri_al(img)
         
         # Görüntü boyutları
         rows, cols = gray.shape
@@ -500,10 +503,7 @@ def yuksek_geciren_filtre(img, kesme_frekansi=30):
     
     try:
         # Görüntü gri tonlamalı değilse, gri tonlamaya çevir
-        if len(img.shape) > 2:
-            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-        else:
-            gray = img.copy()
+        gray = hafta1.gri_al(img)
         
         # Görüntü boyutları
         rows, cols = gray.shape
@@ -550,10 +550,7 @@ def butterworth_alcak_geciren_filtre(img, kesme_frekansi=30, derece=2):
     
     try:
         # Görüntü gri tonlamalı değilse, gri tonlamaya çevir
-        if len(img.shape) > 2:
-            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-        else:
-            gray = img.copy()
+        gray = hafta1.gri_al(img)
         
         # Görüntü boyutları
         rows, cols = gray.shape
@@ -605,10 +602,7 @@ def butterworth_yuksek_geciren_filtre(img, kesme_frekansi=30, derece=2):
     
     try:
         # Görüntü gri tonlamalı değilse, gri tonlamaya çevir
-        if len(img.shape) > 2:
-            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-        else:
-            gray = img.copy()
+        gray = hafta1.gri_al(img)
         
         # Görüntü boyutları
         rows, cols = gray.shape
@@ -664,10 +658,7 @@ def band_geciren_filtre(img, ic_yaricap=30, dis_yaricap=50):
     
     try:
         # Görüntü gri tonlamalı değilse, gri tonlamaya çevir
-        if len(img.shape) > 2:
-            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-        else:
-            gray = img.copy()
+        gray = hafta1.gri_al(img)
         
         # Görüntü boyutları
         rows, cols = gray.shape
@@ -722,10 +713,7 @@ def band_durduran_filtre(img, ic_yaricap=30, dis_yaricap=50):
     
     try:
         # Görüntü gri tonlamalı değilse, gri tonlamaya çevir
-        if len(img.shape) > 2:
-            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-        else:
-            gray = img.copy()
+        gray = hafta1.gri_al(img)
         
         # Görüntü boyutları
         rows, cols = gray.shape
@@ -781,10 +769,7 @@ def butterworth_band_geciren_filtre(img, ic_yaricap=30, dis_yaricap=50, derece=2
     
     try:
         # Görüntü gri tonlamalı değilse, gri tonlamaya çevir
-        if len(img.shape) > 2:
-            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-        else:
-            gray = img.copy()
+        gray = hafta1.gri_al(img)
         
         # Görüntü boyutları
         rows, cols = gray.shape
@@ -847,10 +832,7 @@ def butterworth_band_durduran_filtre(img, ic_yaricap=30, dis_yaricap=50, derece=
     
     try:
         # Görüntü gri tonlamalı değilse, gri tonlamaya çevir
-        if len(img.shape) > 2:
-            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-        else:
-            gray = img.copy()
+        gray = hafta1.gri_al(img)
         
         # Görüntü boyutları
         rows, cols = gray.shape
@@ -919,10 +901,7 @@ def gaussian_alcak_geciren_filtre(img, kesme_frekansi=30):
     
     try:
         # Görüntü gri tonlamalı değilse, gri tonlamaya çevir
-        if len(img.shape) > 2:
-            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-        else:
-            gray = img.copy()
+        gray = hafta1.gri_al(img)
         
         # Görüntü boyutları
         rows, cols = gray.shape
@@ -974,10 +953,7 @@ def gaussian_yuksek_geciren_filtre(img, kesme_frekansi=30):
     
     try:
         # Görüntü gri tonlamalı değilse, gri tonlamaya çevir
-        if len(img.shape) > 2:
-            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-        else:
-            gray = img.copy()
+        gray = hafta1.gri_al(img)
         
         # Görüntü boyutları
         rows, cols = gray.shape
@@ -1032,10 +1008,7 @@ def homomorfik_filtre(img, d0=30, h_l=0.5, h_h=2.0, c=1):
     
     try:
         # Görüntü gri tonlamalı değilse, gri tonlamaya çevir
-        if len(img.shape) > 2:
-            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-        else:
-            gray = img.copy()
+        gray = hafta1.gri_al(img)
         
         # Logaritmik dönüşüm (görüntü piksel değerleri > 0 olmalı)
         # Logaritma, çarpma işlemlerini toplama işlemlerine dönüştürür
@@ -1096,6 +1069,9 @@ def iki_goruntu_karsilastir(img1, img2, baslik1="Orijinal", baslik2="Filtrelenmi
         return
     
     try:
+        img1 = hafta1.goruntu_al(img1)
+        img2 = hafta1.goruntu_al(img2)
+        
         plt.figure(figsize=(10, 5))
         
         # BGR to RGB dönüşümü (gerekirse)
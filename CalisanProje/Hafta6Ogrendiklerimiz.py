@@ -1,6 +1,7 @@
 import cv2
 import numpy as np
 import matplotlib.pyplot as plt
+import Hafta1Ogrendiklerimiz as hafta1
 
 '''
 Kenar Bulma Algoritmaları - 6. Hafta
@@ -32,10 +33,7 @@ def sobel_kenar_bulma(img, ksize=3, normalize=True):
     
     try:
         # Görüntü gri tonlamalı değilse, gri tonlamaya çevir
-        if len(img.shape) > 2:
-            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-        else:
-            gray = img.copy()
+        gray = hafta1.gri_al(img)
         
         # X ve Y yönündeki gradyanları hesapla
         sobel_x = cv2.Sobel(gray, cv2.CV_64F, 1, 0, ksize=ksize)
@@ -75,10 +73,7 @@ def prewitt_kenar_bulma(img, normalize=True):
     
     try:
         # Görüntü gri tonlamalı değilse, gri tonlamaya çevir
-        if len(img.shape) > 2:
-            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-        else:
-            gray = img.copy()
+        gray = hafta1.gri_al(img)
         
         # Prewitt filtre çekirdeklerini tanımla
         kernel_x = np.array([[-1, 0, 1], [-1, 0, 1], [-1, 0, 1]])
@@ -122,10 +117,7 @@ def roberts_cross_kenar_bulma(img, normalize=True):
     
     try:
         # Görüntü gri tonlamalı değilse, gri tonlamaya çevir
-        if len(img.shape) > 2:
-            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-        else:
-            gray = img.copy()
+        gray = hafta1.gri_al(img)
         
         # Roberts Cross filtre çekirdeklerini tanımla
         kernel_x = np.array([[1, 0], [0, -1]], dtype=np.float32)
@@ -169,10 +161,7 @@ def compass_kenar_bulma(img, normalize=True):
     
     try:
         # Görüntü gri tonlamalı değilse, gri tonlamaya çevir
-        if len(img.shape) > 2:
-            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-        else:
-            gray = img.copy()
+        gray = hafta1.gri_al(img)
         
         # Compass (Pusula) filtre çekirdeklerini tanımla
         compass_kernels = [
@@ -229,10 +218,7 @@ def canny_kenar_bulma(img, alt_esik=50, ust_esik=150, aperture_size=3):
     
     try:
         # Görüntü gri tonlamalı değilse, gri tonlamaya çevir
-        if len(img.shape) > 2:
-            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-        else:
-            gray = img.copy()
+        gray = hafta1.gri_al(img)
         
         # Canny kenar algılama algoritmasını uygula
         canny_edges = cv2.Canny(gray, alt_esik, ust_esik, apertureSize=aperture_size)
@@ -258,6 +244,8 @@ def goruntu_goster(img, title="Görüntü", cmap=None):
         return
     
     try:
+        img = hafta1.goruntu_al(img)
+        
         # BGR to RGB dönüşümü (gerekirse)
         if len(img.shape) == 3 and cmap is None:
             img_show = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
@@ -289,10 +277,7 @@ def kenar_karsilastir(img, algoritma='hepsi'):
     
     try:
         # Görüntü gri tonlamalı değilse, gri tonlamaya çevir
-        if len(img.shape) > 2:
-            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-        else:
-            gray = img.copy()
+        gray = hafta1.gri_al(img)
         
         if algoritma.lower() == 'sobel' or algoritma.lower() == 'hepsi':
             # Sobel kenar bulma
@@ -393,10 +378,7 @@ def laplace_kenar_bulma(img, ksize=3, normalize=True):
     
     try:
         # Görüntü gri tonlamalı değilse, gri tonlamaya çevir
-        if len(img.shape) > 2:
-            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-        else:
-            gray = img.copy()
+        gray = hafta1.gri_al(img)
         
         # Laplace filtresini uygula
         laplacian = cv2.Laplacian(gray, cv2.CV_64F, ksize=ksize)
@@ -437,10 +419,7 @@ def gabor_filtre(img, kernel_size=21, sigma=5, theta=np.pi/4, lambd=10, gamma=0.
     
     try:
         # Görüntü gri tonlamalı değilse, gri tonlamaya çevir
-        if len(img.shape) > 2:
-            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-        else:
-            gray = img.copy()
+        gray = hafta1.gri_al(img)
         
         # Gabor çekirdeğini oluştur
         gabor_kernel = cv2.getGaborKernel(
@@ -485,14 +464,14 @@ def hough_dogru_bulma(img, rho=1, theta=np.pi/180, esik=150, min_cizgi_uzunlugu=
         return None, None, None
     
     try:
-        # Görüntüyü kopyala
-        output = img.copy()
-        
         # Görüntü gri tonlamalı değilse, gri tonlamaya çevir
+        gray = hafta1.gri_al(img)
+        img = hafta1.goruntu_al(img)
+        
         if len(img.shape) > 2:
-            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+            # Görüntüyü kopyala
+            output = img.copy()
         else:
-            gray = img.copy()
             # Renkli bir görüntüye dönüştür (çizgileri renkli göstermek için)
             output = cv2.cvtColor(gray, cv2.COLOR_GRAY2BGR)
         
@@ -553,14 +532,14 @@ def hough_cember_bulma(img, dp=1.0, min_dist=30, param1=50, param2=30, min_radiu
         return None, None
     
     try:
-        # Görüntüyü kopyala
-        output = img.copy()
-        
         # Görüntü gri tonlamalı değilse, gri tonlamaya çevir
+        gray = hafta1.gri_al(img)
+        img = hafta1.goruntu_al(img)
+        
         if len(img.shape) > 2:
-            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+            # Görüntüyü kopyala
+            output = img.copy()
         else:
-            gray = img.copy()
             # Renkli bir görüntüye dönüştür (çemberleri renkli göstermek için)
             output = cv2.cvtColor(gray, cv2.COLOR_GRAY2BGR)
         
@@ -602,6 +581,8 @@ def kmeans_segmentation(img, k=3, attempts=10):
         return None, None, None
     
     try:
+        img = hafta1.goruntu_al(img)
+        
         # OpenCV BGR formatındaysa RGB'ye dönüştür
         if len(img.shape) == 3:
             image_rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
@@ -650,11 +631,13 @@ def gelismis_kenar_karsilastir(img, algoritma='hepsi'):
     
     try:
         # Görüntü gri tonlamalı değilse, gri tonlamaya çevir
+        gray = hafta1.gri_al(img)
+        img = hafta1.goruntu_al(img)
+        
+        # Görüntü yalnızca okunduğu için renkli görüntü kopyalanmaz
         if len(img.shape) > 2:
-            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-            color_img = img.copy()
+            color_img = img
         else:
-            gray = img.copy()
             color_img = cv2.cvtColor(gray, cv2.COLOR_GRAY2BGR)
         
         if algoritma.lower() == 'laplace' or algoritma.lower() == 'hepsi':
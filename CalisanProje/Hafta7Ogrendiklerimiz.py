@@ -1,6 +1,7 @@
 import cv2
 import numpy as np
 import matplotlib.pyplot as plt
+import Hafta1Ogrendiklerimiz as hafta1
 
 '''
 Morfolojik İşlemler - 7. Hafta
@@ -30,15 +31,16 @@ def erode_islem(img, kernel_size=3, kernel_shape="kare", iterations=1):
         return None
     
     try:
+        img = hafta1.goruntu_al(img)
+        
         # Görüntüyü işlem için uygun formata getir
         if len(img.shape) > 2:
             # Renkli görüntüyse, her kanal için ayrı işlem yap
             # Bunun için görüntüyü BGR kanallarına ayır ve her kanalı ayrı işle
             b, g, r = cv2.split(img)
-            processed_image = img.copy()
         else:
-            # Gri tonlamalı görüntü ise doğrudan işle
-            processed_image = img.copy()
+            # Gri tonlamalı görüntü ise doğrudan işle (girdi değiştirilmediği için kopyalanmaz)
+            processed_image = img
             b, g, r = None, None, None
         
         # Yapısal elemanı oluştur
@@ -90,14 +92,15 @@ def dilate_islem(img, kernel_size=3, kernel_shape="kare", iterations=1):
         return None
     
     try:
+        img = hafta1.goruntu_al(img)
+        
         # Görüntüyü işlem için uygun formata getir
         if len(img.shape) > 2:
             # Renkli görüntüyse, her kanal için ayrı işlem yap
             b, g, r = cv2.split(img)
-            processed_image = img.copy()
         else:
-            # Gri tonlamalı görüntü ise doğrudan işle
-            processed_image = img.copy()
+            # Gri tonlamalı görüntü ise doğrudan işle (girdi değiştirilmediği için kopyalanmaz)
+            processed_image = img
             b, g, r = None, None, None
         
         # Yapısal elemanı oluştur
@@ -149,6 +152,8 @@ def opening_islem(img, kernel_size=3, kernel_shape="kare"):
         return None
     
     try:
+        img = hafta1.goruntu_al(img)
+        
         # Yapısal elemanı oluştur
         if kernel_shape.lower() == "kare":
             kernel = np.ones((kernel_size, kernel_size), np.uint8)
@@ -190,6 +195,8 @@ def closing_islem(img, kernel_size=3, kernel_shape="kare"):
         return None
     
     try:
+        img = hafta1.goruntu_al(img)
+        
         # Yapısal elemanı oluştur
         if kernel_shape.lower() == "kare":
             kernel = np.ones((kernel_size, kernel_size), np.uint8)
@@ -228,6 +235,9 @@ def goruntu_karsilastir(img_original, img_processed, baslik1="Orijinal", baslik2
         return
     
     try:
+        img_original = hafta1.goruntu_al(img_original)
+        img_processed = hafta1.goruntu_al(img_processed)
+        
         # BGR to RGB dönüşümü (gerekirse)
         if len(img_original.shape) == 3 and cmap is None:
             img1_show = cv2.cvtColor(img_original, cv2.COLOR_BGR2RGB)
@@ -314,11 +324,13 @@ def morfolojik_islev_karsilastir(img, kernel_size=3, kernel_shape="kare"):
         return
     
     try:
+        img = hafta1.goruntu_al(img)
+        
         # Görüntü gri tonlamalı değilse, gri tonlamaya çevir
         if len(img.shape) > 2:
             gray = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
         else:
-            gray = img.copy()
+            gray = img
         
         # Tüm işlemleri uygula
         eroded_img = erode_islem(gray, kernel_size, kernel_shape)